@@ -10,4 +10,17 @@ import world
 import consumables
 import discord_interface_game
 import biome
+import terrain
+import world_cache
+import map_overview
+import name_index
+import enemy_swarm
+import timer_wheel
+import enemy_templates
+import population
+import region_simulation
+import enemy_pool
+import rng_streams
+import stats
+import player_registry
 
@@ -1,22 +1,26 @@
 """
 This module contains the biome class.
+Biomes are frozen so that one instance can be shared by every cell of a map.
 """
 
+from dataclasses import dataclass
+
+@dataclass(frozen=True, slots=True)
 class Biome():
     """
     This class represents a biome.
     """
 
-    def __init__(self, name, icon = '⬛', dsecription= '', index = 0):
-        self.name = name
-        self.icon = icon
-        self.description = dsecription
-        self.index = index
+    name: str
+    icon: str = '⬛'
+    description: str = ''
+    index: int = 0
 
 class Meadows(Biome):
     """
     This class represents the meadows biome.
     """
+    __slots__ = ()
 
     def __init__(self):
         super().__init__("Meadows", "🌾", "A gentle, rolling meadow.", 1)
@@ -24,6 +28,7 @@ class Forest(Biome):
     """
     This class represents the forest biome.
     """
+    __slots__ = ()
 
     def __init__(self):
         super().__init__("Forest", "🌲", "A dense forest of trees.", 2)
@@ -32,6 +37,7 @@ class Desert(Biome):
     """
     This class represents the desert biome.
     """
+    __slots__ = ()
 
     def __init__(self):
         super().__init__("Desert", "🟨", "A parched sea of sand.", 3)
@@ -40,6 +46,7 @@ class Mountain(Biome):
     """
     This class represents the mountain biome.
     """
+    __slots__ = ()
 
     def __init__(self):
         super().__init__("Mountain", "⛰️ ", "A towering mountain range.", 4)
@@ -48,6 +55,16 @@ class Ocean(Biome):
     """
     This class represents the ocean biome.
     """
+    __slots__ = ()
 
     def __init__(self):
         super().__init__("Ocean", "🌊", "A vast, open ocean.", 5)
+
+# Shared instances used by every map, in perlin quantization order
+WORLD_BIOMES = (
+    Desert(),
+    Meadows(),
+    Ocean(),
+    Forest(),
+    Mountain()
+)
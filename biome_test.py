@@ -2,6 +2,8 @@
 This module contains the biome testing logic.
 """
 
+import dataclasses
+
 import biome
 
 def test_biome_initmeadows_hasname():
@@ -42,3 +44,21 @@ def test_biome_initmeadows_hasicon():
 
     # Assert
     assert biome_icon == '🌾'
+
+def test_biome_is_frozen():
+    """
+    Test if biomes cannot be changed, so they can be shared between cells.
+    """
+    # Arrange
+    test_biome = biome.Meadows()
+
+    # Act
+    try:
+        test_biome.icon = '🧪'
+        changed = True
+    except dataclasses.FrozenInstanceError:
+        changed = False
+
+    # Assert
+    assert changed is False
+    assert test_biome.icon == '🌾'
@@ -5,6 +5,8 @@ Players and Enemies are both characters.
 """
 
 from location import LocationContent
+from name_index import NameIndex
+from stats import StatBlock
 
 class Character(LocationContent):
     """
@@ -16,7 +18,12 @@ class Character(LocationContent):
         icon (str): The icon of the character.
         health (int): The health points of the character.
         attack_power (int): The attack power of the character.
+        stats (StatBlock): The base attack and defense, with gear and status effects on top.
     """
+    __slots__ = (
+        'game', 'max_health', 'health', 'stats', 'gear', 'consumables',
+        'consumable_index', 'status_effects', 'position'
+    )
 
     def __init__(self, game, name, description, health, attack_power):
         """
@@ -35,10 +42,12 @@ class Character(LocationContent):
         self.game = game
         self.max_health = health
         self.health = health
-        self.base_attack = attack_power
+        self.stats = StatBlock(attack=attack_power, defense=0)
 
         self.gear = []
         self.consumables = []
+        # Created on the first consumable, most characters never carry any
+        self.consumable_index = None
         
         self.status_effects = []
         
@@ -52,12 +61,8 @@ class Character(LocationContent):
         target_name = target_name.lower()
         attack_msg = ''
         # is the target in our location? if so, attack it
-        location = self.game.map.map_location_data[self.position[0]][self.position[1]]
-        target_of_attack = None
-        for content in location.contents:
-            if target_name in content.name.lower():
-                target_of_attack = content
-                break
+        location = self.game.map.get_location(self.position)
+        target_of_attack = location.find_content(target_name, kinds=('enemy',))
         if target_of_attack is None:
             return f'No enemy named {target_name} found here'
 
@@ -72,15 +77,58 @@ class Character(LocationContent):
 
         return attack_msg
 
+    @property
+    def base_attack(self):
+        """
+        The attack of the character before gear and status effects.
+        """
+        return self.stats.base['attack']
+
+    @base_attack.setter
+    def base_attack(self, attack_power):
+        self.stats.set_base('attack', attack_power)
+
+    def expire_status_effects(self):
+        """
+        Take off the status effects that have worn off by the game's current tick.
+        """
+        if self.stats.next_expiry is not None:
+            for effect_name in self.stats.expire(self.game.tick_count):
+                self.status_effects.remove(effect_name)
+
+    def get_stat(self, stat):
+        """
+        Get the total of a stat, after taking off status effects that have worn off.
+        Reads the cached totals directly, since map icons rate every enemy placed by its attack.
+        """
+        stats = self.stats
+        if stats.next_expiry is not None:
+            self.expire_status_effects()
+        totals = stats.totals
+        if totals is None:
+            totals = stats.build_totals()
+        return totals.get(stat, 0)
+
     def get_attack_damage(self):
         """
         Get the attack damage of the player.
         """
-        base_attack = self.base_attack
-        gear_attack = sum([gear.offense for gear in self.gear])
-        
-        total_attack = base_attack + gear_attack
-        return total_attack
+        return self.get_stat('attack')
+
+    def get_defense(self):
+        """
+        Get the defense of the character, from gear and status effects.
+        """
+        return self.get_stat('defense')
+
+    def add_status_effect(self, effect_name, stat_changes, duration):
+        """
+        Add a status effect that changes stats for a number of ticks.
+        Adding an effect the character already has restarts it.
+        """
+        if effect_name not in self.status_effects:
+            self.status_effects.append(effect_name)
+        self.stats.add_modifier(effect_name, stat_changes, self.game.tick_count + duration)
 
     def is_alive(self):
         """
@@ -93,8 +141,10 @@ class Character(LocationContent):
     
     def receive_damage(self, damage):
         """
-        Receive damage from a source by an amount.
+        Receive damage from a source by an amount, less what defense mitigates.
         """
+        self.expire_status_effects()
+        damage = self.stats.mitigate(damage)
         self.health -= damage
         if self.health <= 0:
             self.health = 0
@@ -106,6 +156,9 @@ class Character(LocationContent):
         Acquire a consumable.
         """
         self.consumables.append(consumable)
+        if self.consumable_index is None:
+            self.consumable_index = NameIndex()
+        self.consumable_index.add(consumable)
         noun_participle = 'an' if consumable.name[0].lower() in 'aeiou' else 'a'
         return f'You acquire {noun_participle} {consumable.name}'
 
@@ -114,17 +167,20 @@ class Character(LocationContent):
         Use a consumable by name.
         """
         consumable_to_use = None
-        #print(f'Checking {consumable_name} against {self.consumables}')
-        for consumable in self.consumables:
-            #print(f'Checking {consumable.name} against {consumable_name}')
-            if consumable_name.lower() in consumable.name.lower():
-                consumable_to_use = consumable
-                break
+        if self.consumable_index is not None:
+            consumable_to_use = self.consumable_index.find(consumable_name)
         if consumable_to_use is None:
             return f'No consumable named {consumable_name} found in your inventory'
         # Consumable will remove itself after charges are consumed
         return consumable_to_use.use(self)
 
+    def remove_consumable(self, consumable):
+        """
+        Remove a consumable from the inventory.
+        """
+        self.consumables.remove(consumable)
+        self.consumable_index.remove(consumable)
+
     def heal(self, amount):
         """
         Heal the character by an amount.
@@ -139,7 +195,7 @@ class Character(LocationContent):
         """
         Move the player in the specified direction.
         """
-        old_location = self.game.map.map_location_data[self.position[0]][self.position[1]]
+        old_location = self.game.map.get_location(self.position)
         direction = direction.lower()
         move_msg = f'You move {direction}'
         
@@ -159,26 +215,18 @@ class Character(LocationContent):
             self.position = (self.position[0], self.position[1] + 1)
             arriving_direction = 'west'
 
-        # bounds check on map size
-        x_min, y_min = 0, 0
-        x_max, y_max = self.game.map_size
-
-        if (
-            self.position[0] < x_min or
-            self.position[0] >= x_max or
-            self.position[1] < y_min or
-            self.position[1] >= y_max
-        ):
+        # bounds check against the map's edges, if it has any
+        if not self.game.map.is_in_bounds(self.position):
             move_msg = f'You cannot move {direction}'
             self.position = initial_position
 
-
-        new_location = self.game.map.map_location_data[self.position[0]][self.position[1]]
+        new_location = self.game.map.get_location(self.position)
         if old_location != new_location:
             old_location.remove_content(self)
             old_location.send_message_to_contents(f'{self.name} moves {direction}\n')
             new_location.send_message_to_contents(f'{self.name} arrives from the {arriving_direction}\n')
             new_location.add_content(self)
             self.position = (new_location.coordinates[0], new_location.coordinates[1])
+        self.game.map.load_around(self.position)
 
         return move_msg
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""
+This module benchmarks player command dispatch.
+Run it directly to report how many commands per second go through MudGame.handle_input:
+    python command_benchmark.py [count]
+"""
+import contextlib
+import io
+import sys
+import time
+
+import game
+
+# Commands that do little work themselves, so dispatch is a visible share of the time
+BENCHMARK_COMMANDS = ('stats', 'inv', 'i', 'sta', 'use nothing', 'take nothing', 'dance', 'g')
+
+def measure_commands_per_second(command_string, count, test_game, player):
+    """
+    Get how many times per second a command string goes through handle_input.
+    """
+    start = time.perf_counter()
+    for _ in range(count):
+        test_game.handle_input(player, command_string)
+    return count / (time.perf_counter() - start)
+
+def main():
+    """
+    Print the commands per second of a mix of full, abbreviated, ambiguous and unknown commands.
+    """
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    with contextlib.redirect_stdout(io.StringIO()):
+        test_game = game.MudGame("Benchmark Game", seed=0)
+        player = test_game.add_player("Benchmarker")
+        # The first command also records the game's startup milestones
+        test_game.handle_input(player, 'stats')
+    for command_string in BENCHMARK_COMMANDS:
+        commands_per_second = measure_commands_per_second(command_string, count, test_game, player)
+        print(f'{command_string!r}: {commands_per_second:,.0f} commands per second')
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,9 @@ This module contains the consumables logic.
 
 from location import LocationContent
 
+# How many ticks the defense of a bark skin potion lasts
+BARK_SKIN_DURATION = 10
+
 class Consumable(LocationContent):
     """
     A class to represent a consumable item.
@@ -13,6 +16,8 @@ class Consumable(LocationContent):
         description (str): The description of the consumable.
         icon (str): The icon of the consumable.
     """
+    content_kind = 'consumable'
+    __slots__ = ('charges', 'max_charges')
 
     def __init__(self, name, description):
         """
@@ -39,7 +44,7 @@ class Consumable(LocationContent):
         """
         self.charges -= 1
         if self.charges <= 0:
-            character.consumables.remove(self)
+            character.remove_consumable(self)
         return f'You used {self.icon} {self.name}...... Talk to a dev.'
 
 class HealthPotion(Consumable):
@@ -52,6 +57,7 @@ class HealthPotion(Consumable):
         icon (str): The icon of the health potion.
         health_points (int): The health points that the health potion restores.
     """
+    __slots__ = ('health_points',)
 
     def __init__(self, name, description, health_points):
         """
@@ -89,6 +95,7 @@ class BarkSkinPotion(Consumable):
         icon (str): The icon of the bark skin potion.
         defense_points (int): The defense points that the bark skin potion provides.
     """
+    __slots__ = ('defense_points',)
 
     def __init__(self, name, description, defense_points):
         """
@@ -111,4 +118,5 @@ class BarkSkinPotion(Consumable):
             int: The defense points that the bark skin potion provides.
         """
         super().use(character)
+        character.add_status_effect(self.name, {'defense': self.defense_points}, BARK_SKIN_DURATION)
         return f'You used {self.icon} {self.name} and gained {self.defense_points} defense points.'
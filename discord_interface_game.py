@@ -2,10 +2,24 @@
 This module contains the DiscordBot class for handling the Discord bot functionality.
 """
 
+import functools
+
 from discord.ext import commands
 
 import game
 
+def requires_world(interface_method):
+    """
+    Answer with the game's loading message instead of running a command before the world is ready.
+    """
+    @functools.wraps(interface_method)
+    def gated_method(self, *args, **kwargs):
+        loading_msg = self.game.check_world_ready()
+        if loading_msg is not None:
+            return loading_msg
+        return interface_method(self, *args, **kwargs)
+    return gated_method
+
 # Handles Context extraction
 class DiscordBot(commands.Bot):
     """
@@ -13,7 +27,8 @@ class DiscordBot(commands.Bot):
     """
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.game = game.MudGame("JoPy")
+        # The world is built in the background so the bot can come online straight away
+        self.game = game.MudGame("JoPy", build_in_background=True)
 
     def get_player_discord_member(self, player_name):
         """
@@ -28,74 +43,103 @@ class DiscordBot(commands.Bot):
 
         return member
 
+    def get_player_name(self, author):
+        """
+        Get the name of the player behind a Discord member.
+        Players are registered by member id, so a member who changed their
+        name is renamed in the game instead of being treated as a stranger.
+        """
+        player = self.game.players.get_by_id(author.id)
+        if player is None:
+            return author.name
+        if player.name != author.name:
+            self.game.rename_player(author.id, author.name)
+        return player.name
+
     def joingame(self, context : commands.Context):
         """
         Join the game with the given context.
         """
         joining_player = context.author.name
-        self.game.add_player(joining_player)
+        self.game.add_player(joining_player, context.author.id)
 
+    @requires_world
     def show_player_surroundings(self, context : commands.Context):
         """
         Show the surroundings of the player with the given context.
         """
-        return self.game.show_player_surroundings(context.author.name)
+        return self.game.show_player_surroundings(self.get_player_name(context.author))
 
+    @requires_world
+    def show_overview(self, context : commands.Context):
+        """
+        Show an overview of the whole world to the player with the given context.
+        """
+        player = self.game.players.get_by_id(context.author.id)
+        return self.game.get_overview(center=player.position if player is not None else None)
+
+    @requires_world
     def move_player(self, context : commands.Context, direction):
         """
         Move the player with the given context in the specified direction.
         """
-        return self.game.move_player(context.author.name, direction)
+        return self.game.move_player(self.get_player_name(context.author), direction)
 
+    @requires_world
     def interface_attack_enemy(self, context : commands.Context, target_name):
         """
         Attack the enemy with the given context and target name.
         """
-        return self.game.attack_enemy(context.author.name, target_name)
+        return self.game.attack_enemy(self.get_player_name(context.author), target_name)
     
+    @requires_world
     def interface_attack_enemy_reaction(self, reaction, target_name):
         """
         Attack the enemy with the given reaction and target name.
         """
-        return self.game.attack_enemy(reaction.message.author.name, target_name)
+        return self.game.attack_enemy(self.get_player_name(reaction.message.author), target_name)
 
+    @requires_world
     def show_player_stats(self, context : commands.Context):
         """
         Show the stats of the player with the given context.
         """
-        player_name = context.author.name
+        player_name = self.get_player_name(context.author)
         return self.game.show_player_stats(player_name)
 
+    @requires_world
     def show_player_inventory(self, context : commands.Context):
         """
         Show the inventory of the player with the given context.
         """
-        player_name = context.author.name
+        player_name = self.get_player_name(context.author)
         return self.game.show_player_inventory(player_name)
 
+    @requires_world
     def take_item(self, context : commands.Context, item_name):
         """
         Take the item with the given name using the player with the given context.
         """
-        player_name = context.author.name
+        player_name = self.get_player_name(context.author)
         return self.game.take_item(player_name, item_name)
 
+    @requires_world
     def use_consumable(self, context : commands.Context, consumable_name):
         """
         Use the consumable with the given name using the player with the given context.
         """
-        player_name = context.author.name
+        player_name = self.get_player_name(context.author)
         return self.game.use_consumable(player_name, consumable_name)
 
+    @requires_world
     def test_cheats(self, context : commands.Context):
         """
         Test cheats for the player with the given context.
         """
-        player_name = context.author.name
-    
         testers = [ "blacklabel" ]
-        if player_name not in testers:
+        if context.author.name not in testers:
             return "You are not authorized to use this command."
 
+        player_name = self.get_player_name(context.author)
         return self.game.test_cheats(player_name, context.message.content)
 
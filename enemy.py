@@ -1,44 +1,139 @@
 """
 This module manages the enemies in the game.
 """
-import random
+import math
+
+import numpy as np
 
 from character import Character
+from enemy_swarm import EnemySwarm, DIRECTIONS, ARRIVING_DIRECTIONS
 from location import Location
 from player import PlayerCharacter
-from gear import Gear
+from enemy_templates import load_enemy_templates
+from enemy_pool import EnemyPool, DEFAULT_POOL_SIZE
+from region_simulation import RegionSimulation
+from population import PopulationController, DEFAULT_ENEMY_BUDGET
+from timer_wheel import TimerWheel
 
+# How many cells around a player enemies are simulated, farther enemies sleep
+ACTIVITY_RADIUS = 8
 
 class EnemyManager():
     """
     Manages the enemies in the game.
     """
 
-    def __init__(self, discord_game):
-        self.enemies = []
+    def __init__(self, discord_game, vectorized=False, activity_radius=ACTIVITY_RADIUS, templates=None,
+                 enemy_budget=DEFAULT_ENEMY_BUDGET, simulation_regions=None, simulation_workers=1,
+                 pool_size=DEFAULT_POOL_SIZE):
+        """
+        Args:
+            discord_game: The game the enemies belong to.
+            vectorized (bool): Simulate the enemies with the array backed EnemySwarm
+                instead of updating them one at a time.
+            activity_radius (int): How many cells around a player enemies are simulated,
+                None to simulate every enemy.
+            templates (dict): The EnemyTemplate of each template id, loaded from the
+                default data file if not given.
+            enemy_budget (int): The most enemies the population controller keeps alive.
+            simulation_regions (int): Split the swarm's walks into this many map regions,
+                only used with vectorized.
+            simulation_workers (int): How many worker processes step the regions.
+            pool_size (int): The most dead enemies kept for reuse by respawns.
+        """
+        # Every enemy keyed by its enemy_id, and again split by template id
+        self.enemies = {}
+        self.enemies_by_type = {}
+        self.next_enemy_id = 1
+        self.templates = templates if templates is not None else load_enemy_templates()
         self.game = discord_game
+        # The game's seeded streams, enemies never draw from the global random module
+        self.rng = discord_game.rng
+        self.swarm = EnemySwarm(rng=self.rng.movement.generator) if vectorized else None
+        self.region_simulation = None
+        if self.swarm is not None and simulation_regions is not None:
+            self.region_simulation = RegionSimulation(
+                self.swarm, discord_game.map_size, simulation_regions, simulation_workers,
+                seed=self.rng.movement.derive_seed()
+            )
+        self.activity_radius = activity_radius
+        # Enemies waiting for their next action, a tick only visits the ones that are due
+        self.schedule = TimerWheel()
+        self.enemy_budget = enemy_budget
+        # True while update_enemies leaves refreshing the shown map to the game's render phase
+        self.refresh_deferred = False
+        # Built by initial_seed once the map exists
+        self.population = None
+        # Dead enemies waiting to be reused by the next spawn of their template
+        self.pool = EnemyPool(pool_size)
+
+    def index_enemy(self, enemy):
+        """
+        Gives an enemy its unique id and files it in the id and type indexes.
+        """
+        enemy.enemy_id = self.next_enemy_id
+        self.next_enemy_id += 1
+        self.enemies[enemy.enemy_id] = enemy
+        self.enemies_by_type.setdefault(enemy.template_id, {})[enemy.enemy_id] = enemy
 
     def add_enemy(self, enemy):
         """
-        Adds an enemy to the list of enemies.
+        Adds an enemy to the enemy indexes.
         
         Args:
             enemy: The enemy object to be added.
         """
-        self.enemies.append(enemy)
+        self.index_enemy(enemy)
+        if self.swarm is not None:
+            self.swarm.add(enemy)
+        # With activity zones, enemies are scheduled once a player comes near
+        if self.activity_radius is None:
+            self.schedule_enemy(enemy, enemy.get_next_action_delay())
+
+    def add_enemies(self, new_enemies):
+        """
+        Adds a batch of enemies to the enemy indexes.
+
+        Args:
+            new_enemies: The enemy objects to be added.
+        """
+        for new_enemy in new_enemies:
+            self.index_enemy(new_enemy)
+            if self.swarm is not None:
+                self.swarm.add(new_enemy)
+        if self.activity_radius is None:
+            self.schedule.schedule_many(new_enemies, [new_enemy.get_next_action_delay() for new_enemy in new_enemies])
 
     def remove_enemy(self, enemy):
         """
-        Removes an enemy from the list of enemies.
+        Removes an enemy from the enemy indexes.
         
         Args:
             enemy: The enemy object to be removed.
         """
-        self.enemies.remove(enemy)
+        if self.enemies.pop(enemy.enemy_id, None) is None:
+            return
+        typed_enemies = self.enemies_by_type[enemy.template_id]
+        del typed_enemies[enemy.enemy_id]
+        if not typed_enemies:
+            del self.enemies_by_type[enemy.template_id]
+        if self.swarm is not None:
+            self.swarm.remove(enemy)
+        self.schedule.cancel(enemy)
+
+    def schedule_enemy(self, enemy, delay):
+        """
+        Schedules an enemy's next action a number of ticks from now.
+        A delay of 0 means the enemy never acts, so it is not scheduled.
+        """
+        if delay > 0:
+            self.schedule.schedule(enemy, delay)
 
     def get_enemy(self, name):
         """
-        Retrieves an enemy from the list of enemies by name.
+        Retrieves an enemy by name.
+        Templated enemies all share their template's name, so only one-off
+        enemies are ever compared one by one.
         
         Args:
             name: The name of the enemy to retrieve.
@@ -46,126 +141,241 @@ class EnemyManager():
         Returns:
             The enemy object with the specified name, or None if not found.
         """
-        for enemy in self.enemies:
-            if enemy.name == name:
-                return enemy
+        for template_id, typed_enemies in self.enemies_by_type.items():
+            if template_id is None:
+                for enemy in typed_enemies.values():
+                    if enemy.name == name:
+                        return enemy
+            elif self.templates[template_id].name == name:
+                return next(iter(typed_enemies.values()))
         return None
 
+    def get_enemy_by_id(self, enemy_id):
+        """
+        Retrieves an enemy by its unique id, or None if it is not alive.
+        """
+        return self.enemies.get(enemy_id)
+
+    def get_enemies_of_type(self, template_id):
+        """
+        Retrieves the enemies spawned from a template.
+        This is a live view of the index, not a copy.
+        """
+        return self.enemies_by_type.get(template_id, {}).values()
+
+    def get_enemies_at(self, coordinates):
+        """
+        Retrieves the enemies in a cell.
+        Locations already keep their enemies apart from their other contents,
+        so the cell's location is the index.
+        """
+        location = self.game.map.find_location(coordinates)
+        if location is None:
+            return ()
+        return location.get_enemies()
+
+    def count_enemies(self, template_id=None):
+        """
+        Counts the enemies, or only those spawned from one template.
+        """
+        if template_id is None:
+            return len(self.enemies)
+        return len(self.enemies_by_type.get(template_id, {}))
+
+    def get_population(self):
+        """
+        Gets how many enemies of each template are alive, for admin tooling.
+        One-off enemies are counted under None.
+        """
+        return {template_id: len(typed_enemies) for template_id, typed_enemies in self.enemies_by_type.items()}
+
+    def get_pool_metrics(self):
+        """
+        Gets the size and hit rate of the dead enemy pool, for admin tooling.
+        """
+        return self.pool.get_metrics()
+
     def initial_seed(self):
         """
         Initializes the seed for enemy creation.
+        The population controller is built for the new map and fills it to its targets.
         """
-        center = self.game.map.map_location_data[self.game.map_size[0] // 2]\
-            [self.game.map_size[1] // 2]
-        top_left = self.game.map.map_location_data[0][0]
-        bottom_right = self.game.map.map_location_data[self.game.map_size[0] - 1]\
-            [self.game.map_size[1] - 1]
+        self.population = PopulationController(self, self.enemy_budget)
+        self.population.populate()
 
-        self.create_basic_goblin(center)
-        self.create_intermediate_orc(top_left)
-        self.create_advanced_troll(bottom_right)
+    def get_active_enemies(self):
+        """
+        Gets the enemies inside the activity zone of any player.
+        Only the cells around players are looked at, so this costs the same
+        however many enemies sleep in the rest of the world.
+        """
+        if self.activity_radius is None:
+            return list(self.enemies.values())
+        radius = self.activity_radius
+        active_enemies = {}
+        for player in self.game.players:
+            row, col = player.position
+            for i in range(row - radius, row + radius + 1):
+                for j in range(col - radius, col + radius + 1):
+                    location = self.game.map.find_location((i, j))
+                    if location is not None and location.has_enemies():
+                        for enemy in location.get_enemies():
+                            active_enemies[id(enemy)] = enemy
+        return list(active_enemies.values())
 
-        random_x = random.randint(0, self.game.map_size[0] - 1)
-        random_y = random.randint(0, self.game.map_size[1] - 1)
-        random_location = self.game.map.map_location_data[random_x][random_y]
-        self.create_boss_dragon(random_location)
-        
-    def update_enemies(self):
+    def shutdown(self):
         """
-        Updates the enemies in the game.
+        Stops any worker processes simulating the enemies.
         """
-        for enemy in self.enemies:
-            enemy.update()
+        if self.region_simulation is not None:
+            self.region_simulation.close()
+
+    def refresh_map(self):
+        """
+        Refreshes the shown map after an enemy changed it, unless the refresh is deferred.
+        """
+        if not self.refresh_deferred:
+            self.game.update_shown_map()
+
+    def update_enemies(self, defer_refresh=False):
+        """
+        Updates the enemies whose next action is due this tick.
+        With defer_refresh the shown map is left stale for the caller to refresh
+        once, instead of after every enemy that moves.
+        Enemies that come due away from every player are not rescheduled, they sleep
+        until a player comes close again and wakes them.
+        With a swarm, the walks of the due enemies are rolled at once and only the
+        enemies that changed cell are moved between locations.
+        Enemies that died last tick are done with, so they become reusable first.
+        """
+        self.pool.recycle()
+        if self.activity_radius is not None:
+            active_enemies = self.get_active_enemies()
+            for enemy in active_enemies:
+                if not self.schedule.is_scheduled(enemy):
+                    self.schedule_enemy(enemy, enemy.get_next_action_delay())
+            active_ids = {id(enemy) for enemy in active_enemies}
+            due_enemies = [enemy for enemy in self.schedule.advance() if id(enemy) in active_ids]
+        else:
+            due_enemies = self.schedule.advance()
+
+        if self.swarm is None:
+            self.refresh_deferred = defer_refresh
+            try:
+                for enemy in due_enemies:
+                    enemy.update()
+                    self.schedule_enemy(enemy, enemy.get_next_action_delay())
+            finally:
+                self.refresh_deferred = False
+            return
+        rows = np.array([enemy.swarm_index for enemy in due_enemies], dtype=np.int64)
+        simulation = self.region_simulation if self.region_simulation is not None else self.swarm
+        for enemy, position, direction in simulation.step(self.game.map, rows):
+            enemy.move_to(position, DIRECTIONS[direction], ARRIVING_DIRECTIONS[direction])
+        self.schedule.schedule_many(due_enemies, self.swarm.draw_action_delays(rows).tolist())
+        if not defer_refresh:
+            self.game.update_shown_map()
+
+    def build_enemy(self, template, location: Location):
+        """
+        Builds an enemy of a template at a location, reusing a dead one from the pool if it has one.
+        """
+        new_enemy = self.pool.acquire(template.template_id)
+        if new_enemy is None:
+            new_enemy = Enemy(template.name, location, self)
+        else:
+            new_enemy.reset(template.name, location)
+        template.apply(new_enemy)
+        return new_enemy
+
+    def spawn(self, template_id, location: Location):
+        """
+        Spawns an enemy from a template at a location.
+        """
+        new_enemy = self.build_enemy(self.templates[template_id], location)
+        self.add_enemy(new_enemy)
+        location.add_content(new_enemy)
+        return new_enemy
+
+    def spawn_batch(self, template_id, locations):
+        """
+        Spawns one enemy from a template at each of the given locations, registering them in one batch.
+
+        Returns:
+            list: The new enemies.
+        """
+        template = self.templates[template_id]
+        new_enemies = []
+        for location in locations:
+            new_enemy = self.build_enemy(template, location)
+            location.add_content(new_enemy)
+            new_enemies.append(new_enemy)
+        self.add_enemies(new_enemies)
+        return new_enemies
+
+    def spawn_many(self, template_id, count, region=None):
+        """
+        Spawns many enemies from a template at random cells of a region.
+
+        Args:
+            template_id (str): The template to spawn from.
+            count (int): How many enemies to spawn.
+            region (tuple): The ((first row, first col), (last row, last col)) corners
+                of the region, the starting area of the map if not given.
+
+        Returns:
+            list: The new enemies.
+        """
+        if region is None:
+            region = ((0, 0), (self.game.map_size[0] - 1, self.game.map_size[1] - 1))
+        (first_row, first_col), (last_row, last_col) = region
+        spawns = self.rng.spawns
+        locations = [
+            self.game.map.get_location((spawns.randint(first_row, last_row), spawns.randint(first_col, last_col)))
+            for _ in range(count)
+        ]
+        return self.spawn_batch(template_id, locations)
 
     def create_basic_goblin(self, location: Location):
         """
         Creates a basic goblin enemy.
         """
-        gobbo = Enemy('Goblin', location, self)
-        gobbo.icon = '👺'
-        gobbo.health = 1
-        gobbo.power = 1
-        gobbo.build_description()
-        rusty_gobbo_dagger = Gear('Rusty Gobbo Dagger', 'A rusty dagger that goblins use')
-        rusty_gobbo_dagger.icon = '🗡️'
-        rusty_gobbo_dagger.offense = 1
-        gobbo.drops.append(rusty_gobbo_dagger)
-        self.add_enemy(gobbo)
-        location.add_content(gobbo)
-        return gobbo
+        return self.spawn('goblin', location)
 
     def create_intermediate_orc(self, location: Location):
         """
         Creates an intermediate orc enemy.
         """
-        orc = Enemy('Orc', location, self)
-        orc.icon = '👹'
-        orc.health = 3
-        orc.power = 2
-        orc.build_description()
-        first_orc_armor = Gear('Orcish Armor', 'Armor made from the hides of slain orcs')
-        first_orc_armor.icon = '🛡️'
-        first_orc_armor.defense = 1
-        orc.drops.append(first_orc_armor)
-        self.add_enemy(orc)
-        location.add_content(orc)
-        return orc
+        return self.spawn('orc', location)
 
     def create_advanced_troll(self, location: Location):
         """
         Creates an advanced troll enemy.
         """
-        troll = Enemy('Troll', location, self)
-        troll.icon = '🧟'
-        troll.health = 5
-        troll.power = 3
-        troll.build_description()
-        first_troll_magic_circlet = Gear('Troll Magic Circlet',
-                        'A circlet that enhances the magical abilities of trolls')
-        first_troll_magic_circlet.icon = '🔮'
-        first_troll_magic_circlet.offense = 5
-        first_troll_magic_circlet.defense = 3
-        troll.drops.append(first_troll_magic_circlet)
-        self.add_enemy(troll)
-        location.add_content(troll)
-        return troll
+        return self.spawn('troll', location)
 
     def create_boss_dragon(self, location: Location):
         """
         Creates a boss dragon enemy.
         """
-        dragon = Enemy('Dragon', location, self)
-        dragon.icon = '🐉'
-        dragon.health = 20
-        dragon.power = 10
-        dragon.build_description()
-        first_dragon_armor = Gear('Dragon Scales', 'Armor made from the scales of a dragon')
-        first_dragon_armor.icon = '🐲'
-        first_dragon_armor.defense = 5
-        dragon.drops.append(first_dragon_armor)
-        self.add_enemy(dragon)
-        location.add_content(dragon)
-        return dragon
+        return self.spawn('dragon', location)
 
     def handle_enemy_death(self, enemy):
         """
         Handles the death of an enemy.
+        Enemies spawned from a template count towards its kill stat, and the
+        population controller respawns one in a fitting biome if the template is
+        below target and the budget allows. The dead enemy goes to the pool, so
+        a later respawn of its template can reuse it.
         """
         self.remove_enemy(enemy)
-        random_new_enemy_location = random.choice(self.game.map.map_location_data)
-        random_new_enemy_location = random.choice(random_new_enemy_location)
-        if "goblin" in enemy.name.lower():
-            self.game.goblin_kills += 1
-            self.create_basic_goblin(random_new_enemy_location)
-        elif "orc" in enemy.name.lower():
-            self.game.orc_kills += 1
-            self.create_intermediate_orc(random_new_enemy_location)
-        elif "troll" in enemy.name.lower():
-            self.game.troll_kills += 1
-            self.create_advanced_troll(random_new_enemy_location)
-        elif "dragon" in enemy.name.lower():
-            self.game.dragon_kills += 1
-            self.create_boss_dragon(random_new_enemy_location)
+        template = self.templates.get(enemy.template_id)
+        if template is not None:
+            self.pool.release(enemy)
+            if template.kill_stat is not None:
+                setattr(self.game, template.kill_stat, getattr(self.game, template.kill_stat) + 1)
+            if self.population is not None:
+                self.population.respawn(template.template_id)
 
         self.game.update_shown_map()
 
@@ -174,15 +384,23 @@ class Enemy(Character):
     """
     Represents an enemy in the game.
     """
+    content_kind = 'enemy'
+    __slots__ = ('location', 'manager', 'drops', 'chance_to_move', 'swarm_index', 'template_id', 'enemy_id')
 
     def __init__(self, name, location: Location, manager: EnemyManager):
         super().__init__(manager.game, name, '👾', health=1, attack_power=1)
+        # Row in the manager's swarm, None unless it is simulated there
+        self.swarm_index = None
+        # The template the enemy was spawned from, None for one-off enemies
+        self.template_id = None
+        # Given by the manager when the enemy is added
+        self.enemy_id = None
         self.name = name
         self.icon = '👾'
         self.location = location
+        self.position = location.coordinates
         self.manager = manager
 
-        self.power = 1
         self.health = 1
 
         self.description = self.build_description()
@@ -192,11 +410,29 @@ class Enemy(Character):
         #temp
         self.chance_to_move = 100
 
+    def reset(self, name, location: Location):
+        """
+        Resets a dead enemy taken from the pool so it can be spawned again.
+        Its lists are emptied rather than replaced, and its template sets the rest.
+        """
+        self.name = name
+        self.location = location
+        self.position = location.coordinates
+        self.swarm_index = None
+        self.enemy_id = None
+        self.gear.clear()
+        self.consumables.clear()
+        self.consumable_index = None
+        self.status_effects.clear()
+        self.stats.clear_modifiers()
+
     def build_description(self):
         """
         Builds the description of the enemy.
         """
-        self.description = f'(❤️{self.health} 💪{self.power})'
+        self.description = f'(❤️{self.health} 💪{self.get_attack_damage()})'
+        if self.swarm_index is not None:
+            self.manager.swarm.sync_stats(self)
         return self.description
 
     def attack(self, player: PlayerCharacter):
@@ -204,16 +440,20 @@ class Enemy(Character):
         Performs an attack on the player.
         """
         attack_msg = f'{self.name} attacks {player.name} 🫵!\n'
-        attack_msg += player.receive_damage(self.power)
+        attack_msg += player.receive_damage(self.get_attack_damage())
         return attack_msg
 
     def receive_damage(self, source, damage):
         """
-        Receives damage from a source.
+        Receives damage from a source, less what the enemy's defense mitigates.
         """
+        self.expire_status_effects()
+        damage = self.stats.mitigate(damage)
         enemy_recv_msg = f'{self.name} receives {damage} damage 💥!\n'
         self.health -= damage
-        self.description = f'(❤️{self.health} 💪{self.power})'
+        self.build_description()
+        # Health is part of the display priority, so the cell's icon and threat may change
+        self.location.refresh_content(self)
         enemy_recv_msg += self.attack(source)
         if self.health <= 0:
             self.health = 0
@@ -230,37 +470,70 @@ class Enemy(Character):
         """
         Drops loot when the enemy is defeated.
         """
-        random_drop = random.choice(self.drops)
+        # Drops are prototypes shared by every enemy of a template, so the dropped item is a copy
+        random_drop = self.manager.rng.loot.choice(self.drops).clone()
         drop_msg = f'{self.name} drops {random_drop.name}.\n'
         self.location.add_content(random_drop)
         return drop_msg
 
+    def move(self, direction):
+        """
+        Moves the enemy, keeping track of the location it ends up in.
+        """
+        move_msg = super().move(direction)
+        self.location = self.game.map.get_location(self.position)
+        if self.swarm_index is not None:
+            self.manager.swarm.sync_position(self)
+        return move_msg
+
+    def move_to(self, position, direction, arriving_direction):
+        """
+        Moves the enemy to a neighbouring cell its swarm already moved it to.
+        """
+        old_location = self.location
+        new_location = self.game.map.get_location(position)
+        old_location.remove_content(self)
+        # Only players react to messages, and most cells a swarm moves through have none
+        if old_location.has_players():
+            old_location.send_message_to_contents(f'{self.name} moves {direction}\n')
+        if new_location.has_players():
+            new_location.send_message_to_contents(f'{self.name} arrives from the {arriving_direction}\n')
+        new_location.add_content(self)
+        self.position = position
+        self.location = new_location
+        self.game.map.load_around(position)
+
+    def get_next_action_delay(self):
+        """
+        Draws how many ticks until the enemy acts next.
+        With a chance_to_move percent chance each tick, the wait is geometric.
+        Enemies that never move get 0.
+        """
+        if self.chance_to_move <= 0:
+            return 0
+        if self.chance_to_move >= 100:
+            return 1
+        # 1 - random() is in (0, 1], so the log is always defined
+        return 1 + int(math.log(1.0 - self.manager.rng.movement.random()) / math.log(1 - self.chance_to_move / 100))
+
     def update(self):
         """
-        Updates the enemy.
-        """
-        random_roll = random.randint(1, 100)
-        # 10% chance to move
-        if random_roll <= self.chance_to_move:
-            random_x = random.randint(-1, 1)
-            random_y = random.randint(-1, 1)
-            new_x = self.location.coordinates[0] + random_x
-            new_y = self.location.coordinates[1] + random_y
-            if new_x < 0 or new_x >= self.manager.game.map_size[0]:
-                new_x = self.location.coordinates[0]
-            if new_y < 0 or new_y >= self.manager.game.map_size[1]:
-                new_y = self.location.coordinates[1]
-            leaving_direction = ''
-
-            if random_x == -1:
-                leaving_direction = 'north'
-            elif random_x == 1:
-                leaving_direction = 'south'
-            elif random_y == -1:
-                leaving_direction = 'west'
-            elif random_y == 1:
-                leaving_direction = 'east'
-
-            self.move(leaving_direction)
-            self.manager.game.update_shown_map()
-            #print(f'{self.name} moved to {self.location.name}\n')
+        Updates the enemy when its scheduled action comes due.
+        """
+        movement = self.manager.rng.movement
+        random_x = movement.randint(-1, 1)
+        random_y = movement.randint(-1, 1)
+        leaving_direction = ''
+
+        if random_x == -1:
+            leaving_direction = 'north'
+        elif random_x == 1:
+            leaving_direction = 'south'
+        elif random_y == -1:
+            leaving_direction = 'west'
+        elif random_y == 1:
+            leaving_direction = 'east'
+
+        self.move(leaving_direction)
+        self.manager.refresh_map()
+        #print(f'{self.name} moved to {self.location.name}\n')
@@ -0,0 +1,91 @@
+"""
+This module benchmarks enemy simulation ticks.
+Run it directly to time one tick of wandering enemies with and without the swarm,
+and with the swarm when only the enemies near a few players are awake.
+It also counts the allocations behind 10k kills and respawns, with and without the enemy pool:
+    python enemy_benchmark.py [count]
+"""
+import contextlib
+import gc
+import io
+import sys
+import time
+
+import game
+
+def build_populated_game(count, size=(400, 400), vectorized_enemies=False, activity_radius=None, player_count=0,
+                         chance_to_move=100, seed=0):
+    """
+    Build a game with count goblins spread over the map.
+    The game is seeded, so every run rolls the same walks.
+    """
+    test_game = game.MudGame("Benchmark Game", size=size, vectorized_enemies=vectorized_enemies,
+                             activity_radius=activity_radius, seed=seed)
+    for index in range(player_count):
+        # Spread the players out so their activity zones do not overlap
+        player = test_game.add_player(f'Player{index}')
+        test_game.map.get_location(player.position).remove_content(player)
+        player.position = (20 + 36 * index % (size[0] - 40), 20 + 36 * index % (size[1] - 40))
+        test_game.map.get_location(player.position).add_content(player)
+    for index in range(count):
+        cell = (index % size[0], (index // size[0]) % size[1])
+        goblin = test_game.enemy_mgr.create_basic_goblin(test_game.map.get_location(cell))
+        goblin.chance_to_move = chance_to_move
+        if test_game.enemy_mgr.swarm is not None:
+            test_game.enemy_mgr.swarm.chance_to_move[goblin.swarm_index] = chance_to_move
+    test_game.update_shown_map()
+    return test_game
+
+def time_tick(count, vectorized_enemies, activity_radius=None, player_count=0, chance_to_move=100, ticks=3):
+    """
+    Get the average seconds one game tick takes with count wandering enemies.
+    """
+    test_game = build_populated_game(count, vectorized_enemies=vectorized_enemies, activity_radius=activity_radius,
+                                     player_count=player_count, chance_to_move=chance_to_move)
+    # Players print what they see, which is not what is being timed
+    with contextlib.redirect_stdout(io.StringIO()):
+        # The first tick also pays for collecting the garbage left by building the population
+        test_game.update()
+        start = time.perf_counter()
+        for _ in range(ticks):
+            test_game.update()
+        return (time.perf_counter() - start) / ticks
+
+def count_kill_allocations(kills, pool_size, seed=0):
+    """
+    Get the Enemy objects built and the young generation collections run over kills deaths,
+    with one death and respawn per tick.
+    """
+    test_game = game.MudGame("Benchmark Game", size=(100, 100), pool_size=pool_size, seed=seed)
+    enemy_mgr = test_game.enemy_mgr
+    built_before = enemy_mgr.next_enemy_id - 1
+    gc.collect()
+    collections_before = gc.get_stats()[0]['collections']
+    for _ in range(kills):
+        dead_enemy = next(iter(enemy_mgr.get_enemies_of_type('goblin')))
+        enemy_mgr.handle_enemy_death(dead_enemy)
+        dead_enemy.location.remove_content(dead_enemy)
+        dead_enemy.do_drop_loot()
+        enemy_mgr.pool.recycle()
+    collections = gc.get_stats()[0]['collections'] - collections_before
+    reused = enemy_mgr.get_pool_metrics()['hits']
+    return enemy_mgr.next_enemy_id - 1 - built_before - reused, collections
+
+def main():
+    """
+    Print the tick time of both enemy backends, with every enemy awake and with activity zones.
+    """
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    for chance_to_move in (100, 10):
+        for name, vectorized_enemies in (('objects', False), ('swarm', True)):
+            tick_seconds = time_tick(count, vectorized_enemies, chance_to_move=chance_to_move)
+            print(f'{name}: {tick_seconds:.3f}s per tick for {count} enemies moving {chance_to_move}% of ticks')
+    for player_count in (1, 10):
+        tick_seconds = time_tick(count, True, activity_radius=game.ACTIVITY_RADIUS, player_count=player_count)
+        print(f'swarm with zones: {tick_seconds:.4f}s per tick for {count} enemies and {player_count} players')
+    for name, pool_size in (('without pool', 0), ('with pool', game.DEFAULT_POOL_SIZE)):
+        built, collections = count_kill_allocations(10000, pool_size)
+        print(f'{name}: {built} enemies built and {collections} young collections per 10000 kills')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+This module contains the pool dead enemies are recycled through.
+Respawning an enemy of a template reuses one that died earlier instead of
+allocating a new Enemy, and the pool keeps count of how often that works.
+"""
+
+# The most dead enemies kept for reuse, summed over every template
+DEFAULT_POOL_SIZE = 1024
+
+class EnemyPool():
+    """
+    This class represents the free lists of dead enemies, one per template.
+
+    A dead enemy is still referenced while its death is being handled, by the
+    attack that killed it and the loot it drops, so released enemies only
+    become reusable once recycle is called at the next tick boundary.
+
+    Attributes:
+        max_size (int): The most enemies kept for reuse.
+        free_enemies (dict): The reusable enemies of each template id.
+        retiring (list): The enemies released since the last recycle.
+        size (int): How many enemies are kept for reuse.
+        hits (int): How many acquires were served from the pool.
+        misses (int): How many acquires found the pool empty.
+        dropped (int): How many released enemies were let go because the pool was full.
+    """
+    __slots__ = ('max_size', 'free_enemies', 'retiring', 'size', 'hits', 'misses', 'dropped')
+
+    def __init__(self, max_size=DEFAULT_POOL_SIZE):
+        """
+        Args:
+            max_size (int): The most enemies kept for reuse, 0 turns pooling off.
+        """
+        self.max_size = max_size
+        self.free_enemies = {}
+        self.retiring = []
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.dropped = 0
+
+    def release(self, enemy):
+        """
+        Hand a dead enemy to the pool, to be reused after the next recycle.
+        """
+        if self.size + len(self.retiring) >= self.max_size:
+            self.dropped += 1
+            return
+        self.retiring.append(enemy)
+
+    def recycle(self):
+        """
+        Make the enemies released since the last recycle reusable.
+        """
+        for enemy in self.retiring:
+            self.free_enemies.setdefault(enemy.template_id, []).append(enemy)
+        self.size += len(self.retiring)
+        self.retiring.clear()
+
+    def acquire(self, template_id):
+        """
+        Take a reusable enemy of a template out of the pool.
+
+        Returns:
+            Enemy: A dead enemy for the caller to reset, or None if there is none.
+        """
+        free_enemies = self.free_enemies.get(template_id)
+        if not free_enemies:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.size -= 1
+        return free_enemies.pop()
+
+    def get_metrics(self):
+        """
+        Get the size and hit rate of the pool, for admin tooling.
+        """
+        acquires = self.hits + self.misses
+        return {
+            'size': self.size,
+            'retiring': len(self.retiring),
+            'hits': self.hits,
+            'misses': self.misses,
+            'dropped': self.dropped,
+            'hit_rate': self.hits / acquires if acquires > 0 else 0.0,
+        }
@@ -0,0 +1,74 @@
+"""
+This module contains the enemy pool tests.
+"""
+
+import enemy_pool
+import game
+
+def test_enemy_pool_released_enemies_are_reusable_after_recycle():
+    """
+    Test if a released enemy is only handed out again after a recycle, and only for its template.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game")
+    goblin = next(iter(test_game.enemy_mgr.get_enemies_of_type('goblin')))
+    pool = enemy_pool.EnemyPool()
+
+    # Act
+    pool.release(goblin)
+    before_recycle = pool.acquire('goblin')
+    pool.recycle()
+    other_template = pool.acquire('orc')
+    after_recycle = pool.acquire('goblin')
+
+    # Assert
+    assert before_recycle is None
+    assert other_template is None
+    assert after_recycle is goblin
+    assert pool.get_metrics()['hits'] == 1
+    assert pool.get_metrics()['misses'] == 2
+
+def test_enemy_pool_drops_enemies_past_max_size():
+    """
+    Test if the pool lets released enemies go once it holds max_size of them.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game")
+    enemies = list(test_game.enemy_mgr.enemies.values())[:3]
+    pool = enemy_pool.EnemyPool(max_size=2)
+
+    # Act
+    for dead_enemy in enemies:
+        pool.release(dead_enemy)
+    pool.recycle()
+
+    # Assert
+    assert pool.get_metrics()['size'] == 2
+    assert pool.get_metrics()['dropped'] == 1
+
+def test_enemy_manager_respawn_reuses_dead_enemy():
+    """
+    Test if a respawn after a tick reuses the dead enemy, reset to full health in its new location.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game")
+    enemy_mgr = test_game.enemy_mgr
+    orc = next(iter(enemy_mgr.get_enemies_of_type('orc')))
+    orc.health = 0
+    orc.status_effects.append('poisoned')
+    enemy_mgr.remove_enemy(orc)
+    orc.location.remove_content(orc)
+    enemy_mgr.pool.release(orc)
+    enemy_mgr.update_enemies()
+
+    # Act
+    respawned = enemy_mgr.spawn('orc', test_game.map.get_location((2, 3)))
+
+    # Assert
+    assert respawned is orc
+    assert respawned.health == enemy_mgr.templates['orc'].health
+    assert respawned.status_effects == []
+    assert respawned.position == (2, 3)
+    assert respawned in test_game.map.get_location((2, 3)).get_enemies()
+    assert enemy_mgr.get_enemy_by_id(respawned.enemy_id) is respawned
+    assert enemy_mgr.get_pool_metrics()['hit_rate'] > 0
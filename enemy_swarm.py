@@ -0,0 +1,155 @@
+"""
+This module contains the structure-of-arrays enemy simulation.
+The positions, health, power and move chances of every simulated enemy are kept
+in NumPy arrays, so a whole tick of random walks is rolled in one vectorized step.
+"""
+
+import numpy as np
+
+# Direction names by direction index, and the direction an enemy arrives from
+DIRECTIONS = ('north', 'south', 'west', 'east')
+ARRIVING_DIRECTIONS = ('south', 'north', 'east', 'west')
+
+# Direction index of a (row step + 1, column step + 1), -1 where there is no move
+STEP_DIRECTIONS = np.array([
+    [-1, 0, -1],
+    [2, -1, 3],
+    [-1, 1, -1],
+])
+
+class EnemySwarm():
+    """
+    This class represents the array backed state of a group of enemies.
+
+    Row i of every array belongs to enemies[i]. Removing an enemy moves the last
+    row into its place, so the arrays stay packed.
+
+    Attributes:
+        enemies (list): The Enemy objects, in row order.
+        positions (numpy.ndarray): The (row, col) coordinates of each enemy.
+        health (numpy.ndarray): The health of each enemy.
+        power (numpy.ndarray): The power of each enemy.
+        chance_to_move (numpy.ndarray): The percent chance each enemy moves per tick.
+        rng (numpy.random.Generator): The random source for the walks.
+    """
+
+    def __init__(self, capacity=64, rng=None):
+        """
+        Args:
+            capacity (int): How many enemies the arrays hold before growing.
+            rng (numpy.random.Generator): The random source, a fresh one if not given.
+        """
+        self.enemies = []
+        self.positions = np.zeros((capacity, 2), dtype=np.int64)
+        self.health = np.zeros(capacity, dtype=np.int64)
+        self.power = np.zeros(capacity, dtype=np.int64)
+        self.chance_to_move = np.zeros(capacity, dtype=np.int64)
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+    def __len__(self):
+        return len(self.enemies)
+
+    def grow(self):
+        """
+        Double the capacity of the arrays.
+        """
+        capacity = 2 * max(1, len(self.health))
+        self.positions = np.resize(self.positions, (capacity, 2))
+        self.health = np.resize(self.health, capacity)
+        self.power = np.resize(self.power, capacity)
+        self.chance_to_move = np.resize(self.chance_to_move, capacity)
+
+    def add(self, enemy):
+        """
+        Add an enemy to the swarm, copying its state into a new row.
+        """
+        if len(self.enemies) == len(self.health):
+            self.grow()
+        enemy.swarm_index = len(self.enemies)
+        self.enemies.append(enemy)
+        self.sync_position(enemy)
+        self.sync_stats(enemy)
+        self.chance_to_move[enemy.swarm_index] = enemy.chance_to_move
+
+    def remove(self, enemy):
+        """
+        Remove an enemy from the swarm by moving the last row into its place.
+        """
+        index = enemy.swarm_index
+        if index is None:
+            return
+        last_index = len(self.enemies) - 1
+        last_enemy = self.enemies.pop()
+        if index != last_index:
+            self.enemies[index] = last_enemy
+            last_enemy.swarm_index = index
+            for values in (self.positions, self.health, self.power, self.chance_to_move):
+                values[index] = values[last_index]
+        enemy.swarm_index = None
+
+    def sync_position(self, enemy):
+        """
+        Copy an enemy's position into its row, after it moved outside the swarm step.
+        """
+        self.positions[enemy.swarm_index] = enemy.position
+
+    def sync_stats(self, enemy):
+        """
+        Copy an enemy's health and power into its row.
+        """
+        self.health[enemy.swarm_index] = enemy.health
+        self.power[enemy.swarm_index] = enemy.get_attack_damage()
+
+    def draw_action_delays(self, rows):
+        """
+        Draw how many ticks until the enemies in the given rows act next.
+        An enemy with a chance_to_move percent chance per tick waits a geometric
+        number of ticks, enemies that never move get 0.
+        """
+        chances = self.chance_to_move[rows]
+        delays = self.rng.geometric(np.clip(chances, 1, 100) / 100)
+        delays[chances <= 0] = 0
+        return delays
+
+    def roll_steps(self, rows):
+        """
+        Roll a random walk step for each of the enemies in the given rows.
+        Like Enemy.update, a row step wins over a column step, so nobody moves diagonally.
+        """
+        steps = self.rng.integers(-1, 2, (len(rows), 2))
+        steps[steps[:, 0] != 0, 1] = 0
+        return steps
+
+    def step(self, world_map, rows=None):
+        """
+        Move enemies one random walk step, kept on the map by clamping.
+        When to act is left to the caller's schedule, so every given enemy steps.
+
+        Only the arrays are updated, the caller syncs the moved enemies into
+        their locations.
+
+        Args:
+            world_map (Map): The map the enemies walk on.
+            rows (numpy.ndarray): The rows of the enemies to move, every enemy if not given.
+
+        Returns:
+            iterator: A (enemy, position, direction index) tuple for each enemy whose cell changed.
+        """
+        if rows is None:
+            rows = np.arange(len(self.enemies))
+        if len(rows) == 0:
+            return iter(())
+        steps = self.roll_steps(rows)
+        positions = self.positions[rows]
+        targets = world_map.clamp_positions(positions + steps)
+        changed = np.flatnonzero(np.any(targets != positions, axis=1))
+        directions = STEP_DIRECTIONS[steps[changed, 0] + 1, steps[changed, 1] + 1]
+        moved = rows[changed]
+        self.positions[moved] = targets[changed]
+        # Built lazily, so a big tick does not hold a tuple per move at once for the garbage collector to scan
+        moved_rows = targets[changed, 0].tolist()
+        moved_cols = targets[changed, 1].tolist()
+        return (
+            (self.enemies[index], (row, col), direction)
+            for index, row, col, direction in zip(moved.tolist(), moved_rows, moved_cols, directions.tolist())
+        )
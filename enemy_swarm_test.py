@@ -0,0 +1,167 @@
+"""
+This module contains the enemy swarm tests.
+"""
+import numpy as np
+
+import enemy_swarm
+import game
+import world
+
+def build_swarm_game(size=(10, 10), activity_radius=None):
+    """
+    Build a game simulating its enemies with a swarm, by default all of them.
+    """
+    return game.MudGame("Test Game", size=size, vectorized_enemies=True, activity_radius=activity_radius)
+
+def test_enemy_swarm_add_copies_enemy_state():
+    """
+    Test if adding an enemy copies its position, stats and move chance into the arrays.
+    """
+    # Arrange
+    test_game = build_swarm_game()
+    location = test_game.map.get_location((3, 4))
+
+    # Act
+    troll = test_game.enemy_mgr.create_advanced_troll(location)
+
+    # Assert
+    swarm = test_game.enemy_mgr.swarm
+    assert swarm.enemies[troll.swarm_index] is troll
+    assert swarm.positions[troll.swarm_index].tolist() == [3, 4]
+    assert swarm.health[troll.swarm_index] == 5
+    assert swarm.power[troll.swarm_index] == 3
+    assert swarm.chance_to_move[troll.swarm_index] == 100
+
+def test_enemy_swarm_remove_moves_last_row_into_place():
+    """
+    Test if removing an enemy keeps the arrays packed and the moved enemy's row correct.
+    """
+    # Arrange
+    test_game = build_swarm_game()
+    swarm = test_game.enemy_mgr.swarm
+    first_goblin = test_game.enemy_mgr.create_basic_goblin(test_game.map.get_location((1, 1)))
+    last_goblin = test_game.enemy_mgr.create_basic_goblin(test_game.map.get_location((2, 2)))
+    removed_index = first_goblin.swarm_index
+
+    # Act
+    test_game.enemy_mgr.remove_enemy(first_goblin)
+
+    # Assert
+    assert first_goblin.swarm_index is None
+    assert last_goblin.swarm_index == removed_index
+    assert swarm.enemies[removed_index] is last_goblin
+    assert swarm.positions[removed_index].tolist() == [2, 2]
+    assert len(swarm) == len(test_game.enemy_mgr.enemies)
+
+def test_enemy_swarm_damage_syncs_health():
+    """
+    Test if damaging an enemy updates its health in the arrays.
+    """
+    # Arrange
+    test_game = build_swarm_game()
+    test_player = test_game.add_player("Tester")
+    troll = test_game.enemy_mgr.create_advanced_troll(test_game.map.get_location((3, 4)))
+
+    # Act
+    troll.receive_damage(test_player, 2)
+
+    # Assert
+    assert test_game.enemy_mgr.swarm.health[troll.swarm_index] == 3
+
+def test_enemy_swarm_update_keeps_enemies_on_map_and_in_their_locations():
+    """
+    Test if a swarm tick moves enemies only between neighbouring cells on the map,
+    and every enemy ends up in the location at its position.
+    """
+    # Arrange
+    test_game = build_swarm_game(size=(4, 4))
+    for _ in range(50):
+        test_game.enemy_mgr.create_basic_goblin(test_game.map.get_random_location(test_game.rng.spawns))
+    swarm = test_game.enemy_mgr.swarm
+    start_positions = swarm.positions[:len(swarm)].copy()
+
+    # Act
+    test_game.update()
+
+    # Assert
+    end_positions = swarm.positions[:len(swarm)]
+    assert np.abs(end_positions - start_positions).sum(axis=1).max() <= 1
+    assert end_positions.min() >= 0 and end_positions.max() <= 3
+    for index, goblin in enumerate(swarm.enemies):
+        assert goblin.position == tuple(end_positions[index].tolist())
+        assert goblin.location is test_game.map.get_location(goblin.position)
+        assert goblin.location.has_content(goblin)
+
+def test_enemy_swarm_action_delays_follow_move_chance():
+    """
+    Test if enemies that always move act every tick, and enemies that never move are never due.
+    """
+    # Arrange
+    swarm = enemy_swarm.EnemySwarm(rng=np.random.default_rng(7))
+    test_game = build_swarm_game()
+    chances = [100, 0, 50]
+    for chance in chances:
+        goblin = test_game.enemy_mgr.create_basic_goblin(test_game.map.get_location((5, 5)))
+        goblin.chance_to_move = chance
+        swarm.add(goblin)
+
+    # Act
+    delays = swarm.draw_action_delays(np.arange(len(chances)))
+
+    # Assert
+    assert delays[0] == 1
+    assert delays[1] == 0
+    assert delays[2] >= 1
+
+def test_enemy_swarm_step_reports_direction_of_each_move():
+    """
+    Test if each reported move's direction matches the step between the cells.
+    """
+    # Arrange
+    swarm = enemy_swarm.EnemySwarm(rng=np.random.default_rng(3))
+    test_game = build_swarm_game(size=(20, 20))
+    for _ in range(30):
+        swarm.add(test_game.enemy_mgr.create_basic_goblin(test_game.map.get_location((10, 10))))
+    offsets = {'north': (-1, 0), 'south': (1, 0), 'west': (0, -1), 'east': (0, 1)}
+
+    # Act
+    moves = list(swarm.step(test_game.map))
+
+    # Assert
+    assert len(moves) > 0
+    for _, position, direction in moves:
+        assert position == tuple(np.add((10, 10), offsets[enemy_swarm.DIRECTIONS[direction]]).tolist())
+
+def test_enemy_swarm_chunked_map_does_not_clamp():
+    """
+    Test if positions are left alone on a chunked map, which has no edges.
+    """
+    # Arrange
+    chunked_map = world.ChunkedMap((4, 4))
+    positions = np.array([[-1, 0], [0, 9]])
+
+    # Act
+    clamped = chunked_map.clamp_positions(positions)
+
+    # Assert
+    assert clamped.tolist() == [[-1, 0], [0, 9]]
+
+def test_enemy_swarm_only_moves_enemies_near_players():
+    """
+    Test if a swarm tick leaves enemies outside every player's activity zone where they are.
+    """
+    # Arrange
+    test_game = build_swarm_game(size=(30, 30), activity_radius=2)
+    test_player = test_game.add_player("Tester")
+    test_player.position = (5, 5)
+    far_goblins = [test_game.enemy_mgr.create_basic_goblin(test_game.map.get_location((25, 25)))
+                   for _ in range(20)]
+    near_goblins = [test_game.enemy_mgr.create_basic_goblin(test_game.map.get_location((6, 6)))
+                    for _ in range(20)]
+
+    # Act
+    test_game.update()
+
+    # Assert
+    assert all(goblin.position == (25, 25) for goblin in far_goblins)
+    assert any(goblin.position != (6, 6) for goblin in near_goblins)
@@ -0,0 +1,93 @@
+"""
+This module contains the enemy templates the game spawns enemies from.
+Templates are loaded from a JSON data file, so enemy stats and loot can be
+tuned without touching the code.
+"""
+
+import json
+import os
+
+from gear import Gear
+
+DEFAULT_TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'enemy_templates.json')
+
+class EnemyTemplate():
+    """
+    This class represents the stats and loot shared by every enemy of one type.
+
+    Attributes:
+        template_id (str): The id enemies are spawned and respawned by.
+        name (str): The name given to the enemies.
+        icon (str): The map icon of the enemies.
+        health (int): The starting health of the enemies.
+        power (int): The power of the enemies.
+        chance_to_move (int): The percent chance the enemies move each tick.
+        kill_stat (str): The game counter raised when one of the enemies dies.
+        min_population (int): The fewest of these enemies a map is populated with.
+        spawn_densities (dict): The target enemies per cell of each biome, by biome name.
+        loot (tuple): The loot prototypes the enemies may drop, shared by all of them.
+    """
+    __slots__ = (
+        'template_id', 'name', 'icon', 'health', 'power', 'chance_to_move', 'kill_stat',
+        'min_population', 'spawn_densities', 'loot'
+    )
+
+    def __init__(self, template_id, name, icon='👾', health=1, power=1, chance_to_move=100, kill_stat=None,
+                 min_population=0, spawn_densities=None, loot=()):
+        self.template_id = template_id
+        self.name = name
+        self.icon = icon
+        self.health = health
+        self.power = power
+        self.chance_to_move = chance_to_move
+        self.kill_stat = kill_stat
+        self.min_population = min_population
+        self.spawn_densities = spawn_densities if spawn_densities is not None else {}
+        self.loot = tuple(loot)
+
+    def apply(self, enemy):
+        """
+        Give an enemy this template's stats and loot table.
+        The loot table is shared, items are only copied when one is dropped.
+        """
+        enemy.template_id = self.template_id
+        enemy.icon = self.icon
+        enemy.health = self.health
+        enemy.max_health = self.health
+        enemy.stats.set_base('attack', self.power)
+        enemy.chance_to_move = self.chance_to_move
+        enemy.drops = self.loot
+        enemy.build_description()
+
+
+def build_loot_prototype(loot_data):
+    """
+    Build the item a loot entry describes.
+    """
+    if loot_data['kind'] != 'gear':
+        raise ValueError(f'Unknown loot kind {loot_data["kind"]}')
+    prototype = Gear(loot_data['name'], loot_data['description'])
+    prototype.icon = loot_data.get('icon', prototype.icon)
+    prototype.offense = loot_data.get('offense', 0)
+    prototype.defense = loot_data.get('defense', 0)
+    return prototype
+
+
+def load_enemy_templates(path=DEFAULT_TEMPLATE_PATH):
+    """
+    Load the enemy templates from a JSON data file.
+
+    Returns:
+        dict: The EnemyTemplate of each template id.
+    """
+    with open(path, encoding='utf-8') as template_file:
+        template_data = json.load(template_file)
+    templates = {}
+    for template_id, data in template_data.items():
+        loot = [build_loot_prototype(loot_data) for loot_data in data.get('loot', [])]
+        templates[template_id] = EnemyTemplate(
+            template_id, data['name'], data.get('icon', '👾'), data.get('health', 1), data.get('power', 1),
+            data.get('chance_to_move', 100), data.get('kill_stat'), data.get('min_population', 0),
+            data.get('spawn_densities', {}), loot
+        )
+    return templates
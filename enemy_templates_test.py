@@ -0,0 +1,95 @@
+"""
+This module contains the enemy template tests.
+"""
+import enemy_templates
+import game
+
+def test_enemy_templates_load_default_data_file():
+    """
+    Test if the default data file holds the four original enemy types and their loot.
+    """
+    # Arrange
+    expected_stats = {'goblin': (1, 1), 'orc': (3, 2), 'troll': (5, 3), 'dragon': (20, 10)}
+
+    # Act
+    templates = enemy_templates.load_enemy_templates()
+
+    # Assert
+    assert {template_id: (template.health, template.power) for template_id, template in templates.items()} == expected_stats
+    assert templates['troll'].loot[0].name == 'Troll Magic Circlet'
+    assert templates['troll'].loot[0].offense == 5
+    assert templates['troll'].loot[0].defense == 3
+
+def test_enemy_templates_spawned_enemies_share_loot_prototypes():
+    """
+    Test if enemies of one template share their loot instead of each building its own.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game")
+    location = test_game.map.get_location((1, 1))
+
+    # Act
+    first_goblin = test_game.enemy_mgr.spawn('goblin', location)
+    second_goblin = test_game.enemy_mgr.spawn('goblin', location)
+
+    # Assert
+    assert first_goblin.template_id == 'goblin'
+    assert first_goblin.icon == '👺'
+    assert first_goblin.drops is second_goblin.drops
+
+def test_enemy_templates_dropped_loot_is_a_copy_of_the_prototype():
+    """
+    Test if dropping loot puts a copy in the location and leaves the prototype alone.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game")
+    location = test_game.map.get_location((1, 1))
+    goblin = test_game.enemy_mgr.spawn('goblin', location)
+    prototype = goblin.drops[0]
+
+    # Act
+    goblin.do_drop_loot()
+
+    # Assert
+    dropped = location.get_gear()
+    assert len(dropped) == 1
+    dropped_dagger = next(iter(dropped))
+    assert dropped_dagger is not prototype
+    assert dropped_dagger.name == prototype.name
+    assert dropped_dagger.offense == prototype.offense
+
+def test_enemy_templates_death_counts_kill_and_respawns_from_template():
+    """
+    Test if a templated enemy's death raises its kill stat and respawns one of the same template.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game")
+    orc = next(iter(test_game.enemy_mgr.get_enemies_of_type('orc')))
+    orc_count = test_game.enemy_mgr.count_enemies('orc')
+
+    # Act
+    test_game.enemy_mgr.handle_enemy_death(orc)
+
+    # Assert
+    assert test_game.orc_kills == 1
+    assert test_game.enemy_mgr.get_enemy_by_id(orc.enemy_id) is None
+    assert test_game.enemy_mgr.count_enemies('orc') == orc_count
+
+def test_enemy_templates_spawn_many_places_enemies_in_region():
+    """
+    Test if spawning in bulk creates every enemy inside the region and in its location.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game", size=(20, 20))
+    enemy_count = len(test_game.enemy_mgr.enemies)
+
+    # Act
+    trolls = test_game.enemy_mgr.spawn_many('troll', 50, region=((2, 3), (4, 6)))
+
+    # Assert
+    assert len(trolls) == 50
+    assert len(test_game.enemy_mgr.enemies) == enemy_count + 50
+    for troll in trolls:
+        assert 2 <= troll.position[0] <= 4 and 3 <= troll.position[1] <= 6
+        assert test_game.map.get_location(troll.position).has_content(troll)
+        assert troll.health == 5
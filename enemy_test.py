@@ -3,4 +3,178 @@ This module contains the enemy tests.
 """
 
 import enemy
+import game
 
+def build_zoned_game(activity_radius=2):
+    """
+    Build a game with a player at (5, 5) and no randomly placed enemies.
+    """
+    test_game = game.MudGame("Test Game", size=(30, 30), activity_radius=activity_radius)
+    for seeded_enemy in list(test_game.enemy_mgr.enemies.values()):
+        seeded_enemy.location.remove_content(seeded_enemy)
+        test_game.enemy_mgr.remove_enemy(seeded_enemy)
+    test_player = test_game.add_player("Tester")
+    test_game.map.get_location(test_player.position).remove_content(test_player)
+    test_player.position = (5, 5)
+    test_game.map.get_location(test_player.position).add_content(test_player)
+    return test_game
+
+def test_enemy_manager_active_enemies_are_within_radius_of_players():
+    """
+    Test if only enemies within the activity radius of a player are active.
+    """
+    # Arrange
+    test_game = build_zoned_game(activity_radius=2)
+    near_goblin = test_game.enemy_mgr.create_basic_goblin(test_game.map.get_location((7, 3)))
+    far_goblin = test_game.enemy_mgr.create_basic_goblin(test_game.map.get_location((8, 5)))
+
+    # Act
+    active_enemies = test_game.enemy_mgr.get_active_enemies()
+
+    # Assert
+    assert near_goblin in active_enemies
+    assert far_goblin not in active_enemies
+
+def test_enemy_manager_without_radius_activates_every_enemy():
+    """
+    Test if every enemy is active when there is no activity radius.
+    """
+    # Arrange
+    test_game = build_zoned_game(activity_radius=None)
+    far_goblin = test_game.enemy_mgr.create_basic_goblin(test_game.map.get_location((25, 25)))
+
+    # Act
+    active_enemies = test_game.enemy_mgr.get_active_enemies()
+
+    # Assert
+    assert active_enemies == list(test_game.enemy_mgr.enemies.values())
+    assert far_goblin in active_enemies
+
+def test_enemy_manager_sleeping_enemies_do_not_move():
+    """
+    Test if enemies far from every player stay where they are on update.
+    """
+    # Arrange
+    test_game = build_zoned_game(activity_radius=2)
+    far_goblin = test_game.enemy_mgr.create_basic_goblin(test_game.map.get_location((20, 20)))
+
+    # Act
+    for _ in range(5):
+        test_game.update()
+
+    # Assert
+    assert far_goblin.position == (20, 20)
+    assert far_goblin.location.has_content(far_goblin)
+
+def test_enemy_manager_enemy_wakes_when_player_arrives():
+    """
+    Test if a sleeping enemy becomes active once a player walks into range.
+    """
+    # Arrange
+    test_game = build_zoned_game(activity_radius=2)
+    goblin = test_game.enemy_mgr.create_basic_goblin(test_game.map.get_location((5, 9)))
+    asleep = goblin not in test_game.enemy_mgr.get_active_enemies()
+
+    # Act
+    test_game.move_player("Tester", "east")
+    test_game.move_player("Tester", "east")
+
+    # Assert
+    assert asleep is True
+    assert goblin in test_game.enemy_mgr.get_active_enemies()
+
+def test_enemy_manager_only_due_enemies_act():
+    """
+    Test if an enemy that never moves is left off the schedule while one that always moves acts every tick.
+    """
+    # Arrange
+    test_game = build_zoned_game(activity_radius=None)
+    statue = test_game.enemy_mgr.create_basic_goblin(test_game.map.get_location((10, 10)))
+    statue.chance_to_move = 0
+    test_game.enemy_mgr.schedule.cancel(statue)
+    test_game.enemy_mgr.schedule_enemy(statue, statue.get_next_action_delay())
+    runner = test_game.enemy_mgr.create_basic_goblin(test_game.map.get_location((20, 20)))
+
+    # Act
+    due_enemies = test_game.enemy_mgr.schedule.advance()
+
+    # Assert
+    assert due_enemies == [runner]
+    assert test_game.enemy_mgr.schedule.is_scheduled(statue) is False
+
+def test_enemy_next_action_delay_averages_inverse_of_move_chance():
+    """
+    Test if an enemy with a 25% chance to move waits about four ticks between actions.
+    """
+    # Arrange
+    test_game = build_zoned_game()
+    goblin = test_game.enemy_mgr.create_basic_goblin(test_game.map.get_location((10, 10)))
+    goblin.chance_to_move = 25
+
+    # Act
+    delays = [goblin.get_next_action_delay() for _ in range(4000)]
+
+    # Assert
+    assert min(delays) >= 1
+    assert 3.6 < sum(delays) / len(delays) < 4.4
+
+def test_enemy_manager_indexes_enemies_by_id_type_and_cell():
+    """
+    Test if added enemies can be found by id, by template and by cell.
+    """
+    # Arrange
+    test_game = build_zoned_game()
+    first_orc = test_game.enemy_mgr.spawn('orc', test_game.map.get_location((3, 3)))
+    second_orc = test_game.enemy_mgr.spawn('orc', test_game.map.get_location((3, 3)))
+    troll = test_game.enemy_mgr.spawn('troll', test_game.map.get_location((4, 4)))
+
+    # Act
+    population = test_game.enemy_mgr.get_population()
+
+    # Assert
+    assert first_orc.enemy_id != second_orc.enemy_id
+    assert test_game.enemy_mgr.get_enemy_by_id(troll.enemy_id) is troll
+    assert list(test_game.enemy_mgr.get_enemies_of_type('orc')) == [first_orc, second_orc]
+    assert list(test_game.enemy_mgr.get_enemies_at((3, 3))) == [first_orc, second_orc]
+    assert list(test_game.enemy_mgr.get_enemies_at((9, 9))) == []
+    assert population == {'orc': 2, 'troll': 1}
+    assert test_game.enemy_mgr.count_enemies() == 3
+    assert test_game.enemy_mgr.get_enemy('Troll') is troll
+
+def test_enemy_manager_remove_enemy_updates_indexes():
+    """
+    Test if removing an enemy takes it out of the id and type indexes.
+    """
+    # Arrange
+    test_game = build_zoned_game()
+    goblin = test_game.enemy_mgr.spawn('goblin', test_game.map.get_location((3, 3)))
+
+    # Act
+    test_game.enemy_mgr.remove_enemy(goblin)
+
+    # Assert
+    assert test_game.enemy_mgr.get_enemy_by_id(goblin.enemy_id) is None
+    assert test_game.enemy_mgr.count_enemies('goblin') == 0
+    assert test_game.enemy_mgr.get_enemy('Goblin') is None
+    assert 'goblin' not in test_game.enemy_mgr.get_population()
+
+def test_enemy_attack_and_defense_go_through_stat_block():
+    """
+    Test if an enemy's attack comes from its stat block and its defense mitigates the damage it takes.
+    """
+    # Arrange
+    test_game = build_zoned_game()
+    test_player = test_game.get_player_by_name("Tester")
+    test_player.max_health = 20
+    test_player.health = 20
+    troll = test_game.enemy_mgr.create_advanced_troll(test_game.map.get_location((5, 5)))
+    troll.add_status_effect('Enraged', {'attack': 2}, 5)
+    troll.stats.add_modifier('Hide', {'defense': 10})
+
+    # Act
+    troll.receive_damage(test_player, 4)
+
+    # Assert
+    assert troll.get_attack_damage() == test_game.enemy_mgr.templates['troll'].power + 2
+    assert test_player.health == 20 - troll.get_attack_damage()
+    assert troll.health == test_game.enemy_mgr.templates['troll'].health - 2
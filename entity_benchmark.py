@@ -0,0 +1,60 @@
+"""
+This module benchmarks the memory used by game entities.
+Run it directly to populate a large world and report bytes per object:
+    python entity_benchmark.py [count]
+"""
+import sys
+import tracemalloc
+
+import consumables
+import game
+import gear
+
+def measure_allocated_bytes(build, count):
+    """
+    Measure the bytes still allocated per object by what build returns.
+    """
+    tracemalloc.start()
+    result = build(count)
+    allocated_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return allocated_bytes / count
+
+def measure_entity_memory(count=20000, size=(400, 400)):
+    """
+    Populate a world and get the bytes used per Location, Enemy and item.
+    """
+    test_game = game.MudGame("Benchmark Game", size=size)
+    cells = [(i % size[0], (i // size[0]) % size[1]) for i in range(count)]
+
+    def build_locations(location_count):
+        return [test_game.map.get_location(cell) for cell in cells[:location_count]]
+
+    def build_enemies(enemy_count):
+        return [test_game.enemy_mgr.create_basic_goblin(test_game.map.get_location(cell))
+                for cell in cells[:enemy_count]]
+
+    def build_items(item_count):
+        return [
+            gear.Gear('Rusty Gobbo Dagger', 'A rusty dagger that goblins use') if index % 2 == 0
+            else consumables.HealthPotion('Health Potion', 'Heals 2 health', 2)
+            for index in range(item_count)
+        ]
+
+    # Locations are measured first, so the enemy figure only counts the enemy and its drops
+    location_bytes = measure_allocated_bytes(build_locations, count)
+    enemy_bytes = measure_allocated_bytes(build_enemies, count)
+    item_bytes = measure_allocated_bytes(build_items, count)
+    return {'location': location_bytes, 'enemy': enemy_bytes, 'item': item_bytes}
+
+def main():
+    """
+    Print the bytes used per entity.
+    """
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    for entity, bytes_per_entity in measure_entity_memory(count).items():
+        print(f'{entity}: {bytes_per_entity:.0f} B')
+
+if __name__ == '__main__':
+    main()
@@ -2,36 +2,116 @@
 This module contains the MudGame class
 """
 
+import threading
 import time
 
 from player import PlayerCharacter
-from enemy import EnemyManager
-from world import Map
+from player_registry import PlayerRegistry
+from enemy import EnemyManager, ACTIVITY_RADIUS
+from population import DEFAULT_ENEMY_BUDGET
+from enemy_pool import DEFAULT_POOL_SIZE
+from rng_streams import RngStreams
+from world import Map, ChunkedMap
 from game_commands import CommandManager
 
 class MudGame():
     """
     MudGame class for handling the game logic.
     """
-    def __init__(self, name, size = (10, 10), game_bound_message_semaphore = None, player_bound_message_semaphore = None):
+    def __init__(self, name, size = (10, 10), game_bound_message_semaphore = None, player_bound_message_semaphore = None,
+                 chunk_size = None, generation_workers = 1, world_cache = None, build_in_background = False,
+                 vectorized_enemies = False, activity_radius = ACTIVITY_RADIUS, enemy_budget = DEFAULT_ENEMY_BUDGET,
+                 simulation_regions = None, simulation_workers = 1, pool_size = DEFAULT_POOL_SIZE,
+                 seed = None):
         print(f'Initializing game {name}')
+        self.startup_time = time.perf_counter()
+        self.startup_timings = {}
+        self.world_ready = threading.Event()
+        self.world_thread = None
+        # The exception a background world build failed with, None while it has not failed
+        self.world_error = None
+        # Seconds spent in each phase of the last tick, and in total over every tick
+        self.tick_timings = {}
+        self.tick_phase_totals = {}
+        self.tick_count = 0
         self.name = name
+        # Every random roll of the game comes from these streams, the same seed replays the same run
+        self.rng = RngStreams(seed)
         self.game_bound = game_bound_message_semaphore
         self.player_bound = player_bound_message_semaphore
         self.command_mgr = CommandManager()
-        self.players = []
+        # Players by user id and by name, iterating it goes through them in join order
+        self.players = PlayerRegistry()
         self.map_size = size
-        self.map = Map()
-        self.create_map(size)
-        self.enemy_mgr = EnemyManager(self)
-        self.enemy_mgr.initial_seed()
+        self.generation_workers = generation_workers
+        self.world_cache = world_cache
+        # With a chunk size the world is unbounded and size only sets the starting area
+        self.map = Map() if chunk_size is None else ChunkedMap(chunk_size)
+        self.enemy_mgr = EnemyManager(self, vectorized=vectorized_enemies, activity_radius=activity_radius,
+                                      enemy_budget=enemy_budget, simulation_regions=simulation_regions,
+                                      simulation_workers=simulation_workers, pool_size=pool_size)
         self.goblin_kills = 0
         self.orc_kills = 0
         self.troll_kills = 0
         self.dragon_kills = 0
+        if build_in_background:
+            # Players can join and get a loading response while the world is built
+            self.world_thread = threading.Thread(target=self.build_world_in_background, daemon=True)
+            self.world_thread.start()
+        else:
+            self.build_world()
+
+    def build_world(self):
+        """
+        Build the map and seed its enemies.
+        """
+        self.create_map(self.map_size)
+        self.enemy_mgr.initial_seed()
         self.update_shown_map()
-        print(f'Game {name} initialized successfully! 🎮')
-        
+        self.record_startup_timing('world_ready')
+        self.world_ready.set()
+        print(f'Game {self.name} initialized successfully! 🎮')
+
+    def build_world_in_background(self):
+        """
+        Build the world on the background thread, keeping any exception for commands to report.
+        A failed build still sets world_ready, so nothing waits on it forever.
+        """
+        try:
+            self.build_world()
+        except Exception as error:
+            print(f'Game {self.name} failed to build its world: {error!r}')
+            self.world_error = error
+            self.world_ready.set()
+
+    def wait_until_ready(self, timeout=None):
+        """
+        Wait for the world to finish building.
+        Returns True if the world is ready, False if it is still building or failed to build.
+        """
+        return self.world_ready.wait(timeout) and self.world_error is None
+
+    def record_startup_timing(self, milestone):
+        """
+        Record the seconds from construction to a startup milestone, the first time it is reached.
+        """
+        if milestone not in self.startup_timings:
+            self.startup_timings[milestone] = time.perf_counter() - self.startup_time
+            print(f'Game {self.name} reached {milestone} after {self.startup_timings[milestone]:.3f}s')
+
+    def check_world_ready(self):
+        """
+        Check if the world is ready to handle a command.
+        Returns None when it is, otherwise the message to respond with.
+        """
+        self.record_startup_timing('first_response')
+        if not self.world_ready.is_set():
+            return self.build_world_loading_msg()
+        if self.world_error is not None:
+            return self.build_world_failed_msg()
+        self.record_startup_timing('first_world_response')
+        return None
+
     def game_loop(self):
         """
         Game loop.
@@ -46,23 +126,36 @@ class MudGame():
         Input listener.
         """
         while True:
+            if not self.world_ready.is_set():
+                # Leave messages queued until the world is ready
+                time.sleep(0.1)
+                continue
             game_bound_messages = self.game_bound.get_all_messages()
             for msg in game_bound_messages:
                 #print(f'Game received message: {msg}')
-                message_array = msg.split(' ')
-                player_name = message_array[0]
-                player = self.get_player_by_name(player_name)
-                message_content = ' '.join(message_array[1:])
-                response = ""
-                if message_content.startswith('!'):
-                    response = self.test_cheats(player_name, message_content)
-                    #print(f'Response: {response}')
-                else:
-                    response = self.handle_input(player, message_content)
-                    #print(f'Response: {response}')
-                response += "\n" + player.get_prompt_status()
-                self.player_bound.add_message(response)
+                self.player_bound.add_message(self.handle_game_bound_message(msg))
             time.sleep(0.1)
+
+    def handle_game_bound_message(self, msg):
+        """
+        Handle one queued message, the user id of its player followed by the command.
+        Returns the response for the player.
+        """
+        message_array = msg.split(' ')
+        user_id = message_array[0]
+        player = self.players.get_by_id(user_id)
+        if player is None:
+            return self.build_player_not_found_msg(user_id)
+        message_content = ' '.join(message_array[1:])
+        # Cheats skip handle_input, so the world is checked here for both
+        loading_msg = self.check_world_ready()
+        if loading_msg is not None:
+            response = loading_msg
+        elif message_content.startswith('!'):
+            response = self.test_cheats(player.name, message_content)
+        else:
+            response = self.handle_input(player, message_content)
+        return response + "\n" + player.get_prompt_status()
         
     def update(self):
         """
@@ -70,28 +163,57 @@ class MudGame():
         Returns True if the game is still running, False if it has ended.
         """
         #print('Tick!')
-        self.enemy_mgr.update_enemies()
+        if self.world_ready.is_set():
+            # Enemies only change the map state, it is refreshed once in the render phase
+            self.run_tick_phase('enemies', lambda: self.enemy_mgr.update_enemies(defer_refresh=True))
+            self.run_tick_phase('render', self.update_shown_map)
+            self.tick_count += 1
         
         return True
+
+    def run_tick_phase(self, phase, action):
+        """
+        Run one phase of a tick, recording how long it took.
+        """
+        start = time.perf_counter()
+        action()
+        elapsed = time.perf_counter() - start
+        self.tick_timings[phase] = elapsed
+        self.tick_phase_totals[phase] = self.tick_phase_totals.get(phase, 0.0) + elapsed
+
+    def build_tick_timing_msg(self):
+        """
+        Build a report of the time spent in each tick phase, last tick and on average.
+        """
+        if self.tick_count == 0:
+            return 'No ticks have run yet ⏱️'
+        timing_msg = f'⏱️ Tick timings over {self.tick_count} ticks:\n'
+        for phase, elapsed in self.tick_timings.items():
+            average = self.tick_phase_totals[phase] / self.tick_count
+            timing_msg += f'{phase}: {elapsed * 1000:.2f}ms last, {average * 1000:.2f}ms average\n'
+        return timing_msg
     
     def teardown(self):
         """
         Teardown the game.
         """
         print('Tearing down game')
+        self.enemy_mgr.shutdown()
         
     def handle_input(self, player : PlayerCharacter, command_string : str):
         """
         Handle command input
         """
-     
+        loading_msg = self.check_world_ready()
+        if loading_msg is not None:
+            return loading_msg
         return self.command_mgr.execute_command(command_string, player)
 
     def create_map(self, size=(1,1)):
         """
         Create the game map.
         """
-        self.map.build_perlin_map_clamped_to_integers(size)
+        self.map.build_perlin_map_clamped_to_integers(size, workers=self.generation_workers, cache=self.world_cache)
 
     def update_shown_map(self):
         """
@@ -105,29 +227,77 @@ class MudGame():
         """
         return self.map.get_map_string()
 
+    def get_overview(self, max_size=16, center=None):
+        """
+        Get a bounded size overview of the whole game map.
+        Chunked maps show the area around the center, such as the asking player's position.
+        """
+        return self.map.get_overview_string(max_size, center)
+
     def is_playing(self, player_name):
         """
         Check if the player is playing the game.
         """
-        return player_name in [player.name for player in self.players]
+        return self.players.is_name_taken(player_name)
 
-    def add_player(self, player_name):
+    def add_player(self, player_name, user_id=None):
         """
         Add a player to the game.
+        The user id is the player's stable id on the chat platform, its name if not given.
         """
         if self.is_playing(player_name):
             return f'Player {player_name} is already in the game'
-        new_player = PlayerCharacter(player_name, self)
+        if user_id is None:
+            user_id = player_name
+        if self.players.get_by_id(user_id) is not None:
+            return f'User {user_id} is already in the game'
+        new_player = PlayerCharacter(player_name, self, user_id)
         print(f'Adding player {new_player.name} to the game')
-        self.players.append(new_player)
+        self.players.join(new_player)
         return new_player
 
+    def remove_player(self, player_name):
+        """
+        Remove a player from the game.
+        """
+        player = self.get_player_by_name(player_name)
+        if player is None:
+            return self.build_player_not_found_msg(player_name)
+        self.players.leave(player)
+        location = self.map.find_location(player.position)
+        if location is not None:
+            location.remove_content(player)
+        return f'{player_name} has left the game 👋'
+
+    def rename_player(self, user_id, new_name):
+        """
+        Rename the player with a user id, such as after a display name change.
+        Returns the player, or None if the user has not joined or the name is taken.
+        """
+        player = self.players.get_by_id(user_id)
+        if player is None or (new_name != player.name and self.is_playing(new_name)):
+            return None
+        self.players.rename(player, new_name)
+        return player
+
     def build_player_not_found_msg(self, player_name):
         """
         Build a message for a player not found.
         """
         return f'Player {player_name} not found in these players 🤷‍♂️ Have you joined?'
 
+    def build_world_loading_msg(self):
+        """
+        Build a message for commands that arrive before the world is ready.
+        """
+        return f'The world of {self.name} is still loading, try again in a moment ⏳'
+
+    def build_world_failed_msg(self):
+        """
+        Build a message for commands that arrive after the world failed to build.
+        """
+        return f'The world of {self.name} failed to load ({self.world_error}), ask an admin to restart the game ⚠️'
+
     def send_message_to_player(self, player, message):
         """
         Send a message to a player.
@@ -140,6 +310,7 @@ class MudGame():
     ############################
     ### Game command methods ###
     ############################
+    # These expect a built world, handle_input and the Discord interface check it before calling them
 
     def move_player(self, player_name, direction):
         """
@@ -190,11 +361,7 @@ class MudGame():
         Show the inventory of the player with the given name.
         Covered by PlayerCommand_Inventory
         """
-        player = None
-        for p in self.players:
-            if p.name == player_name:
-                player = p
-                break
+        player = self.get_player_by_name(player_name)
         if player is None:
             return self.build_player_not_found_msg(player_name)
 
@@ -236,13 +403,9 @@ class MudGame():
     
     def get_player_by_name(self, player_name):
         """
-        Get a player by name.
+        Get a player by name, or None if nobody by that name has joined.
         """
-        for player in self.players:
-            if player.name == player_name:
-                return player
-        print("Player not found")
-        return None
+        return self.players.get_by_name(player_name)
 
     def handle_player_death(self, player):
         """
@@ -275,5 +438,13 @@ class MudGame():
             max_health = player.max_health
             player.heal(max_health)
             cheat_response_msg = f'{player_name} has been healed to full health!'
+        elif requested_cheat == 'timings':
+            cheat_response_msg = self.build_tick_timing_msg()
+        elif requested_cheat == 'pool':
+            pool_metrics = self.enemy_mgr.get_pool_metrics()
+            cheat_response_msg = (
+                f'♻️ Enemy pool: {pool_metrics["size"]} free, {pool_metrics["hit_rate"]:.0%} hit rate '
+                f'({pool_metrics["hits"]} reused, {pool_metrics["misses"]} built)'
+            )
         
         return cheat_response_msg
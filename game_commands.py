@@ -3,6 +3,11 @@ from player import PlayerCharacter
 class CommandManager():
     def __init__(self):
         self.commands = []
+        # Every keyword, and every prefix only one command's keywords start with, mapped to its command
+        self.keyword_table = {}
+        self.prefix_table = {}
+        # Prefixes shared by keywords of different commands, mapped to those keywords
+        self.ambiguous_prefixes = {}
         self.register_commands()
         
     def register_commands(self):
@@ -17,30 +22,59 @@ class CommandManager():
         south_command = PlayerCommand_South()
         east_command = PlayerCommand_East()
         west_command = PlayerCommand_West()
+        overview_command = PlayerCommand_Overview()
         
-        self.commands.append(look_command)
-        self.commands.append(attack_command)
-        self.commands.append(stats_command)
-        self.commands.append(inventory_command)
-        self.commands.append(take_command)
-        self.commands.append(use_command)
-        self.commands.append(move_command)
-        self.commands.append(north_command)
-        self.commands.append(south_command)
-        self.commands.append(east_command)
-        self.commands.append(west_command)
-        
+        self.register_command(look_command)
+        self.register_command(attack_command)
+        self.register_command(stats_command)
+        self.register_command(inventory_command)
+        self.register_command(take_command)
+        self.register_command(use_command)
+        self.register_command(move_command)
+        self.register_command(north_command)
+        self.register_command(south_command)
+        self.register_command(east_command)
+        self.register_command(west_command)
+        self.register_command(overview_command)
+
+    def register_command(self, cmd):
+        self.commands.append(cmd)
+        for keyword in cmd.keywords:
+            # The first command registered with a keyword keeps it
+            self.keyword_table.setdefault(keyword, cmd)
+        # A new keyword can claim a prefix or make a unique one ambiguous
+        self.build_prefix_table()
+
+    def build_prefix_table(self):
+        prefix_commands = {}
+        prefix_keywords = {}
+        for keyword, cmd in self.keyword_table.items():
+            for end in range(1, len(keyword)):
+                prefix = keyword[:end]
+                prefix_commands.setdefault(prefix, set()).add(cmd)
+                prefix_keywords.setdefault(prefix, []).append(keyword)
+        self.prefix_table = {}
+        self.ambiguous_prefixes = {}
+        for prefix, cmds in prefix_commands.items():
+            if prefix in self.keyword_table:
+                continue
+            if len(cmds) == 1:
+                self.prefix_table[prefix] = next(iter(cmds))
+            else:
+                self.ambiguous_prefixes[prefix] = prefix_keywords[prefix]
+
     def execute_command(self, command, player : PlayerCharacter):
-        for cmd in self.commands:
-            # get the first word, even if its the only word
-            num_words = len(command.split())
-            first_word = command.split()[0]
-            args = []
-            if num_words > 1:
-                args = command.split()[1:]
-            if first_word in cmd.keywords:
-                return cmd.execute(player, args)
-                
+        words = command.split()
+        if not words:
+            return "Command not found"
+        first_word = words[0]
+        cmd = self.keyword_table.get(first_word)
+        if cmd is None:
+            cmd = self.prefix_table.get(first_word)
+        if cmd is not None:
+            return cmd.execute(player, words[1:])
+        if first_word in self.ambiguous_prefixes:
+            return f"Command {first_word} is ambiguous, did you mean {', '.join(self.ambiguous_prefixes[first_word])}?"
         return "Command not found"
         
 
@@ -164,3 +198,12 @@ class PlayerCommand_West(PlayerCommand_Move):
 
     def execute(self, player : PlayerCharacter, args : list[str]):
         return super().execute(player, ["west"])
+
+class PlayerCommand_Overview(PlayerCommand):
+    def __init__(self):
+        super().__init__()
+        self.keywords = ["map", "overview", "worldmap"]
+        self.args = []
+
+    def execute(self, player : PlayerCharacter, args : list[str]):
+        return player.game.get_overview(center=player.position)
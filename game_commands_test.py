@@ -0,0 +1,76 @@
+"""
+This module contains the command dispatch tests.
+"""
+
+import game
+import game_commands
+
+def test_command_manager_dispatches_keywords_and_unique_prefixes():
+    """
+    Test if full keywords and prefixes only one command starts with find that command.
+    """
+    # Arrange
+    command_mgr = game_commands.CommandManager()
+
+    # Act
+    inventory_by_prefix = command_mgr.prefix_table.get('inv')
+    south_by_keyword = command_mgr.keyword_table.get('s')
+    south_by_prefix = command_mgr.prefix_table.get('sou')
+
+    # Assert
+    assert isinstance(inventory_by_prefix, game_commands.PlayerCommand_Inventory)
+    assert isinstance(south_by_keyword, game_commands.PlayerCommand_South)
+    assert south_by_prefix is south_by_keyword
+    assert 's' not in command_mgr.prefix_table
+
+def test_command_manager_ambiguous_prefix_lists_keywords():
+    """
+    Test if a prefix shared by different commands is refused with the keywords it could mean.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game")
+    test_player = test_game.add_player("Tester")
+
+    # Act
+    ambiguous_msg = test_game.handle_input(test_player, 'ea')
+    unknown_msg = test_game.handle_input(test_player, 'dance')
+    empty_msg = test_game.handle_input(test_player, '   ')
+
+    # Assert
+    assert 'eat' in ambiguous_msg and 'east' in ambiguous_msg
+    assert unknown_msg == 'Command not found'
+    assert empty_msg == 'Command not found'
+
+def test_command_manager_abbreviated_command_runs_with_arguments():
+    """
+    Test if an abbreviated command gets the rest of the input as its arguments.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game")
+    test_player = test_game.add_player("Tester")
+    start_position = test_player.position
+
+    # Act
+    test_game.handle_input(test_player, 'mov south')
+
+    # Assert
+    assert test_player.position == (start_position[0] + 1, start_position[1])
+
+def test_command_manager_command_registered_later_resolves_by_prefix():
+    """
+    Test if a command registered after startup is found by prefix and makes shared prefixes ambiguous.
+    """
+    # Arrange
+    command_mgr = game_commands.CommandManager()
+    unique_before = 'st' in command_mgr.prefix_table
+    dance_command = game_commands.PlayerCommand()
+    dance_command.keywords = ['dance', 'stomp']
+
+    # Act
+    command_mgr.register_command(dance_command)
+
+    # Assert
+    assert command_mgr.prefix_table.get('dan') is dance_command
+    assert unique_before is True
+    assert 'st' not in command_mgr.prefix_table
+    assert 'stomp' in command_mgr.ambiguous_prefixes['st'] and 'stats' in command_mgr.ambiguous_prefixes['st']
@@ -2,6 +2,8 @@
 This module contains the game testing logic.
 """
 
+import threading
+
 import game
 import gear
 import consumables
@@ -159,10 +161,243 @@ def test_enemy_can_move():
     test_game.create_map((10, 10))
     coordinates = (5, 5)
     location = test_game.map.map_location_data[coordinates[0]][coordinates[1]]
-    test_game.enemy_mgr.create_basic_goblin(location)
+    goblin = test_game.enemy_mgr.create_basic_goblin(location)
+
+    # Act
+    goblin.move('north')
+
+    # Assert
+    assert goblin.location != location
+
+def test_game_chunked_world_player_moves_past_starting_area():
+    """
+    Test if a player in a chunked world can walk across chunk borders and out of the starting area.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game", size=(4, 4), chunk_size=(3, 3))
+    tester_name = "Tester"
+    test_player = test_game.add_player(tester_name)
+
+    # Act
+    for _ in range(6):
+        move_msg = test_game.move_player(tester_name, "south")
+    surroundings = test_game.show_player_surroundings(tester_name)
+
+    # Assert
+    assert move_msg == 'You move south'
+    assert test_player.position == (8, 2)
+    assert test_game.map.get_location(test_player.position).contents[-1] is test_player
+    assert surroundings is not None
+
+def test_game_background_build_answers_loading_until_ready(monkeypatch):
+    """
+    Test if commands get a loading response until a background world build finishes.
+    """
+    # Arrange
+    release_build = threading.Event()
+    original_create_map = game.MudGame.create_map
+    def slow_create_map(self, size=(1, 1)):
+        release_build.wait(10)
+        original_create_map(self, size)
+    monkeypatch.setattr(game.MudGame, 'create_map', slow_create_map)
+    test_game = game.MudGame("Test Game", build_in_background=True)
+    test_player = test_game.add_player("Tester")
+
+    # Act
+    loading_msg = test_game.handle_input(test_player, 'look')
+    release_build.set()
+    test_game.wait_until_ready(timeout=10)
+    ready_msg = test_game.handle_input(test_player, 'look')
+
+    # Assert
+    assert loading_msg == test_game.build_world_loading_msg()
+    assert ready_msg != loading_msg
+
+def test_game_background_build_failure_is_reported(monkeypatch):
+    """
+    Test if a background world build that raises answers commands with its error instead of loading forever.
+    """
+    # Arrange
+    def failing_create_map(self, size=(1, 1)):
+        raise OSError('disk full')
+    monkeypatch.setattr(game.MudGame, 'create_map', failing_create_map)
+    test_game = game.MudGame("Test Game", build_in_background=True)
+    test_player = test_game.add_player("Tester")
+
+    # Act
+    ready = test_game.wait_until_ready(timeout=10)
+    failed_msg = test_game.handle_input(test_player, 'look')
+
+    # Assert
+    assert ready is False
+    assert isinstance(test_game.world_error, OSError)
+    assert failed_msg == test_game.build_world_failed_msg()
+    assert 'disk full' in failed_msg
+
+def test_game_records_startup_timings():
+    """
+    Test if the game records how long it took to build the world and respond.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game", build_in_background=True)
+    test_player = test_game.add_player("Tester")
+    test_game.wait_until_ready(timeout=10)
+
+    # Act
+    test_game.handle_input(test_player, 'stats')
+
+    # Assert
+    assert test_game.startup_timings['world_ready'] > 0
+    assert test_game.startup_timings['first_response'] >= test_game.startup_timings['world_ready']
+    assert 'first_world_response' in test_game.startup_timings
+
+def test_game_overview_shows_enemy_after_it_arrives():
+    """
+    Test if the world overview picks up enemies as they are added to the map.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game", size=(64, 64))
+    test_game.get_overview()
+    location = test_game.map.get_location((40, 40))
+
+    # Act
+    test_game.enemy_mgr.create_boss_dragon(location)
+    test_game.update_shown_map()
+    overview = test_game.get_overview(max_size=8)
+
+    # Assert
+    assert '🐉' in overview
+
+def test_game_attack_second_goblin_by_ordinal():
+    """
+    Test if a player can pick which of two goblins to attack.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game")
+    tester_name = "Tester"
+    test_player = test_game.add_player(tester_name)
+    location = test_game.map.get_location(test_player.position)
+    for enemy in list(location.get_enemies()):
+        location.remove_content(enemy)
+    first_goblin = test_game.enemy_mgr.create_basic_goblin(location)
+    second_goblin = test_game.enemy_mgr.create_basic_goblin(location)
+    second_goblin.health = 5
+
+    # Act
+    test_game.attack_enemy(tester_name, "goblin.2")
+
+    # Assert
+    assert first_goblin.health == 1
+    assert second_goblin.health == 4
+
+def test_game_entities_have_no_instance_dict():
+    """
+    Test if locations, characters and items are slotted, without a per-instance __dict__.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game")
+    test_player = test_game.add_player("Tester")
+    location = test_game.map.get_location((1, 1))
+    goblin = test_game.enemy_mgr.create_basic_goblin(location)
+    entities = [
+        location, test_player, goblin, goblin.drops[0], location.biome,
+        consumables.HealthPotion("Health Potion", "A restorative potion.", 2),
+        consumables.BarkSkinPotion("Bark Skin Potion", "A protective potion.", 2)
+    ]
+
+    # Act
+    with_dict = [type(entity).__name__ for entity in entities if hasattr(entity, '__dict__')]
+
+    # Assert
+    assert with_dict == []
+
+def test_game_update_refreshes_map_once_per_tick():
+    """
+    Test if a tick refreshes the shown map once, however many enemies move.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game", size=(20, 20), activity_radius=None)
+    test_game.enemy_mgr.spawn_many('goblin', 30)
+    refreshes = []
+    original_update_shown_map = test_game.update_shown_map
+    def counting_update_shown_map():
+        refreshes.append(True)
+        original_update_shown_map()
+    test_game.update_shown_map = counting_update_shown_map
+
+    # Act
+    test_game.update()
+
+    # Assert
+    assert len(refreshes) == 1
+    assert len(test_game.map.dirty_cells) == 0
+
+def test_game_update_records_phase_timings():
+    """
+    Test if a tick records how long its enemy and render phases took, and the cheat reports them.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game")
+    tester_name = "Tester"
+    test_game.add_player(tester_name)
+
+    # Act
+    test_game.update()
+    test_game.update()
+    timing_msg = test_game.test_cheats(tester_name, '!cheat timings')
+
+    # Assert
+    assert list(test_game.tick_timings) == ['enemies', 'render']
+    assert test_game.tick_count == 2
+    assert 'over 2 ticks' in timing_msg
+    assert 'render:' in timing_msg
+
+def test_game_rename_player_follows_user_id():
+    """
+    Test if a player renamed by user id answers to the new name only.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game")
+    test_player = test_game.add_player("Tester", user_id=42)
+
+    # Act
+    renamed_player = test_game.rename_player(42, "Renamed Tester")
+
+    # Assert
+    assert renamed_player is test_player
+    assert test_game.get_player_by_name("Renamed Tester") is test_player
+    assert test_game.is_playing("Tester") is False
+
+def test_game_remove_player_leaves_game():
+    """
+    Test if a player who leaves is no longer playing and can join again.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game")
+    test_game.add_player("Tester")
+
+    # Act
+    test_game.remove_player("Tester")
+    rejoined_player = test_game.add_player("Tester")
+
+    # Assert
+    assert test_game.get_player_by_name("Tester") is rejoined_player
+    assert len(test_game.players) == 1
+
+def test_game_bound_message_finds_player_by_user_id():
+    """
+    Test if a queued message is answered for the player with its user id, and an unknown id gets a not found reply.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game")
+    test_player = test_game.add_player("Tester", user_id="1001")
+    test_game.rename_player("1001", "Renamed Tester")
 
     # Act
-    test_game.enemy_mgr.enemies[0].move('north')
+    response = test_game.handle_game_bound_message("1001 stats")
+    missing_response = test_game.handle_game_bound_message("2002 stats")
 
     # Assert
-    assert test_game.enemy_mgr.enemies[0].location != location
\ No newline at end of file
+    assert 'Renamed Tester' in response
+    assert response.endswith(test_player.get_prompt_status())
+    assert missing_response == test_game.build_player_not_found_msg("2002")
@@ -4,7 +4,13 @@ Module for providing locationcontent description builder base class access
 from location import LocationContent
 
 class Gear(LocationContent):
-    """ Base class for gear items. """
+    """ Base class for gear items.
+    Offense adds to the wearer's attack. Defense has two effects: it raises
+    max health, as gear always has, and it also mitigates damage through the
+    wearer's stat block. """
+    content_kind = 'gear'
+    __slots__ = ('offense', 'defense')
+
     def __init__(self, name, description):
         super().__init__()
         self.icon = '🛡️'
@@ -16,7 +22,9 @@ class Gear(LocationContent):
     def apply_stats(self, player):
         """ Apply the stats of the gear to the player. """
         player.max_health += self.defense
+        player.stats.add_modifier(self, {'attack': self.offense, 'defense': self.defense})
 
     def remove_stats(self, player):
         """ Remove the stats of the gear from the player."""
         player.max_health -= self.defense
+        player.stats.remove_modifier(self)
@@ -2,10 +2,24 @@
 This module defines Locations and LocationContents in the game.
 """
 
+import copy
+
+from name_index import NameIndex
+
+# Shared stand-in for a kind a location has never held, never modified
+NO_CONTENTS = {}
+
+# The kinds of content that count as characters, which keep their map chunk loaded
+CHARACTER_KINDS = ('player', 'enemy')
+
 class LocationContent():
     """
     Represents the content of a location.
+    Subclasses set content_kind so locations can sort them without isinstance checks.
     """
+    content_kind = 'other'
+    __slots__ = ('name', 'icon', 'description', 'biome')
+
     def __init__(self):
         """
         Initializes a new LocationContent instance.
@@ -15,6 +29,12 @@ class LocationContent():
         self.description = ''
         self.biome = None
 
+    def clone(self):
+        """
+        Returns a copy of this content, for contents used as prototypes.
+        """
+        return copy.copy(self)
+
     def location_display(self):
         """
         Returns the display string for the location.
@@ -31,6 +51,10 @@ class Location():
     """
     Represents a location.
     """
+    __slots__ = (
+        'name', 'description', 'default_icon', 'map_icon', 'content_index', 'contents_by_kind',
+        'name_index', 'coordinates', 'biome', 'top_content', 'world_map'
+    )
 
     def __init__(self, name, description, coordinates=(0, 0), biome=None):
         """
@@ -40,34 +64,105 @@ class Location():
         self.description = description
         self.default_icon = '🟦'
         self.map_icon = biome.icon if biome is not None else self.default_icon
-        self.contents = []
+        # Contents keyed by object identity, in the order they arrived
+        self.content_index = {}
+        # Contents split by kind, kept in sync with content_index by add_content and remove_content.
+        # A kind only gets its own dict once the location has held something of that kind.
+        self.contents_by_kind = {}
+        # Built on the first lookup, most locations are never searched by name
+        self.name_index = None
         self.coordinates = coordinates
         self.biome = biome
+        self.top_content = None
+        # The map this location belongs to, told whenever the contents change
+        self.world_map = None
 
     def add_content(self, content):
         """
         Adds content to the location.
         """
-        self.contents.append(content)
+        self.content_index[id(content)] = content
+        self.contents_by_kind.setdefault(content.content_kind, {})[id(content)] = content
+        if self.name_index is not None:
+            self.name_index.add(content)
+        if self.top_content is None or get_display_priority(content) > get_display_priority(self.top_content):
+            self.top_content = content
+        if content.content_kind in CHARACTER_KINDS and self.world_map is not None:
+            self.world_map.count_characters(1)
+        self.mark_dirty()
 
     def remove_content(self, content):
         """
-        Removes content from the location.
+        Removes this exact content from the location, not just one with the same name.
+        """
+        removed = self.content_index.pop(id(content), None)
+        if removed is None:
+            return
+        del self.contents_by_kind[removed.content_kind][id(removed)]
+        if self.name_index is not None:
+            self.name_index.remove(removed)
+        if removed is self.top_content:
+            self.top_content = self.find_top_content()
+        if removed.content_kind in CHARACTER_KINDS and self.world_map is not None:
+            self.world_map.count_characters(-1)
+        self.mark_dirty()
+
+    def refresh_content(self, content):
+        """
+        Re-rates a content whose display priority changed, such as a damaged enemy.
+        """
+        if id(content) not in self.content_index:
+            return
+        self.top_content = self.find_top_content()
+        self.mark_dirty()
+
+    def find_content(self, query, kinds=None):
+        """
+        Finds the content a player means by name, e.g. "gob" or "goblin.2".
+        Optionally only contents of the given kinds are matched.
+        """
+        if self.name_index is None:
+            self.name_index = NameIndex()
+            for content in self.content_index.values():
+                self.name_index.add(content)
+        return self.name_index.find(query, kinds)
+
+    def has_content(self, content):
+        """
+        Checks if this exact content is in the location.
+        """
+        return id(content) in self.content_index
+
+    @property
+    def contents(self):
+        """
+        The contents of the location, in the order they arrived.
+        """
+        return list(self.content_index.values())
+
+    def find_top_content(self):
+        """
+        Finds the content that should be shown on the map, the first of the highest priority.
+        """
+        top_content = None
+        for c in self.content_index.values():
+            if top_content is None or get_display_priority(c) > get_display_priority(top_content):
+                top_content = c
+        return top_content
+
+    def mark_dirty(self):
+        """
+        Tells the map this location belongs to that its icon needs refreshing.
         """
-        for c in self.contents:
-            if c.name == content.name:
-                #print(f'Removing {c.name} from {self.name}')
-                self.contents.remove(c)
-                #remaining_content = self.build_content_string()
-                #print(f'Contents remaining: {remaining_content}')
-                break
+        if self.world_map is not None:
+            self.world_map.mark_dirty(self.coordinates)
 
     def build_content_string(self):
         """
         Builds a string representation of the location's contents.
         """
         content_str = ''
-        for c in self.contents:
+        for c in self.content_index.values():
             content_str += c.location_display() + '\n'
         return content_str
 
@@ -75,7 +170,7 @@ class Location():
         """
         Checks if the location has contents.
         """
-        return len(self.contents) > 0
+        return len(self.content_index) > 0
 
     def get_contents(self):
         """
@@ -87,28 +182,72 @@ class Location():
         """
         Checks if the location has enemies.
         """
-        from enemy import Enemy
-
-        for c in self.contents:
-            if isinstance(c, Enemy):
-                return True
-        return False
+        return len(self.contents_by_kind.get('enemy', NO_CONTENTS)) > 0
 
     def get_enemies(self):
         """
         Returns the enemies in the location.
+        This is a live view of the location's own collection, not a copy.
+        """
+        return self.contents_by_kind.get('enemy', NO_CONTENTS).values()
+
+    def count_enemies(self):
+        """
+        Counts the enemies in the location.
+        """
+        return len(self.contents_by_kind.get('enemy', NO_CONTENTS))
+
+    def has_players(self):
+        """
+        Checks if the location has players.
+        """
+        return len(self.contents_by_kind.get('player', NO_CONTENTS)) > 0
+
+    def get_players(self):
+        """
+        Returns the players in the location.
+        This is a live view of the location's own collection, not a copy.
+        """
+        return self.contents_by_kind.get('player', NO_CONTENTS).values()
+
+    def count_players(self):
         """
-        from enemy import Enemy
+        Counts the players in the location.
+        """
+        return len(self.contents_by_kind.get('player', NO_CONTENTS))
+
+    def get_gear(self):
+        """
+        Returns the gear in the location.
+        This is a live view of the location's own collection, not a copy.
+        """
+        return self.contents_by_kind.get('gear', NO_CONTENTS).values()
+
+    def get_consumables(self):
+        """
+        Returns the consumables in the location.
+        This is a live view of the location's own collection, not a copy.
+        """
+        return self.contents_by_kind.get('consumable', NO_CONTENTS).values()
 
-        enemies = []
-        for c in self.contents:
-            if isinstance(c, Enemy):
-                enemies.append(c)
-        return enemies
+    def has_characters(self):
+        """
+        Checks if the location has players or enemies.
+        """
+        return self.has_enemies() or self.has_players()
 
     def send_message_to_contents(self, message):
         """
         Sends a message to the contents of the location.
         """
-        for c in self.contents:
+        for c in self.content_index.values():
             c.receive_message(message)
+
+def get_display_priority(content):
+    """
+    Gets how strongly a content competes for its location's map icon.
+    Enemies beat everything else, and stronger enemies beat weaker ones.
+    """
+    if content.content_kind == 'enemy':
+        return 1 + content.get_attack_damage() + content.health
+    return 0
@@ -1,8 +1,19 @@
 """
 This module contains the location testing logic.
 """
+import game
 import location
 import gear
+import consumables
+
+def get_empty_location(test_game, coordinates):
+    """
+    Get a location of the game map with any randomly placed contents cleared out.
+    """
+    test_location = test_game.map.get_location(coordinates)
+    for content in test_location.contents:
+        test_location.remove_content(content)
+    return test_location
 
 def test_location_contents_add_has_one_element():
     """
@@ -67,3 +78,143 @@ def test_location_contents_remove_gear_has_no_elements():
 
     # Assert
     assert test_location.has_contents() is False
+
+def test_location_top_content_prefers_strongest_enemy():
+    """
+    Test case for the map icon priority of a location's contents.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game")
+    test_location = get_empty_location(test_game, (1, 1))
+    gear_item = gear.Gear("Test Gear", "A test gear item")
+    test_location.add_content(gear_item)
+    goblin = test_game.enemy_mgr.create_basic_goblin(test_location)
+    troll = test_game.enemy_mgr.create_advanced_troll(test_location)
+
+    # Act
+    top_with_troll = test_location.top_content
+    test_location.remove_content(troll)
+    top_without_troll = test_location.top_content
+
+    # Assert
+    assert top_with_troll is troll
+    assert top_without_troll is goblin
+
+def test_location_damaged_enemy_loses_top_content():
+    """
+    Test case for a badly damaged enemy giving up the map icon and marking its cell dirty.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game")
+    test_location = get_empty_location(test_game, (1, 1))
+    test_player = test_game.add_player("Tester")
+    orc = test_game.enemy_mgr.create_intermediate_orc(test_location)
+    troll = test_game.enemy_mgr.create_advanced_troll(test_location)
+    test_game.update_shown_map()
+
+    # Act
+    troll.receive_damage(test_player, 4)
+
+    # Assert
+    assert test_location.top_content is orc
+    assert (1, 1) in test_game.map.dirty_cells
+
+def test_location_add_content_marks_map_cell_dirty():
+    """
+    Test case for a location telling its map which cell changed.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game")
+    test_location = get_empty_location(test_game, (2, 3))
+    test_game.update_shown_map()
+    gear_item = gear.Gear("Test Gear", "A test gear item")
+
+    # Act
+    test_location.add_content(gear_item)
+
+    # Assert
+    assert test_game.map.dirty_cells == {(2, 3)}
+
+def test_location_sorts_contents_by_kind():
+    """
+    Test case for a location keeping enemies, players, gear and consumables apart.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game")
+    test_location = get_empty_location(test_game, (3, 3))
+    test_player = test_game.add_player("Tester")
+    gear_item = gear.Gear("Test Gear", "A test gear item")
+    potion = consumables.HealthPotion("Health Potion", "A restorative potion.", 2)
+
+    # Act
+    test_location.add_content(gear_item)
+    test_location.add_content(potion)
+    test_location.add_content(test_player)
+    goblin = test_game.enemy_mgr.create_basic_goblin(test_location)
+
+    # Assert
+    assert list(test_location.get_enemies()) == [goblin]
+    assert list(test_location.get_players()) == [test_player]
+    assert list(test_location.get_gear()) == [gear_item]
+    assert list(test_location.get_consumables()) == [potion]
+    assert test_location.count_enemies() == 1
+
+def test_location_remove_content_updates_kind():
+    """
+    Test case for removed contents leaving their kind's collection.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game")
+    test_location = get_empty_location(test_game, (3, 3))
+    goblin = test_game.enemy_mgr.create_basic_goblin(test_location)
+
+    # Act
+    enemies_view = test_location.get_enemies()
+    test_location.remove_content(goblin)
+
+    # Assert
+    assert test_location.has_enemies() is False
+    assert len(enemies_view) == 0
+
+def test_location_remove_content_removes_exact_object():
+    """
+    Test case for removing one of two contents that share a name.
+    """
+    # Arrange
+    test_location = location.Location("Test Location", "A test location")
+    first_gear = gear.Gear("Test Gear", "The first test gear item")
+    second_gear = gear.Gear("Test Gear", "The second test gear item")
+    third_gear = gear.Gear("Other Gear", "The third test gear item")
+    test_location.add_content(first_gear)
+    test_location.add_content(second_gear)
+    test_location.add_content(third_gear)
+
+    # Act
+    test_location.remove_content(second_gear)
+
+    # Assert
+    assert test_location.contents == [first_gear, third_gear]
+    assert test_location.has_content(second_gear) is False
+    assert test_location.has_content(first_gear) is True
+
+def test_location_find_content_tracks_changes_around_first_lookup():
+    """
+    Test case for finding contents by name before and after the name index is first built.
+    """
+    # Arrange
+    test_location = location.Location("Test Location", "A test location")
+    first_gear = gear.Gear("Test Gear", "The first test gear item")
+    second_gear = gear.Gear("Test Gear", "The second test gear item")
+    test_location.add_content(first_gear)
+    test_location.add_content(second_gear)
+
+    # Act
+    found_before = test_location.find_content("gear.2")
+    test_location.remove_content(first_gear)
+    third_gear = gear.Gear("Test Gear", "The third test gear item")
+    test_location.add_content(third_gear)
+    found_after = test_location.find_content("gear.2")
+
+    # Assert
+    assert found_before is second_gear
+    assert found_after is third_gear
@@ -15,7 +15,6 @@ Main Flow:
 """
 
 import os
-import random
 
 from discord.ext import commands
 import discord.utils
@@ -79,8 +78,11 @@ async def playgame(context):
 
     await context.send("Adding you to the game... 🎮")
 
-    if game_bot.game.is_playing(context.author.name) is False:
+    # Players are found by member id, so a member who changed their name is renamed, not joined twice
+    if game_bot.game.players.get_by_id(context.author.id) is None:
         game_bot.joingame(context)
+    else:
+        game_bot.get_player_name(context.author)
 
     connected_players = [player.name for player in game_bot.game.players]
     connected_players_string = (
@@ -100,12 +102,10 @@ async def playgame(context):
 @game_bot.command(name='rolldice', help='Rolls some dice')
 async def roll_dice(context, number_of_dice: int, number_of_sides: int):
     """ Command to roll some dice. """
-    dice = (
-        str(random.choice(range(1, number_of_sides + 1)))
-        for _ in range(number_of_dice)
-    )
-    await context.send(', '.join(dice))
-    await context.send(f'Total: {sum(int(die) for die in dice)}')
+    dice_stream = game_bot.game.rng.dice
+    dice = [dice_stream.randint(1, number_of_sides) for _ in range(number_of_dice)]
+    await context.send(', '.join(str(die) for die in dice))
+    await context.send(f'Total: {sum(dice)}')
 
 @game_bot.command(name='createchannel', help='Creates a new channel')
 @commands.has_role('admin')
@@ -146,6 +146,20 @@ async def move(context, direction : str):
     await member.send(move_msg)
     await member.send(game_bot.show_player_surroundings(context))
 
+@game_bot.command(name='worldmap', help='Show an overview of the whole world')
+async def world_map(context):
+    """ Command to show an overview of the whole world. """
+    wrong_channel_msg = 'You must use DMs for this command.'
+    if not isinstance(context.channel, discord.DMChannel):
+        # send the user a DM directing them to the game channel
+        await context.author.create_dm()
+        await context.author.dm_channel.send(
+            f'Hi {context.author.name}, {wrong_channel_msg}'
+        )
+        return
+    member = game_bot.get_player_discord_member(context.author.name)
+    await member.send(game_bot.show_overview(context))
+
 @game_bot.command(name='showmap', help='Show the map')
 async def show_map(context):
     """ Command to show the map. """
@@ -264,7 +278,9 @@ async def test_cheats(context):
         return
     member = game_bot.get_player_discord_member(context.author.name)
     await member.send("Testing cheats...")
-    game_bot.game.test_cheats(context.author.name, context.message.content)
+    cheat_msg = game_bot.test_cheats(context)
+    if cheat_msg:
+        await member.send(cheat_msg)
     await member.send(game_bot.show_player_surroundings(context))
 
 #######################################################
@@ -72,7 +72,7 @@ def main_local():
         while local_game.update():
             user_input = input(">")
             #print("Adding message")
-            game_bound.add_message(local_player.name + " " + user_input)
+            game_bound.add_message(f'{local_player.user_id} {user_input}')
     except KeyboardInterrupt:
         print ("Keyboard interrupt detected")
     except Exception as e:
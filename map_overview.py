@@ -0,0 +1,99 @@
+"""
+This module contains the level-of-detail pyramid used for whole-map overviews.
+Each level halves the map in both directions, keeping the majority biome and
+the highest threat of the cells it covers.
+"""
+
+import numpy as np
+
+class MapPyramid():
+    """
+    This class represents a downsampled pyramid of a map's biome grid.
+
+    Attributes:
+        biome_levels (list): The majority biome index grid of each level.
+        threat_levels (list): The max threat grid of each level.
+        icon_levels (list): The icon of the cell each max threat came from, per level.
+    """
+
+    def __init__(self, biome_indexes, biome_count):
+        """
+        Builds every level of the pyramid from a biome grid.
+
+        Args:
+            biome_indexes (numpy.ndarray): The full resolution biome index grid.
+            biome_count (int): The number of biomes the indexes refer to.
+        """
+        self.biome_levels = [np.asarray(biome_indexes)]
+        self.threat_levels = [np.zeros(self.biome_levels[0].shape, dtype=np.int32)]
+        self.icon_levels = [np.full(self.biome_levels[0].shape, None, dtype=object)]
+
+        # Counts are carried up the levels so every majority is exact, not a majority of majorities
+        biome_counts = np.stack([self.biome_levels[0] == index for index in range(biome_count)]).astype(np.int32)
+        while max(biome_counts.shape[1:]) > 1:
+            biome_counts = downsample(biome_counts, np.sum)
+            self.biome_levels.append(np.argmax(biome_counts, axis=0).astype(np.uint8))
+            self.threat_levels.append(downsample(self.threat_levels[-1][np.newaxis], np.max)[0])
+            self.icon_levels.append(np.full(self.threat_levels[-1].shape, None, dtype=object))
+
+    def update_threat(self, cell, threat, icon=None):
+        """
+        Set the threat of one full resolution cell and update the levels above it.
+
+        Args:
+            cell (tuple): The (row, col) index of the cell in the full resolution grid.
+            threat (int): The cell's new threat rating, 0 if it holds no enemies.
+            icon (str): The icon the cell shows.
+        """
+        row, col = cell
+        self.threat_levels[0][row, col] = threat
+        self.icon_levels[0][row, col] = icon
+        for level in range(1, len(self.threat_levels)):
+            row //= 2
+            col //= 2
+            children = self.threat_levels[level - 1][2 * row:2 * row + 2, 2 * col:2 * col + 2]
+            # The icon travels up with the max, so equal threats never swap icons
+            child_row, child_col = divmod(int(children.argmax()), children.shape[1])
+            self.threat_levels[level][row, col] = children[child_row, child_col]
+            self.icon_levels[level][row, col] = self.icon_levels[level - 1][2 * row + child_row, 2 * col + child_col]
+
+    def get_level_for_size(self, max_size):
+        """
+        Get the most detailed level that fits within max_size cells in both directions.
+        """
+        for level, biome_level in enumerate(self.biome_levels):
+            if max(biome_level.shape) <= max_size:
+                return level
+        return len(self.biome_levels) - 1
+
+    def get_overview_string(self, biome_icons, max_size=16):
+        """
+        Get an overview of the whole map that fits within max_size cells in both directions.
+        Cells with enemies show the icon of the biggest threat, the rest show their majority biome.
+
+        Args:
+            biome_icons (list): The icon of each biome index.
+            max_size (int): The most cells the overview may have in either direction.
+        """
+        level = self.get_level_for_size(max_size)
+        overview_str = ''
+        for biome_row, threat_row, icon_row in zip(
+            self.biome_levels[level].tolist(), self.threat_levels[level].tolist(), self.icon_levels[level].tolist()
+        ):
+            icons = [
+                icon if threat > 0 and icon is not None else biome_icons[biome_index]
+                for biome_index, threat, icon in zip(biome_row, threat_row, icon_row)
+            ]
+            overview_str += ' '.join(icons) + '\n'
+        return overview_str
+
+
+def downsample(grids, reduce):
+    """
+    Halve a stack of grids in both directions, combining each 2x2 block with reduce.
+    Odd edges are padded with zeros, which neither adds to counts nor raises a max.
+    """
+    depth, rows, cols = grids.shape
+    padded = np.pad(grids, ((0, 0), (0, rows % 2), (0, cols % 2)))
+    blocks = padded.reshape(depth, padded.shape[1] // 2, 2, padded.shape[2] // 2, 2)
+    return reduce(blocks, axis=(2, 4))
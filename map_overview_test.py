@@ -0,0 +1,73 @@
+"""
+This module contains the map overview testing logic.
+"""
+import numpy as np
+
+import map_overview
+
+def test_map_overview_levels_halve_the_map():
+    """
+    Test if each pyramid level halves the map, rounding up.
+    """
+    # Arrange
+    biome_indexes = np.zeros((9, 5), dtype=np.uint8)
+
+    # Act
+    pyramid = map_overview.MapPyramid(biome_indexes, 5)
+
+    # Assert
+    assert [level.shape for level in pyramid.biome_levels] == [(9, 5), (5, 3), (3, 2), (2, 1), (1, 1)]
+
+def test_map_overview_keeps_majority_biome():
+    """
+    Test if downsampled cells keep the most common biome of the cells they cover.
+    """
+    # Arrange
+    biome_indexes = np.array([
+        [1, 1, 2, 2],
+        [1, 3, 2, 0],
+        [4, 4, 0, 0],
+        [4, 1, 0, 3],
+    ], dtype=np.uint8)
+
+    # Act
+    pyramid = map_overview.MapPyramid(biome_indexes, 5)
+
+    # Assert
+    assert pyramid.biome_levels[1].tolist() == [[1, 2], [4, 0]]
+    assert pyramid.biome_levels[2].tolist() == [[0]]
+
+def test_map_overview_threat_updates_incrementally():
+    """
+    Test if raising and clearing a cell's threat updates every level above it.
+    """
+    # Arrange
+    pyramid = map_overview.MapPyramid(np.zeros((8, 8), dtype=np.uint8), 5)
+    pyramid.update_threat((5, 6), 3, '👺')
+    pyramid.update_threat((0, 0), 30, '🐉')
+
+    # Act
+    top_threat_before = int(pyramid.threat_levels[-1][0, 0])
+    pyramid.update_threat((0, 0), 0)
+    top_threat_after = int(pyramid.threat_levels[-1][0, 0])
+
+    # Assert
+    assert top_threat_before == 30
+    assert top_threat_after == 3
+    assert int(pyramid.threat_levels[2][1, 1]) == 3
+
+def test_map_overview_equal_threats_keep_their_own_icons():
+    """
+    Test if two cells with the same threat each show their own icon rather than the last one written.
+    """
+    # Arrange
+    pyramid = map_overview.MapPyramid(np.zeros((4, 4), dtype=np.uint8), 5)
+    biome_icons = ['🟩'] * 5
+
+    # Act
+    pyramid.update_threat((0, 0), 5, '👹')
+    pyramid.update_threat((3, 3), 5, '🧌')
+    overview_rows = pyramid.get_overview_string(biome_icons, max_size=2).splitlines()
+
+    # Assert
+    assert overview_rows == ['👹 🟩', '🟩 🧌']
@@ -0,0 +1,110 @@
+"""
+This module contains the name index used to resolve what players type into targets.
+Names are indexed by the lowercased suffixes of their words in a sorted table,
+so a lookup is a binary search for the typed prefix.
+"""
+
+import bisect
+import functools
+
+class NameIndex():
+    """
+    This class represents a sorted prefix table over item names.
+
+    Typing the start of any word in a name finds it, so "gob", "dagger" and
+    "gobbo dagger" all find a "Rusty Gobbo Dagger". Matches are ordered by when
+    the items were added, and "goblin.2" picks the second matching goblin.
+    """
+    __slots__ = ('entries', 'items_by_order', 'orders_by_id', 'next_order')
+
+    def __init__(self):
+        self.entries = []
+        self.items_by_order = {}
+        self.orders_by_id = {}
+        self.next_order = 0
+
+    def __len__(self):
+        return len(self.items_by_order)
+
+    def add(self, item):
+        """
+        Add an item to the index under its current name.
+        """
+        order = self.next_order
+        self.next_order += 1
+        self.items_by_order[order] = item
+        self.orders_by_id[id(item)] = (order, get_name_keys(item.name))
+        for key in self.orders_by_id[id(item)][1]:
+            bisect.insort(self.entries, (key, order))
+
+    def remove(self, item):
+        """
+        Remove an item from the index.
+        """
+        indexed = self.orders_by_id.pop(id(item), None)
+        if indexed is None:
+            return
+        order, keys = indexed
+        del self.items_by_order[order]
+        for key in keys:
+            position = bisect.bisect_left(self.entries, (key, order))
+            del self.entries[position]
+
+    def clear(self):
+        """
+        Remove every item from the index.
+        """
+        self.entries = []
+        self.items_by_order = {}
+        self.orders_by_id = {}
+
+    def find_all(self, query, kinds=None):
+        """
+        Find every item with a word starting with the query, in the order they were added.
+
+        Args:
+            query (str): What the player typed, without any ordinal.
+            kinds (tuple): Only match items whose content_kind is one of these.
+        """
+        prefix = query.strip().lower()
+        position = bisect.bisect_left(self.entries, (prefix,))
+        matched_orders = set()
+        while position < len(self.entries) and self.entries[position][0].startswith(prefix):
+            matched_orders.add(self.entries[position][1])
+            position += 1
+        matches = [self.items_by_order[order] for order in sorted(matched_orders)]
+        if kinds is not None:
+            matches = [item for item in matches if item.content_kind in kinds]
+        return matches
+
+    def find(self, query, kinds=None):
+        """
+        Find the item a player means, or None if nothing matches.
+        A trailing ".N" picks the Nth match instead of the first.
+        """
+        query, ordinal = split_ordinal(query)
+        matches = self.find_all(query, kinds)
+        if not 1 <= ordinal <= len(matches):
+            return None
+        return matches[ordinal - 1]
+
+
+@functools.lru_cache(maxsize=4096)
+def get_name_keys(name):
+    """
+    Get the lowercased word suffixes of a name, e.g. "rusty gobbo dagger",
+    "gobbo dagger" and "dagger".
+    Names repeat a lot as enemies wander, so the keys are cached.
+    """
+    words = name.lower().split()
+    return tuple(sorted({' '.join(words[start:]) for start in range(len(words))}))
+
+
+def split_ordinal(query):
+    """
+    Split "goblin.2" into ("goblin", 2). Queries without an ordinal get 1.
+    """
+    name, separator, ordinal = query.rpartition('.')
+    if separator and ordinal.isdigit():
+        return name, int(ordinal)
+    return query, 1
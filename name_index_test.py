@@ -0,0 +1,64 @@
+"""
+This module contains the name index testing logic.
+"""
+import gear
+import name_index
+
+def build_index(*names):
+    """
+    Build a name index holding one gear item per name.
+    """
+    test_index = name_index.NameIndex()
+    items = [gear.Gear(name, 'A test gear item') for name in names]
+    for item in items:
+        test_index.add(item)
+    return test_index, items
+
+def test_name_index_finds_by_word_prefix():
+    """
+    Test case for finding an item by the start of any of its words.
+    """
+    # Arrange
+    test_index, items = build_index('Rusty Gobbo Dagger', 'Orcish Armor')
+
+    # Act
+    by_first_word = test_index.find('rus')
+    by_later_word = test_index.find('DAGG')
+    by_word_run = test_index.find('gobbo dagger')
+
+    # Assert
+    assert by_first_word is items[0]
+    assert by_later_word is items[0]
+    assert by_word_run is items[0]
+    assert test_index.find('armour') is None
+
+def test_name_index_ordinal_picks_nth_match():
+    """
+    Test case for picking between items that share a name.
+    """
+    # Arrange
+    test_index, items = build_index('Goblin', 'Orc', 'Goblin', 'Goblin')
+
+    # Act
+    second_goblin = test_index.find('goblin.2')
+    third_goblin = test_index.find('gob.3')
+
+    # Assert
+    assert test_index.find('goblin') is items[0]
+    assert second_goblin is items[2]
+    assert third_goblin is items[3]
+    assert test_index.find('goblin.4') is None
+
+def test_name_index_remove_keeps_other_matches():
+    """
+    Test case for removing one of several matching items.
+    """
+    # Arrange
+    test_index, items = build_index('Goblin', 'Goblin')
+
+    # Act
+    test_index.remove(items[0])
+
+    # Assert
+    assert test_index.find_all('goblin') == [items[1]]
+    assert len(test_index) == 1
@@ -11,7 +11,10 @@ class PlayerCharacter(Character):
     """
     Represents information about a player.
     """
-    def __init__(self, name, game):
+    content_kind = 'player'
+    __slots__ = ('defaults', 'user_id')
+
+    def __init__(self, name, game, user_id=None):
         self.defaults = {
             'health': 3,
             'attack_power': 1
@@ -21,6 +24,8 @@ class PlayerCharacter(Character):
         center_of_map = (math.floor(game.map_size[0] / 2), math.floor(game.map_size[1] / 2))
         self.position = center_of_map
         self.game = game
+        # Stable id of the user behind the player, which survives renames
+        self.user_id = user_id if user_id is not None else name
     
     def reset_player(self):
         """
@@ -30,7 +35,10 @@ class PlayerCharacter(Character):
         self.base_attack = self.defaults['attack_power']
         self.position = (math.floor(self.game.map_size[0] / 2), math.floor(self.game.map_size[1] / 2))
         self.gear = []
+        self.stats.clear_modifiers()
+        self.status_effects = []
         self.consumables = []
+        self.consumable_index = None
         self.description = '💩💩💩'
 
     def show_surroundings(self):
@@ -46,19 +54,12 @@ class PlayerCharacter(Character):
         upper_y = y + math.ceil((grid_display_size[1])/2)
         for i in range(lower_x, upper_x):
             for j in range(lower_y, upper_y):
-                if (
-                    i < 0 or
-                    i >= self.game.map_size[0] or
-                    j < 0 or
-                    j >= self.game.map_size[1]
-                ):
-                    surroundings += self.game.map.out_of_bounds
-                elif i == x and j == y:
+                if i == x and j == y:
                     surroundings += self.icon
                 else:
-                    surroundings += self.game.map.map_icons[i][j]
+                    surroundings += self.game.map.get_icon((i, j))
             surroundings += '\n'
-        location_data = self.game.map.map_location_data[x][y]
+        location_data = self.game.map.get_location(self.position)
         # print the name of the location and then its contents
         surroundings += f'You are at {location_data.name}. {location_data.description}\n'
         surroundings += location_data.build_content_string()
@@ -125,6 +126,7 @@ class PlayerCharacter(Character):
         # Build attack string with base attack and gear attack
         attack_string_emojis = '⚔️' * self.get_attack_damage()
         stat_strings.append(f'Attack: {attack_string_emojis}')
+        stat_strings.append(f'Defense: {"🛡️" * self.get_defense()}')
 
         health_string_emojis = '❤️' * self.health + '🩶' * (self.max_health - self.health)
         stat_strings.append(f'Health: {health_string_emojis}')
@@ -146,16 +148,15 @@ class PlayerCharacter(Character):
         Take an item with the given name using the player.
         """
         take_msg = ''
-        location = self.game.map.map_location_data[self.position[0]][self.position[1]]
-        item = None
-        for content in location.contents:
-            if item_name.lower() in content.name.lower():
-                item = content
-                break
+        location = self.game.map.get_location(self.position)
+        item = location.find_content(item_name, kinds=('gear', 'consumable'))
         if item is None:
             return f'No item named {item_name} found here'
 
-        take_msg = self.acquire_gear(item)
+        if item.content_kind == 'consumable':
+            take_msg = self.acquire_consumable(item)
+        else:
+            take_msg = self.acquire_gear(item)
         location.remove_content(item)
         self.game.update_shown_map()
         return take_msg
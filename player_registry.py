@@ -0,0 +1,83 @@
+"""
+This module contains the registry of the players in a game.
+Players are indexed by their stable user id and by their display name, so
+finding the player behind a message costs the same however many have joined.
+"""
+
+class PlayerRegistry():
+    """
+    This class represents the players of a game, indexed by user id and by name.
+
+    Iterating the registry goes through the players in the order they joined,
+    so it can stand in for the plain list of players.
+
+    Attributes:
+        players_by_id (dict): Every player keyed by its user_id, in join order.
+        players_by_name (dict): Every player keyed by its name.
+    """
+    __slots__ = ('players_by_id', 'players_by_name')
+
+    def __init__(self):
+        self.players_by_id = {}
+        self.players_by_name = {}
+
+    def __len__(self):
+        return len(self.players_by_id)
+
+    def __iter__(self):
+        return iter(self.players_by_id.values())
+
+    def __contains__(self, player):
+        return self.players_by_id.get(player.user_id) is player
+
+    def join(self, player):
+        """
+        Add a player under its user id and name.
+        Raises ValueError if either is already taken.
+        """
+        if player.user_id in self.players_by_id:
+            raise ValueError(f'A player with user id {player.user_id} has already joined')
+        if player.name in self.players_by_name:
+            raise ValueError(f'A player named {player.name} has already joined')
+        self.players_by_id[player.user_id] = player
+        self.players_by_name[player.name] = player
+
+    def leave(self, player):
+        """
+        Remove a player, if it has joined.
+        """
+        if self.players_by_id.get(player.user_id) is not player:
+            return
+        del self.players_by_id[player.user_id]
+        del self.players_by_name[player.name]
+
+    def rename(self, player, new_name):
+        """
+        Give a joined player a new name, keeping its user id.
+        Raises ValueError if another player already has the name.
+        """
+        if new_name == player.name:
+            return
+        if new_name in self.players_by_name:
+            raise ValueError(f'A player named {new_name} has already joined')
+        del self.players_by_name[player.name]
+        player.name = new_name
+        self.players_by_name[new_name] = player
+
+    def get_by_id(self, user_id):
+        """
+        Get the player with a user id, or None if it has not joined.
+        """
+        return self.players_by_id.get(user_id)
+
+    def get_by_name(self, name):
+        """
+        Get the player with a name, or None if nobody by that name has joined.
+        """
+        return self.players_by_name.get(name)
+
+    def is_name_taken(self, name):
+        """
+        Check if a player with a name has joined.
+        """
+        return name in self.players_by_name
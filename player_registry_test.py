@@ -0,0 +1,71 @@
+"""
+This module contains the player registry tests.
+"""
+
+import pytest
+
+import game
+import player_registry
+
+def test_player_registry_finds_players_by_id_and_name():
+    """
+    Test if joined players are found by user id and by name, and iterate in join order.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game")
+    registry = player_registry.PlayerRegistry()
+    first_player = game.PlayerCharacter("First", test_game, user_id=101)
+    second_player = game.PlayerCharacter("Second", test_game, user_id=102)
+
+    # Act
+    registry.join(first_player)
+    registry.join(second_player)
+
+    # Assert
+    assert registry.get_by_id(102) is second_player
+    assert registry.get_by_name("First") is first_player
+    assert registry.get_by_name("Third") is None
+    assert list(registry) == [first_player, second_player]
+    assert len(registry) == 2
+
+def test_player_registry_rename_keeps_user_id():
+    """
+    Test if a renamed player is found under its new name and no longer under its old one.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game")
+    registry = player_registry.PlayerRegistry()
+    test_player = game.PlayerCharacter("Old Name", test_game, user_id=7)
+    other_player = game.PlayerCharacter("Taken", test_game, user_id=8)
+    registry.join(test_player)
+    registry.join(other_player)
+
+    # Act
+    registry.rename(test_player, "New Name")
+
+    # Assert
+    assert registry.get_by_name("New Name") is test_player
+    assert registry.get_by_name("Old Name") is None
+    assert registry.get_by_id(7) is test_player
+    with pytest.raises(ValueError):
+        registry.rename(test_player, "Taken")
+
+def test_player_registry_leave_frees_id_and_name():
+    """
+    Test if a player who left is no longer found and another can join under the same name.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game")
+    registry = player_registry.PlayerRegistry()
+    test_player = game.PlayerCharacter("Tester", test_game, user_id=5)
+    registry.join(test_player)
+
+    # Act
+    registry.leave(test_player)
+    returning_player = game.PlayerCharacter("Tester", test_game, user_id=6)
+    registry.join(returning_player)
+
+    # Assert
+    assert registry.get_by_id(5) is None
+    assert registry.get_by_name("Tester") is returning_player
+    assert test_player not in registry
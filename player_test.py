@@ -227,3 +227,43 @@ def test_player_use_health_potion_does_not_exceed_max_health():
 
     # Assert
     assert test_player.health == test_player.max_health
+
+def test_player_gear_defense_mitigates_damage():
+    """
+    Test case for gear defense lowering the damage the player takes.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game")
+    test_player = game.PlayerCharacter("Tester", test_game)
+    test_gear = gear.Gear("Test Shield", "A test shield")
+    test_gear.defense = 10
+    test_player.acquire_gear(test_gear)
+    health = test_player.health
+
+    # Act
+    test_player.receive_damage(4)
+
+    # Assert
+    assert test_player.get_defense() == 10
+    assert test_player.health == health - 2
+
+def test_player_bark_skin_defense_wears_off():
+    """
+    Test case for a bark skin potion raising defense until its duration runs out.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game")
+    test_player = game.PlayerCharacter("Tester", test_game)
+    bark_skin = consumables.BarkSkinPotion("Bark Skin", "Hardens the skin", 3)
+    test_player.acquire_consumable(bark_skin)
+
+    # Act
+    test_player.use_consumable(bark_skin.name)
+    defense_during = test_player.get_defense()
+    test_game.tick_count += consumables.BARK_SKIN_DURATION
+    defense_after = test_player.get_defense()
+
+    # Assert
+    assert defense_during == 3
+    assert defense_after == 0
+    assert test_player.status_effects == []
@@ -0,0 +1,161 @@
+"""
+This module contains the population controller that decides where and how many enemies spawn.
+Spawn points are precomputed per biome, and each enemy type picks a biome by its
+spawn densities with an alias table, so choosing a spawn cell is O(1).
+"""
+
+import numpy as np
+
+# The most enemies the controller will keep alive, tune against tick time
+DEFAULT_ENEMY_BUDGET = 5000
+
+class AliasTable():
+    """
+    This class represents Vose's alias table for O(1) sampling from fixed weights.
+
+    Attributes:
+        probabilities (list): The chance of keeping each column's own index.
+        aliases (list): The index each column falls back to otherwise.
+    """
+    __slots__ = ('probabilities', 'aliases')
+
+    def __init__(self, weights):
+        """
+        Args:
+            weights (list): The non-negative weight of each index, at least one above zero.
+        """
+        count = len(weights)
+        total = sum(weights)
+        scaled = [weight * count / total for weight in weights]
+        self.probabilities = [1.0] * count
+        self.aliases = list(range(count))
+        small = [index for index, weight in enumerate(scaled) if weight < 1.0]
+        large = [index for index, weight in enumerate(scaled) if weight >= 1.0]
+        while small and large:
+            small_index = small.pop()
+            large_index = large.pop()
+            self.probabilities[small_index] = scaled[small_index]
+            self.aliases[small_index] = large_index
+            scaled[large_index] -= 1.0 - scaled[small_index]
+            if scaled[large_index] < 1.0:
+                small.append(large_index)
+            else:
+                large.append(large_index)
+
+    def sample(self, rng):
+        """
+        Draw an index with probability proportional to its weight.
+
+        Args:
+            rng (RandomStream): The stream to draw from, such as the game's spawns stream.
+        """
+        column = rng.randrange(len(self.probabilities))
+        if rng.random() < self.probabilities[column]:
+            return column
+        return self.aliases[column]
+
+
+class PopulationController():
+    """
+    This class represents the controller that keeps each enemy type near its target population.
+
+    Targets come from each template's spawn densities, in enemies per cell of a
+    biome, times how many cells of that biome the starting area has. Every
+    template's minimum population is reserved out of the budget first, and when
+    the rest adds up to more than the budget left it is scaled down to fit.
+
+    Attributes:
+        manager (EnemyManager): The manager enemies are spawned through.
+        budget (int): The most enemies kept alive at once.
+        area_shape (tuple): The (rows, cols) size of the starting area.
+        area_origin (tuple): The coordinates of the starting area's first cell.
+        spawn_cells (list): The flat cell indexes of each biome in the starting area.
+        biome_pickers (dict): The alias table over biomes of each template id.
+        targets (dict): The target population of each template id.
+    """
+
+    def __init__(self, manager, budget=DEFAULT_ENEMY_BUDGET):
+        """
+        Builds the spawn tables from the starting area of the manager's map.
+
+        Args:
+            manager (EnemyManager): The manager enemies are spawned through.
+            budget (int): The most enemies kept alive at once.
+        """
+        self.manager = manager
+        self.budget = budget
+        world_map = manager.game.map
+        biome_indexes = world_map.get_starting_area_biome_indexes()
+        self.area_shape = biome_indexes.shape
+        self.area_origin = world_map.origin
+        flat_indexes = biome_indexes.ravel()
+        self.spawn_cells = [np.flatnonzero(flat_indexes == index) for index in range(len(world_map.biomes))]
+
+        self.biome_pickers = {}
+        wanted = {}
+        for template_id, template in manager.templates.items():
+            biome_targets = [
+                template.spawn_densities.get(map_biome.name, 0) * len(cells)
+                for map_biome, cells in zip(world_map.biomes, self.spawn_cells)
+            ]
+            if sum(biome_targets) > 0:
+                self.biome_pickers[template_id] = AliasTable(biome_targets)
+            wanted[template_id] = round(sum(biome_targets))
+
+        # Minimums are reserved first, only the enemies wanted beyond them are scaled to the budget
+        minimums = {template_id: template.min_population for template_id, template in manager.templates.items()}
+        minimum_total = sum(minimums.values())
+        minimum_scale = min(1.0, budget / minimum_total) if minimum_total > 0 else 1.0
+        reserved = {template_id: int(count * minimum_scale) for template_id, count in minimums.items()}
+        extras = {template_id: max(0, wanted[template_id] - minimums[template_id]) for template_id in wanted}
+        extra_total = sum(extras.values())
+        room = budget - sum(reserved.values())
+        extra_scale = min(1.0, room / extra_total) if extra_total > 0 else 1.0
+        self.targets = {
+            template_id: reserved[template_id] + int(extras[template_id] * extra_scale) for template_id in wanted
+        }
+
+    def pick_spawn_location(self, template_id):
+        """
+        Pick a cell for an enemy of a template, in a biome chosen by its densities.
+        Templates with no densities on this map spawn anywhere in the starting area.
+        """
+        spawns = self.manager.rng.spawns
+        picker = self.biome_pickers.get(template_id)
+        if picker is None:
+            return self.manager.game.map.get_random_location(spawns)
+        cells = self.spawn_cells[picker.sample(spawns)]
+        row, col = divmod(int(cells[spawns.randrange(len(cells))]), self.area_shape[1])
+        return self.manager.game.map.get_location((self.area_origin[0] + row, self.area_origin[1] + col))
+
+    def get_room(self):
+        """
+        Get how many more enemies the budget allows.
+        """
+        return max(0, self.budget - self.manager.count_enemies())
+
+    def populate(self):
+        """
+        Spawn enemies until every template reaches its target or the budget runs out.
+
+        Returns:
+            list: The new enemies.
+        """
+        new_enemies = []
+        for template_id, target in self.targets.items():
+            count = min(target - self.manager.count_enemies(template_id), self.get_room())
+            if count > 0:
+                locations = [self.pick_spawn_location(template_id) for _ in range(count)]
+                new_enemies.extend(self.manager.spawn_batch(template_id, locations))
+        return new_enemies
+
+    def respawn(self, template_id):
+        """
+        Respawn an enemy of a template if it is below target and the budget allows.
+
+        Returns:
+            Enemy: The new enemy, or None if nothing was spawned.
+        """
+        if self.manager.count_enemies(template_id) >= self.targets.get(template_id, 0) or self.get_room() <= 0:
+            return None
+        return self.manager.spawn(template_id, self.pick_spawn_location(template_id))
@@ -0,0 +1,120 @@
+"""
+This module contains the population controller tests.
+"""
+import game
+import population
+import rng_streams
+
+def test_population_alias_table_samples_by_weight():
+    """
+    Test if an alias table draws indexes in proportion to their weights and never draws zero weights.
+    """
+    # Arrange
+    spawns = rng_streams.RngStreams(5).spawns
+    alias_table = population.AliasTable([1, 0, 3])
+
+    # Act
+    draws = [alias_table.sample(spawns) for _ in range(8000)]
+
+    # Assert
+    assert draws.count(1) == 0
+    assert 0.7 < draws.count(2) / len(draws) < 0.8
+
+def test_population_targets_grow_with_map_size():
+    """
+    Test if a bigger map is populated with more enemies than a small one.
+    """
+    # Arrange
+    small_game = game.MudGame("Small Game", size=(10, 10))
+
+    # Act
+    big_game = game.MudGame("Big Game", size=(100, 100))
+
+    # Assert
+    assert small_game.enemy_mgr.count_enemies() == 4
+    assert big_game.enemy_mgr.count_enemies() > 50
+    assert big_game.enemy_mgr.get_population() == big_game.enemy_mgr.population.targets
+
+def test_population_budget_caps_enemy_count():
+    """
+    Test if the targets are scaled down to fit the enemy budget.
+    """
+    # Arrange
+    budget = 40
+
+    # Act
+    test_game = game.MudGame("Test Game", size=(100, 100), enemy_budget=budget)
+
+    # Assert
+    assert sum(test_game.enemy_mgr.population.targets.values()) <= budget
+    assert test_game.enemy_mgr.count_enemies() <= budget
+
+def test_population_budget_scaling_keeps_minimum_populations():
+    """
+    Test if scaling targets down to a tight budget never pushes a template below its minimum.
+    """
+    # Arrange
+    budget = 50
+
+    # Act
+    test_game = game.MudGame("Test Game", size=(100, 100), enemy_budget=budget)
+
+    # Assert
+    targets = test_game.enemy_mgr.population.targets
+    for template_id, template in test_game.enemy_mgr.templates.items():
+        assert targets[template_id] >= template.min_population
+    assert test_game.enemy_mgr.count_enemies('dragon') >= 1
+    assert sum(targets.values()) <= budget
+
+def test_population_enemies_spawn_in_their_biomes():
+    """
+    Test if every spawned enemy starts in a biome its template has a spawn density for.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game", size=(60, 60))
+    spawn_densities = {template_id: template.spawn_densities for template_id, template in test_game.enemy_mgr.templates.items()}
+
+    # Act
+    spawned = [(enemy.template_id, enemy.location.biome.name) for enemy in test_game.enemy_mgr.enemies.values()]
+
+    # Assert
+    for template_id, biome_name in spawned:
+        assert spawn_densities[template_id].get(biome_name, 0) > 0
+
+def test_population_respawn_respects_target_and_budget():
+    """
+    Test if respawning only happens below target and within the budget.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game", size=(30, 30))
+    controller = test_game.enemy_mgr.population
+
+    # Act
+    at_target = controller.respawn('goblin')
+    goblin = next(iter(test_game.enemy_mgr.get_enemies_of_type('goblin')))
+    test_game.enemy_mgr.remove_enemy(goblin)
+    controller.budget = test_game.enemy_mgr.count_enemies()
+    over_budget = controller.respawn('goblin')
+    controller.budget += 1
+    respawned = controller.respawn('goblin')
+
+    # Assert
+    assert at_target is None
+    assert over_budget is None
+    assert respawned is not None and respawned.template_id == 'goblin'
+
+def test_population_chunked_map_spawns_in_starting_area():
+    """
+    Test if a chunked world is populated inside its starting area.
+    """
+    # Arrange
+    size = (40, 40)
+
+    # Act
+    test_game = game.MudGame("Test Game", size=size, chunk_size=(8, 8))
+
+    # Assert
+    assert test_game.enemy_mgr.count_enemies() > 4
+    for enemy in test_game.enemy_mgr.enemies.values():
+        assert 0 <= enemy.position[0] < size[0] and 0 <= enemy.position[1] < size[1]
+        assert test_game.map.get_location(enemy.position).has_content(enemy)
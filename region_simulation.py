@@ -0,0 +1,173 @@
+"""
+This module contains the region-sharded enemy simulation.
+The map is split into bands of rows, each band is stepped by a worker process
+over positions held in shared memory, and the game process only gets back
+which enemies changed cell.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from enemy_swarm import STEP_DIRECTIONS
+
+class RegionSimulation():
+    """
+    This class represents a swarm's random walks split across map regions.
+
+    Region r owns every row whose band, row // band_height, is r modulo the
+    region count, so unbounded maps are covered too. An enemy belongs to the
+    region of its position at the start of a tick, so enemies that cross a
+    border are handed over at the next tick boundary. Every region draws from
+    its own stream seeded by (seed, tick, region), which keeps the outcome the
+    same however many workers share the regions.
+
+    Attributes:
+        swarm (EnemySwarm): The swarm whose positions are simulated.
+        region_count (int): How many regions the map is split into.
+        band_height (int): How many rows each band of a region covers.
+        workers (int): How many worker processes step the regions.
+        seed (int): The seed the region streams are derived from.
+        tick (int): How many ticks have been stepped.
+    """
+
+    def __init__(self, swarm, map_size, region_count=4, workers=1, seed=None):
+        """
+        Args:
+            swarm (EnemySwarm): The swarm whose positions are simulated.
+            map_size (tuple): The (rows, cols) size of the map or its starting area.
+            region_count (int): How many regions the map is split into.
+            workers (int): How many worker processes step the regions, 1 steps them in this process.
+            seed (int): The seed the region streams are derived from, a random one if not given.
+        """
+        self.swarm = swarm
+        self.region_count = region_count
+        self.band_height = max(1, -(-map_size[0] // region_count))
+        self.workers = workers
+        self.seed = seed if seed is not None else int(np.random.SeedSequence().entropy % (2 ** 63))
+        self.tick = 0
+        self.executor = None
+        self.shared_block = None
+
+    def get_shared_state(self, count):
+        """
+        Get a (2, count, 2) array in shared memory holding positions and their targets.
+        The block is reused between ticks and only replaced when it is too small.
+        """
+        needed_bytes = 2 * count * 2 * np.dtype(np.int64).itemsize
+        if self.shared_block is None or self.shared_block.size < needed_bytes:
+            self.close_shared_block()
+            self.shared_block = shared_memory.SharedMemory(create=True, size=max(needed_bytes, 64) * 2)
+        return np.ndarray((2, count, 2), dtype=np.int64, buffer=self.shared_block.buf)
+
+    def close_shared_block(self):
+        """
+        Release the shared memory block, if there is one.
+        """
+        if self.shared_block is not None:
+            self.shared_block.close()
+            self.shared_block.unlink()
+            self.shared_block = None
+
+    def close(self):
+        """
+        Shut down the worker processes and release the shared memory.
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+        self.close_shared_block()
+
+    def step(self, world_map, rows=None):
+        """
+        Move enemies one random walk step, each region stepping the enemies it owns.
+        Has the same contract as EnemySwarm.step.
+
+        Returns:
+            iterator: A (enemy, position, direction index) tuple for each enemy whose cell changed.
+        """
+        if rows is None:
+            rows = np.arange(len(self.swarm))
+        self.tick += 1
+        if len(rows) == 0:
+            return iter(())
+        bounds = world_map.get_bounds()
+        region_args = [
+            (region, self.region_count, self.band_height, bounds, self.seed, self.tick)
+            for region in range(self.region_count)
+        ]
+        if self.workers > 1:
+            state = self.get_shared_state(len(rows))
+            state[0] = self.swarm.positions[rows]
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(max_workers=self.workers)
+            futures = [
+                self.executor.submit(step_shared_region, self.shared_block.name, len(rows), *args)
+                for args in region_args
+            ]
+            # Change sets are merged in region order, not in the order workers finish
+            change_sets = [future.result() for future in futures]
+            positions = state[0].copy()
+            targets = state[1].copy()
+            del state
+        else:
+            positions = self.swarm.positions[rows]
+            targets = positions.copy()
+            change_sets = [step_region(positions, targets, *args) for args in region_args]
+
+        changed = np.concatenate(change_sets)
+        steps = targets[changed] - positions[changed]
+        directions = STEP_DIRECTIONS[steps[:, 0] + 1, steps[:, 1] + 1]
+        moved = rows[changed]
+        self.swarm.positions[moved] = targets[changed]
+        moved_rows = targets[changed, 0].tolist()
+        moved_cols = targets[changed, 1].tolist()
+        return (
+            (self.swarm.enemies[index], (row, col), direction)
+            for index, row, col, direction in zip(moved.tolist(), moved_rows, moved_cols, directions.tolist())
+        )
+
+
+def step_region(positions, targets, region, region_count, band_height, bounds, seed, tick):
+    """
+    Step the enemies of one region, writing their new positions into targets.
+
+    Args:
+        positions (numpy.ndarray): The (row, col) position of every enemy being stepped.
+        targets (numpy.ndarray): Where the new positions are written, for this region's enemies only.
+        region (int): The region to step.
+        region_count (int): How many regions the map is split into.
+        band_height (int): How many rows each band of a region covers.
+        bounds (tuple): The lowest and highest (row, col) on the map, None for unbounded maps.
+        seed (int): The seed the region streams are derived from.
+        tick (int): The tick being stepped.
+
+    Returns:
+        numpy.ndarray: The indexes of this region's enemies whose cell changed.
+    """
+    owned = np.flatnonzero((positions[:, 0] // band_height) % region_count == region)
+    rng = np.random.default_rng((seed, tick, region))
+    steps = rng.integers(-1, 2, (len(owned), 2))
+    # Like Enemy.update, a row step wins over a column step
+    steps[steps[:, 0] != 0, 1] = 0
+    new_positions = positions[owned] + steps
+    if bounds is not None:
+        new_positions = np.clip(new_positions, bounds[0], bounds[1])
+    targets[owned] = new_positions
+    return owned[np.any(new_positions != positions[owned], axis=1)]
+
+
+def step_shared_region(shared_block_name, count, region, region_count, band_height, bounds, seed, tick):
+    """
+    Step one region of a (2, count, 2) positions and targets array held in shared memory.
+    Runs inside a worker process.
+    """
+    shared_block = shared_memory.SharedMemory(name=shared_block_name)
+    try:
+        state = np.ndarray((2, count, 2), dtype=np.int64, buffer=shared_block.buf)
+        changed = step_region(state[0], state[1], region, region_count, band_height, bounds, seed, tick)
+        del state
+    finally:
+        shared_block.close()
+    return changed
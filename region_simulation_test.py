@@ -0,0 +1,94 @@
+"""
+This module contains the region-sharded simulation tests.
+"""
+import numpy as np
+
+import game
+import region_simulation
+
+def build_region_game(simulation_workers=1, size=(20, 20)):
+    """
+    Build a game whose swarm is stepped in three regions, with a goblin on every other cell.
+    The game seed is fixed, so two calls populate the map the same way.
+    """
+    test_game = game.MudGame("Test Game", size=size, vectorized_enemies=True, activity_radius=None,
+                             simulation_regions=3, simulation_workers=simulation_workers, seed=11)
+    for row in range(0, size[0], 2):
+        for col in range(0, size[1], 2):
+            test_game.enemy_mgr.spawn('goblin', test_game.map.get_location((row, col)))
+    return test_game
+
+def test_region_simulation_regions_split_enemies_without_overlap():
+    """
+    Test if every enemy is stepped by exactly one region, the one owning its band of rows.
+    """
+    # Arrange
+    positions = np.array([[row, 5] for row in range(12)])
+    owners = []
+
+    # Act
+    for region in range(3):
+        targets = np.full_like(positions, 999)
+        region_simulation.step_region(positions, targets, region, 3, 2, None, 5, 1)
+        owners.append(np.flatnonzero(targets[:, 0] != 999).tolist())
+
+    # Assert
+    assert owners == [[0, 1, 6, 7], [2, 3, 8, 9], [4, 5, 10, 11]]
+
+def test_region_simulation_enemy_crossing_border_is_handed_to_next_region():
+    """
+    Test if an enemy that stepped over a band border is stepped by the next region on the next tick.
+    """
+    # Arrange
+    crossed_positions = np.array([[2, 5]])
+
+    # Act
+    old_region_targets = np.full_like(crossed_positions, 999)
+    new_region_targets = np.full_like(crossed_positions, 999)
+    region_simulation.step_region(crossed_positions, old_region_targets, 0, 2, 2, None, 3, 2)
+    region_simulation.step_region(crossed_positions, new_region_targets, 1, 2, 2, None, 3, 2)
+
+    # Assert
+    assert old_region_targets.tolist() == [[999, 999]]
+    assert new_region_targets[0, 0] != 999
+
+def test_region_simulation_worker_processes_match_single_process():
+    """
+    Test if stepping the regions in worker processes gives the same moves as stepping them here.
+    """
+    # Arrange
+    single_game = build_region_game(simulation_workers=1)
+    worker_game = build_region_game(simulation_workers=2)
+
+    # Act
+    try:
+        for _ in range(3):
+            single_game.update()
+            worker_game.update()
+    finally:
+        worker_game.teardown()
+
+    # Assert
+    single_positions = [enemy.position for enemy in single_game.enemy_mgr.enemies.values()]
+    worker_positions = [enemy.position for enemy in worker_game.enemy_mgr.enemies.values()]
+    assert single_positions == worker_positions
+
+def test_region_simulation_update_keeps_enemies_in_their_locations():
+    """
+    Test if region stepped moves are synced into the locations at the enemies' new positions.
+    """
+    # Arrange
+    test_game = build_region_game()
+    swarm = test_game.enemy_mgr.swarm
+    start_positions = swarm.positions[:len(swarm)].copy()
+
+    # Act
+    test_game.update()
+
+    # Assert
+    end_positions = swarm.positions[:len(swarm)]
+    assert np.abs(end_positions - start_positions).sum(axis=1).max() == 1
+    assert end_positions.min() >= 0 and end_positions.max() <= 19
+    for index, goblin in enumerate(swarm.enemies):
+        assert goblin.position == tuple(end_positions[index].tolist())
+        assert test_game.map.get_location(goblin.position).has_content(goblin)
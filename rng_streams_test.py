@@ -0,0 +1,72 @@
+"""
+This module contains the random stream tests.
+"""
+
+import game
+import rng_streams
+
+def play_seeded_game(seed, vectorized_enemies):
+    """
+    Play a few ticks of a seeded game and kill an enemy, returning everything the rolls decided.
+    """
+    test_game = game.MudGame("Test Game", size=(20, 20), vectorized_enemies=vectorized_enemies,
+                             activity_radius=None, seed=seed)
+    for _ in range(5):
+        test_game.update()
+    enemy_mgr = test_game.enemy_mgr
+    dead_enemy = next(iter(enemy_mgr.get_enemies_of_type('goblin')))
+    enemy_mgr.handle_enemy_death(dead_enemy)
+    drop_msg = dead_enemy.do_drop_loot()
+    positions = sorted((enemy.enemy_id, enemy.position) for enemy in enemy_mgr.enemies.values())
+    return positions, drop_msg
+
+def test_rng_streams_same_seed_replays_the_same_run():
+    """
+    Test if two games with the same seed spawn, move and drop loot exactly the same way.
+    """
+    # Arrange
+    seed = 1234
+
+    # Act
+    object_runs = [play_seeded_game(seed, False) for _ in range(2)]
+    swarm_runs = [play_seeded_game(seed, True) for _ in range(2)]
+    other_seed_run = play_seeded_game(seed + 1, False)
+
+    # Assert
+    assert object_runs[0] == object_runs[1]
+    assert swarm_runs[0] == swarm_runs[1]
+    assert other_seed_run[0] != object_runs[0][0]
+
+def test_rng_streams_subsystems_do_not_share_draws():
+    """
+    Test if drawing from one stream leaves the rolls of the others unchanged.
+    """
+    # Arrange
+    quiet_streams = rng_streams.RngStreams(9)
+    busy_streams = rng_streams.RngStreams(9)
+
+    # Act
+    for _ in range(10000):
+        busy_streams.movement.random()
+    busy_streams.loot.generator.random(500)
+
+    # Assert
+    assert [quiet_streams.spawns.random() for _ in range(10)] == [busy_streams.spawns.random() for _ in range(10)]
+    assert busy_streams.seed == 9
+
+def test_random_stream_scalar_draws_stay_in_range():
+    """
+    Test if randint includes both ends, randrange excludes its stop and choice only picks items.
+    """
+    # Arrange
+    stream = rng_streams.RngStreams(3).dice
+
+    # Act
+    rolls = {stream.randint(1, 6) for _ in range(5000)}
+    indexes = {stream.randrange(4) for _ in range(5000)}
+    picks = {stream.choice('abc') for _ in range(5000)}
+
+    # Assert
+    assert rolls == {1, 2, 3, 4, 5, 6}
+    assert indexes == {0, 1, 2, 3}
+    assert picks == {'a', 'b', 'c'}
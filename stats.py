@@ -0,0 +1,121 @@
+"""
+This module contains the stat block characters combine their combat stats in.
+Base stats, gear and timed effects are summed once into cached totals, which
+are only rebuilt after one of them changes.
+"""
+
+# How much defense halves the damage taken, mitigation is defense / (defense + scale)
+MITIGATION_SCALE = 10
+
+class StatBlock():
+    """
+    This class represents a character's base stats and the modifiers on top of them.
+
+    Modifiers are keyed by their source, a piece of gear or the name of a
+    status effect, so adding the same effect again refreshes it instead of
+    stacking it.
+
+    Attributes:
+        base (dict): The base value of each stat.
+        modifiers (dict): The (stat changes, tick it expires or None) of each source.
+        totals (dict): The cached total of each stat, None until the next read rebuilds it.
+        next_expiry (int): The earliest tick a modifier expires, None if none of them do.
+    """
+    __slots__ = ('base', 'modifiers', 'totals', 'next_expiry')
+
+    def __init__(self, **base):
+        """
+        Args:
+            base: The base value of each stat, by stat name.
+        """
+        self.base = base
+        self.modifiers = {}
+        self.totals = None
+        self.next_expiry = None
+
+    def set_base(self, stat, value):
+        """
+        Set the base value of a stat, such as after a level change.
+        """
+        self.base[stat] = value
+        self.totals = None
+
+    def add_modifier(self, source, stat_changes, expires_at=None):
+        """
+        Add the stat changes of a source, replacing any it already had.
+
+        Args:
+            source: The gear or status effect name the changes come from.
+            stat_changes (dict): How much each stat changes, by stat name.
+            expires_at (int): The tick the changes wear off, None if they last until removed.
+        """
+        self.modifiers[source] = (stat_changes, expires_at)
+        if expires_at is not None and (self.next_expiry is None or expires_at < self.next_expiry):
+            self.next_expiry = expires_at
+        self.totals = None
+
+    def remove_modifier(self, source):
+        """
+        Remove the stat changes of a source, if it has any.
+        """
+        if self.modifiers.pop(source, None) is not None:
+            self.totals = None
+
+    def clear_modifiers(self):
+        """
+        Remove every modifier.
+        """
+        self.modifiers.clear()
+        self.next_expiry = None
+        self.totals = None
+
+    def expire(self, tick):
+        """
+        Remove the modifiers that have worn off by a tick.
+
+        Returns:
+            list: The sources whose modifiers were removed.
+        """
+        if self.next_expiry is None or tick < self.next_expiry:
+            return []
+        expired = [
+            source for source, (_, expires_at) in self.modifiers.items()
+            if expires_at is not None and expires_at <= tick
+        ]
+        for source in expired:
+            del self.modifiers[source]
+        remaining = [expires_at for _, expires_at in self.modifiers.values() if expires_at is not None]
+        self.next_expiry = min(remaining) if remaining else None
+        self.totals = None
+        return expired
+
+    def build_totals(self):
+        """
+        Sum the base stats and every modifier into the cached totals.
+        """
+        totals = dict(self.base)
+        for stat_changes, _ in self.modifiers.values():
+            for stat, change in stat_changes.items():
+                totals[stat] = totals.get(stat, 0) + change
+        defense = max(0, totals.get('defense', 0))
+        totals['mitigation'] = defense / (defense + MITIGATION_SCALE)
+        self.totals = totals
+        return totals
+
+    def get(self, stat):
+        """
+        Get the total of a stat, 0 for stats nothing sets.
+        """
+        totals = self.totals
+        if totals is None:
+            totals = self.build_totals()
+        return totals.get(stat, 0)
+
+    def mitigate(self, damage):
+        """
+        Get how much of an amount of damage gets through the defense.
+        A hit always does at least 1 damage.
+        """
+        if damage <= 0:
+            return damage
+        return max(1, round(damage * (1 - self.get('mitigation'))))
@@ -0,0 +1,68 @@
+"""
+This module contains the stat block tests.
+"""
+
+import stats
+
+def test_stat_block_totals_are_cached_until_a_modifier_changes():
+    """
+    Test if totals are only rebuilt after a modifier is added or removed.
+    """
+    # Arrange
+    stat_block = stats.StatBlock(attack=2, defense=0)
+    sword = object()
+    stat_block.add_modifier(sword, {'attack': 3})
+
+    # Act
+    attack_before = stat_block.get('attack')
+    cached_totals = stat_block.totals
+    second_read = stat_block.get('attack')
+    reused_cache = stat_block.totals is cached_totals
+    stat_block.remove_modifier(sword)
+    attack_after = stat_block.get('attack')
+
+    # Assert
+    assert attack_before == second_read == 5
+    assert reused_cache
+    assert stat_block.totals is not cached_totals
+    assert attack_after == 2
+
+def test_stat_block_timed_modifiers_expire_at_their_tick():
+    """
+    Test if a timed modifier lasts until its tick and a re-added one replaces it rather than stacking.
+    """
+    # Arrange
+    stat_block = stats.StatBlock(defense=1)
+    stat_block.add_modifier('Bark Skin', {'defense': 4}, expires_at=10)
+    stat_block.add_modifier('Bark Skin', {'defense': 4}, expires_at=12)
+
+    # Act
+    expired_early = stat_block.expire(11)
+    defense_before = stat_block.get('defense')
+    expired_late = stat_block.expire(12)
+    defense_after = stat_block.get('defense')
+
+    # Assert
+    assert expired_early == []
+    assert defense_before == 5
+    assert expired_late == ['Bark Skin']
+    assert defense_after == 1
+    assert stat_block.next_expiry is None
+
+def test_stat_block_defense_mitigates_damage_but_never_all_of_it():
+    """
+    Test if defense lowers damage taken and a hit always does at least 1 damage.
+    """
+    # Arrange
+    unarmored = stats.StatBlock(defense=0)
+    armored = stats.StatBlock(defense=stats.MITIGATION_SCALE)
+
+    # Act
+    unarmored_damage = unarmored.mitigate(8)
+    armored_damage = armored.mitigate(8)
+    scratch_damage = armored.mitigate(1)
+
+    # Assert
+    assert unarmored_damage == 8
+    assert armored_damage == 4
+    assert scratch_damage == 1
@@ -0,0 +1,173 @@
+"""
+This module contains the terrain generation logic for the game.
+The noise engine computes a whole noise field as a NumPy array in one pass,
+laid out so that it reproduces perlin_noise.PerlinNoise for the same seed.
+"""
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Bump whenever a change to generation changes the grids it produces,
+# so that cached worlds from older versions are not reused
+GENERATOR_VERSION = 1
+
+
+class GradientNoise():
+    """
+    Vectorized 2D gradient noise.
+
+    Attributes:
+        octaves (float): Number of lattice cells per unit of input coordinate.
+        seed (int): The seed used to pick the lattice gradients.
+    """
+
+    def __init__(self, octaves=8, seed=1):
+        """
+        Constructs the noise engine.
+
+        Args:
+            octaves (float): Number of lattice cells per unit of input coordinate.
+            seed (int): The seed used to pick the lattice gradients.
+        """
+        if octaves <= 0:
+            raise ValueError('octaves expected to be positive number')
+        self.octaves = octaves
+        self.seed = seed
+        self.gradients = {}
+
+    def lattice_hash(self, lattice_x, lattice_y):
+        """
+        Hash integer lattice coordinates the same way perlin_noise does.
+        """
+        return np.maximum(1, np.abs(lattice_x + 10 * lattice_y + 1))
+
+    def get_gradients(self, hashes):
+        """
+        Get the gradient vectors for an array of lattice hashes.
+        Each distinct hash is only ever sampled once per engine.
+        """
+        # Hashes of a window span a small contiguous range, so a dense table is cheap
+        lowest = int(hashes.min())
+        highest = int(hashes.max())
+        table = np.empty((highest - lowest + 1, 2))
+        for lattice_hash in range(lowest, highest + 1):
+            gradient = self.gradients.get(lattice_hash)
+            if gradient is None:
+                sampler = random.Random(self.seed * lattice_hash)
+                gradient = (sampler.uniform(-1, 1), sampler.uniform(-1, 1))
+                self.gradients[lattice_hash] = gradient
+            table[lattice_hash - lowest] = gradient
+        return table[hashes - lowest]
+
+    def noise_grid(self, size, scale, origin=(0, 0)):
+        """
+        Compute the noise value of every cell of a rows x cols window.
+
+        Args:
+            size (tuple): The (rows, cols) size of the window.
+            scale (float): Cells per unit of input coordinate.
+            origin (tuple): The global coordinates of the window's first cell.
+
+        Returns:
+            numpy.ndarray: A float64 array of noise values, roughly in [-0.5, 0.5].
+        """
+        rows = (np.arange(size[0]) + origin[0]) / scale * self.octaves
+        cols = (np.arange(size[1]) + origin[1]) / scale * self.octaves
+        x = np.broadcast_to(rows[:, np.newaxis], (size[0], size[1]))
+        y = np.broadcast_to(cols[np.newaxis, :], (size[0], size[1]))
+        x_floor = np.floor(x).astype(np.int64)
+        y_floor = np.floor(y).astype(np.int64)
+
+        total = np.zeros((size[0], size[1]))
+        # Corners are summed in the same order as perlin_noise to keep rounding identical
+        for corner_x in (x_floor, x_floor + 1):
+            for corner_y in (y_floor, y_floor + 1):
+                gradient = self.get_gradients(self.lattice_hash(corner_x, corner_y))
+                dist_x = x - corner_x
+                dist_y = y - corner_y
+                weight = fade(1 - np.abs(dist_x)) * fade(1 - np.abs(dist_y))
+                total += weight * (gradient[..., 0] * dist_x + gradient[..., 1] * dist_y)
+        return total
+
+
+def fade(values):
+    """
+    Smooth [0, 1] values with the quintic fade curve.
+    """
+    return 6 * values ** 5 - 15 * values ** 4 + 10 * values ** 3
+
+
+def quantize_biomes(noise, biome_count, offset=0.5):
+    """
+    Map a noise field onto biome indexes.
+
+    Args:
+        noise (numpy.ndarray): The noise field.
+        biome_count (int): The number of biomes to spread the noise across.
+        offset (float): Shift applied to the noise before quantizing.
+
+    Returns:
+        numpy.ndarray: A uint8 array of biome indexes in [0, biome_count).
+    """
+    indexes = np.floor((noise + offset) * biome_count)
+    return np.clip(indexes, 0, biome_count - 1).astype(np.uint8)
+
+
+def generate_biome_indexes(size, biome_count, octaves=8, seed=1, origin=(0, 0), workers=1):
+    """
+    Generate the biome index grid of a map window.
+    The noise is sampled at one unit per biome, matching the original map builder.
+    With more than one worker the window is split into row bands that are
+    generated in separate processes, the output is identical either way.
+    """
+    if workers > 1 and size[0] > 1:
+        return generate_biome_indexes_in_bands(size, biome_count, octaves, seed, origin, workers)
+    noise = GradientNoise(octaves=octaves, seed=seed)
+    return quantize_biomes(noise.noise_grid(size, biome_count, origin), biome_count)
+
+
+def generate_biome_indexes_in_bands(size, biome_count, octaves, seed, origin, workers):
+    """
+    Generate the biome index grid with a process pool.
+    Each worker writes its band straight into a shared memory array, so only
+    the band bounds are sent between processes.
+    """
+    band_count = min(workers, size[0])
+    band_edges = np.linspace(0, size[0], band_count + 1).astype(int).tolist()
+    shared_block = shared_memory.SharedMemory(create=True, size=max(1, size[0] * size[1]))
+    try:
+        with ProcessPoolExecutor(max_workers=band_count) as executor:
+            futures = [
+                executor.submit(
+                    generate_band, shared_block.name, size, band_start, band_stop,
+                    biome_count, octaves, seed, origin
+                )
+                for band_start, band_stop in zip(band_edges[:-1], band_edges[1:])
+            ]
+            for future in futures:
+                future.result()
+        biome_indexes = np.ndarray(size, dtype=np.uint8, buffer=shared_block.buf).copy()
+    finally:
+        shared_block.close()
+        shared_block.unlink()
+    return biome_indexes
+
+
+def generate_band(shared_block_name, size, band_start, band_stop, biome_count, octaves, seed, origin):
+    """
+    Generate the rows [band_start, band_stop) of a biome grid held in shared memory.
+    Runs inside a worker process.
+    """
+    shared_block = shared_memory.SharedMemory(name=shared_block_name)
+    try:
+        biome_indexes = np.ndarray(size, dtype=np.uint8, buffer=shared_block.buf)
+        band_origin = (origin[0] + band_start, origin[1])
+        biome_indexes[band_start:band_stop] = generate_biome_indexes(
+            (band_stop - band_start, size[1]), biome_count, octaves, seed, band_origin
+        )
+        del biome_indexes
+    finally:
+        shared_block.close()
@@ -0,0 +1,33 @@
+"""
+This module benchmarks world generation across worker processes.
+Run it directly to time band-parallel generation with 1, 2, 4 and 8 workers:
+    python terrain_benchmark.py [rows] [cols]
+"""
+import sys
+import time
+
+import terrain
+
+def time_generation(size, workers, biome_count=5):
+    """
+    Time generating a biome grid with the given number of workers.
+    """
+    start = time.perf_counter()
+    biome_indexes = terrain.generate_biome_indexes(size, biome_count, workers=workers)
+    return time.perf_counter() - start, biome_indexes
+
+def main():
+    """
+    Print generation time and speedup for each worker count.
+    """
+    size = (int(sys.argv[1]), int(sys.argv[2])) if len(sys.argv) > 2 else (2000, 2000)
+    single_seconds, expected = time_generation(size, 1)
+    print(f'{size[0]}x{size[1]} map')
+    print(f'1 worker: {single_seconds:.2f}s')
+    for workers in (2, 4, 8):
+        seconds, biome_indexes = time_generation(size, workers)
+        identical = (biome_indexes == expected).all()
+        print(f'{workers} workers: {seconds:.2f}s, {single_seconds / seconds:.2f}x, identical={identical}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+This module contains the terrain testing logic.
+"""
+import numpy as np
+from perlin_noise import PerlinNoise
+
+import terrain
+
+def build_reference_noise(size, scale, octaves, seed):
+    """
+    Build a noise field one cell at a time with perlin_noise.
+    """
+    noise = PerlinNoise(octaves=octaves, seed=seed)
+    return np.array([[noise([i / scale, j / scale]) for j in range(size[1])]
+                     for i in range(size[0])])
+
+def test_terrain_noise_grid_matches_perlin_noise():
+    """
+    Test if the vectorized noise field matches perlin_noise within tolerance.
+    """
+    # Arrange
+    size = (12, 15)
+    reference = build_reference_noise(size, 5, 8, 1)
+
+    # Act
+    noise = terrain.GradientNoise(octaves=8, seed=1).noise_grid(size, 5)
+
+    # Assert
+    assert np.allclose(noise, reference, rtol=0, atol=1e-12)
+
+def test_terrain_biome_layout_matches_perlin_noise_for_seeds():
+    """
+    Test if the biome layout matches the per-cell perlin_noise layout for several seeds.
+    """
+    size = (20, 20)
+    for seed in (1, 42, 9001):
+        # Arrange
+        expected = terrain.quantize_biomes(build_reference_noise(size, 5, 8, seed), 5)
+
+        # Act
+        biome_indexes = terrain.generate_biome_indexes(size, 5, octaves=8, seed=seed)
+
+        # Assert
+        assert np.array_equal(biome_indexes, expected)
+
+def test_terrain_noise_grid_origin_offsets_window():
+    """
+    Test if a window generated at an origin matches the same cells of a larger window.
+    """
+    # Arrange
+    noise = terrain.GradientNoise(octaves=8, seed=3)
+    full = noise.noise_grid((10, 10), 5)
+
+    # Act
+    window = noise.noise_grid((4, 3), 5, origin=(5, 6))
+
+    # Assert
+    assert np.array_equal(window, full[5:9, 6:9])
+
+def test_terrain_quantize_biomes_clamps_to_range():
+    """
+    Test if quantizing out of range noise clamps to valid biome indexes.
+    """
+    # Arrange
+    noise = np.array([[-0.9, 0.0, 0.9]])
+
+    # Act
+    biome_indexes = terrain.quantize_biomes(noise, 5)
+
+    # Assert
+    assert biome_indexes.dtype == np.uint8
+    assert biome_indexes.tolist() == [[0, 2, 4]]
+
+def test_terrain_band_parallel_generation_matches_single_process():
+    """
+    Test if generating in row bands across worker processes gives the same grid.
+    """
+    # Arrange
+    size = (23, 17)
+    expected = terrain.generate_biome_indexes(size, 5, octaves=8, seed=4)
+
+    # Act
+    biome_indexes = terrain.generate_biome_indexes(size, 5, octaves=8, seed=4, workers=3)
+
+    # Assert
+    assert np.array_equal(biome_indexes, expected)
@@ -0,0 +1,84 @@
+"""
+This module contains the hashed timer wheel used to schedule enemy actions.
+Items are filed in the slot of the tick they are due, so advancing a tick only
+looks at one slot instead of every scheduled item.
+"""
+
+class TimerWheel():
+    """
+    This class represents a hashed timer wheel counting whole game ticks.
+
+    Items due further out than one turn of the wheel share a slot with nearer
+    ones and are skipped until their turn comes round.
+
+    Attributes:
+        slots (list): A dict per slot of the (due tick, item) entries filed there, keyed by item identity.
+        due_ticks (dict): The tick each scheduled item is due, keyed by item identity.
+        current_tick (int): The last tick the wheel advanced to.
+    """
+    __slots__ = ('slots', 'due_ticks', 'current_tick')
+
+    def __init__(self, slot_count=64):
+        """
+        Args:
+            slot_count (int): How many ticks one turn of the wheel covers.
+        """
+        self.slots = [{} for _ in range(slot_count)]
+        self.due_ticks = {}
+        self.current_tick = 0
+
+    def __len__(self):
+        return len(self.due_ticks)
+
+    def is_scheduled(self, item):
+        """
+        Check if an item is waiting on the wheel.
+        """
+        return id(item) in self.due_ticks
+
+    def schedule(self, item, delay):
+        """
+        Schedule an item to come due a number of ticks from now, replacing any earlier schedule.
+        A delay below one tick is treated as one, the current tick has already been handed out.
+        """
+        self.cancel(item)
+        due_tick = self.current_tick + max(1, delay)
+        self.slots[due_tick % len(self.slots)][id(item)] = (due_tick, item)
+        self.due_ticks[id(item)] = due_tick
+
+    def schedule_many(self, items, delays):
+        """
+        Schedule a batch of items that are not on the wheel, each with its own delay.
+        Items with a delay of 0 are left off the wheel.
+        """
+        slots = self.slots
+        slot_count = len(slots)
+        due_ticks = self.due_ticks
+        for item, delay in zip(items, delays):
+            if delay > 0:
+                due_tick = self.current_tick + delay
+                slots[due_tick % slot_count][id(item)] = (due_tick, item)
+                due_ticks[id(item)] = due_tick
+
+    def cancel(self, item):
+        """
+        Take an item off the wheel, if it is on it.
+        """
+        due_tick = self.due_ticks.pop(id(item), None)
+        if due_tick is not None:
+            del self.slots[due_tick % len(self.slots)][id(item)]
+
+    def advance(self):
+        """
+        Move on one tick and take every item that is now due off the wheel.
+
+        Returns:
+            list: The due items, in the order they were scheduled.
+        """
+        self.current_tick += 1
+        slot = self.slots[self.current_tick % len(self.slots)]
+        due_items = [item for due_tick, item in slot.values() if due_tick <= self.current_tick]
+        for item in due_items:
+            del slot[id(item)]
+            del self.due_ticks[id(item)]
+        return due_items
@@ -0,0 +1,69 @@
+"""
+This module contains the timer wheel tests.
+"""
+import timer_wheel
+
+def test_timer_wheel_advance_returns_items_when_due():
+    """
+    Test if items come due on the tick they were scheduled for, and not before.
+    """
+    # Arrange
+    wheel = timer_wheel.TimerWheel(slot_count=4)
+    wheel.schedule('soon', 1)
+    wheel.schedule('later', 3)
+
+    # Act
+    due_per_tick = [wheel.advance() for _ in range(4)]
+
+    # Assert
+    assert due_per_tick == [['soon'], [], ['later'], []]
+    assert len(wheel) == 0
+
+def test_timer_wheel_delay_longer_than_a_turn_waits_for_its_round():
+    """
+    Test if an item due more than one turn of the wheel away is skipped until its tick.
+    """
+    # Arrange
+    wheel = timer_wheel.TimerWheel(slot_count=4)
+    wheel.schedule('far', 6)
+
+    # Act
+    due_ticks = [tick for tick in range(1, 9) if wheel.advance()]
+
+    # Assert
+    assert due_ticks == [6]
+
+def test_timer_wheel_cancel_and_reschedule():
+    """
+    Test if cancelled items never come due and rescheduling replaces the earlier due tick.
+    """
+    # Arrange
+    wheel = timer_wheel.TimerWheel(slot_count=8)
+    wheel.schedule('cancelled', 1)
+    wheel.schedule('moved', 1)
+
+    # Act
+    wheel.cancel('cancelled')
+    wheel.schedule('moved', 2)
+    first_tick = wheel.advance()
+    second_tick = wheel.advance()
+
+    # Assert
+    assert first_tick == []
+    assert second_tick == ['moved']
+    assert wheel.is_scheduled('cancelled') is False
+
+def test_timer_wheel_schedule_many_skips_zero_delays():
+    """
+    Test if a batch schedule files each item by its own delay and leaves out zero delays.
+    """
+    # Arrange
+    wheel = timer_wheel.TimerWheel(slot_count=4)
+
+    # Act
+    wheel.schedule_many(['first', 'never', 'second'], [2, 0, 1])
+    due_per_tick = [wheel.advance() for _ in range(2)]
+
+    # Assert
+    assert due_per_tick == [['second'], ['first']]
+    assert wheel.is_scheduled('never') is False
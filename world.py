@@ -2,77 +2,184 @@
 This module contains the map logic for the game.
 """
 
-import math
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
 
-from perlin_noise import PerlinNoise
+import numpy as np
 
-from location import Location
+from location import Location, get_display_priority
+from map_overview import MapPyramid
 import biome
+import terrain
+
+# Biomes used by create_map_location_data, which builds a plain map without perlin noise
+SURROUNDING_BIOME = biome.Biome('Surrounding', '🟦', 'The surrounding world')
+CENTER_BIOME = biome.Biome('Center', '🟨', 'The center of the world')
+
+class LocationRow():
+    """
+    This class represents one row of a LocationGrid.
+    """
+
+    def __init__(self, world_map, row_index):
+        self.world_map = world_map
+        self.row_index = row_index
+
+    def __len__(self):
+        return self.world_map.map_size[1]
+
+    def __getitem__(self, column_index):
+        column_index = range(len(self))[column_index]
+        origin = self.world_map.origin
+        return self.world_map.get_location((origin[0] + self.row_index, origin[1] + column_index))
+
+    def __iter__(self):
+        for column_index in range(len(self)):
+            yield self[column_index]
+
+class LocationGrid():
+    """
+    This class gives grid style access to a map's locations.
+    Locations are created on demand as cells are accessed.
+    """
+
+    def __init__(self, world_map):
+        self.world_map = world_map
+
+    def __len__(self):
+        return self.world_map.map_size[0]
+
+    def __getitem__(self, row_index):
+        return LocationRow(self.world_map, range(len(self))[row_index])
+
+    def __iter__(self):
+        for row_index in range(len(self)):
+            yield self[row_index]
+
+class IconRow():
+    """
+    This class represents one row of an IconGrid.
+    """
+
+    def __init__(self, world_map, row_index):
+        self.world_map = world_map
+        self.row_index = row_index
+
+    def __len__(self):
+        return self.world_map.map_size[1]
+
+    def get_coordinates(self, column_index):
+        column_index = range(len(self))[column_index]
+        return (self.world_map.origin[0] + self.row_index, self.world_map.origin[1] + column_index)
+
+    def __getitem__(self, column_index):
+        return self.world_map.get_icon(self.get_coordinates(column_index))
+
+    def __setitem__(self, column_index, icon):
+        self.world_map.content_icons[self.get_coordinates(column_index)] = icon
+
+    def __iter__(self):
+        for column_index in range(len(self)):
+            yield self[column_index]
+
+class IconGrid():
+    """
+    This class gives grid style access to a map's icons.
+    Icons are looked up per cell, so no icon grid is ever built for the whole map.
+    """
+
+    def __init__(self, world_map):
+        self.world_map = world_map
+
+    def __len__(self):
+        return self.world_map.map_size[0]
+
+    def __getitem__(self, row_index):
+        return IconRow(self.world_map, range(len(self))[row_index])
+
+    def __iter__(self):
+        for row_index in range(len(self)):
+            yield self[row_index]
 
 class Map():
     """
     This class represents a map.
+    Terrain is stored as a grid of biome indexes, Location objects are only
+    created for cells that are visited or hold contents.
     """
 
     def __init__(self):
-        self.map_location_data = []
-        self.map_icons = []
+        self.biome_indexes = np.zeros((1, 1), dtype=np.uint8)
+        self.locations = {}
+        self.dirty_cells = set()
+        self.character_count = 0
+        # The icons of cells showing contents instead of their terrain
+        self.content_icons = {}
+        self.overview = None
         self.map_size = (1, 1)
+        self.origin = (0, 0)
         self.out_of_bounds = '⬛'
 
-        self.biomes = [
-            biome.Desert(),
-            biome.Meadows(),
-            biome.Ocean(),
-            biome.Forest(),
-            biome.Mountain()
-        ]
+        self.biomes = list(biome.WORLD_BIOMES)
+
+    @property
+    def map_location_data(self):
+        """
+        Grid style access to the map's locations.
+        """
+        return LocationGrid(self)
+
+    @property
+    def map_icons(self):
+        """
+        Grid style access to the map's icons.
+        """
+        return IconGrid(self)
 
     def create_map_location_data(self, size=(5, 5)):
         """
         Create the map location data.
         """
-        self.map_size = size
-        center_position = self.map_size[0] // 2, self.map_size[1] // 2
-        center_position_icon = '🟨'
-        surrounding_positions_icon = '🟦'
+        center_position = size[0] // 2, size[1] // 2
+        self.biomes = [SURROUNDING_BIOME, CENTER_BIOME]
+        biome_indexes = np.zeros(size, dtype=np.uint8)
+        biome_indexes[center_position] = 1
+        self.build_from_biome_indexes(biome_indexes)
 
-        # map_data will hold all the object data for the world
-        self.map_location_data = []
-        for i in range(self.map_size[0]):
-            row = []
-            for j in range(self.map_size[1]):
-                if i == center_position[0] and j == center_position[1]:
-                    center_location = Location('Center', 'The center of the world', center_position)
-                    center_location.map_icon = center_position_icon
-                    row.append(center_location)
-                else:
-                    location = Location('Surrounding', 'The surrounding world', (i, j))
-                    location.map_icon = surrounding_positions_icon
-                    row.append(location)
-            self.map_location_data.append(row)
-
-    def build_perlin_map_clamped_to_integers(self, size=(5, 5), octaves=8):
+    def build_perlin_map_clamped_to_integers(self, size=(5, 5), octaves=8, seed=1, workers=1, cache=None):
         """
         Build a perlin map clamped to integers.
+        The noise field and biome quantization are computed in one batched pass,
+        split into row bands across worker processes if more than one worker is given.
+        With a world cache, a previously generated map is memory-mapped instead.
         """
-        self.map_size = size
-        noise = PerlinNoise(octaves=octaves, seed=1)
-        self.map_location_data = []
-        scale = len(self.biomes)
-        offset = 0.5
-        for i in range(self.map_size[0]):
-            row = []
-            for j in range(self.map_size[1]):
-                noise_val = noise([i / scale, j / scale]) + offset
-                closest_int = math.floor(noise_val * scale)
-                if closest_int >= scale:
-                    closest_int = scale - 1
-                selected_biome = self.get_biome(closest_int)
-                location = Location(selected_biome.name, selected_biome.description, (i, j), selected_biome)
-                location.map_icon = selected_biome.icon
-                row.append(location)
-            self.map_location_data.append(row)
+        if cache is not None:
+            biome_indexes = cache.get_biome_indexes(size, len(self.biomes), octaves, seed, workers)
+        else:
+            biome_indexes = terrain.generate_biome_indexes(size, len(self.biomes), octaves, seed, workers=workers)
+        self.build_from_biome_indexes(biome_indexes)
+
+    def build_from_biome_indexes(self, biome_indexes, origin=(0, 0)):
+        """
+        Build the map from a grid of biome indexes.
+        The origin is the global coordinate of the grid's first cell.
+        """
+        self.map_size = biome_indexes.shape
+        self.origin = origin
+        self.biome_indexes = biome_indexes
+        self.locations = {}
+        self.dirty_cells = set()
+        self.character_count = 0
+        self.content_icons = {}
+        self.overview = None
+
+    def get_starting_area_biome_indexes(self):
+        """
+        Get the biome index grid of the area enemies and players start in, the whole map.
+        """
+        return self.biome_indexes
 
     def get_biome(self, index):
         """
@@ -82,40 +189,432 @@ class Map():
             return self.biomes[int(index)]
         return None
 
+    def is_in_bounds(self, coordinates):
+        """
+        Check if the coordinates are on the map.
+        """
+        i = coordinates[0] - self.origin[0]
+        j = coordinates[1] - self.origin[1]
+        return 0 <= i < self.map_size[0] and 0 <= j < self.map_size[1]
+
+    def get_bounds(self):
+        """
+        Get the lowest and highest (row, col) coordinates on the map.
+        """
+        lowest = (self.origin[0], self.origin[1])
+        highest = (self.origin[0] + self.map_size[0] - 1, self.origin[1] + self.map_size[1] - 1)
+        return lowest, highest
+
+    def clamp_positions(self, positions):
+        """
+        Clamp an array of (row, col) coordinates onto the map.
+        For single steps this is the same as refusing a move off the edge.
+        """
+        lowest, highest = self.get_bounds()
+        return np.clip(positions, lowest, highest)
+
+    def get_biome_at(self, coordinates):
+        """
+        Get the shared biome at the coordinates without creating a location.
+        """
+        return self.biomes[self.biome_indexes[coordinates[0] - self.origin[0], coordinates[1] - self.origin[1]]]
+
+    def get_location(self, coordinates):
+        """
+        Get the location at the coordinates, or None if they are off the map.
+        """
+        if not self.is_in_bounds(coordinates):
+            return None
+        location = self.locations.get(coordinates)
+        if location is None:
+            cell_biome = self.get_biome_at(coordinates)
+            location = Location(cell_biome.name, cell_biome.description, coordinates, cell_biome)
+            location.world_map = self
+            self.locations[coordinates] = location
+            # Dirty so that it is dropped again if nothing is ever put here
+            self.mark_dirty(coordinates)
+        return location
+
+    def find_location(self, coordinates):
+        """
+        Get the location at the coordinates only if it already exists, without creating one.
+        """
+        return self.locations.get(coordinates)
+
+    def mark_dirty(self, coordinates):
+        """
+        Mark a cell as needing its icon refreshed.
+        """
+        self.dirty_cells.add(coordinates)
+
+    def count_characters(self, change):
+        """
+        Keep count of the characters on the map as locations gain or lose them.
+        """
+        self.character_count += change
+
+    def get_icon(self, coordinates):
+        """
+        Get the map icon at the coordinates.
+        """
+        if not self.is_in_bounds(coordinates):
+            return self.out_of_bounds
+        icon = self.content_icons.get(coordinates)
+        if icon is None:
+            return self.get_biome_at(coordinates).icon
+        return icon
+
+    def get_random_location(self, rng):
+        """
+        Get a random location on the map.
+        Draws from rng, a RandomStream such as the game's spawns stream, so the pick stays seeded.
+        """
+        i = rng.randint(0, self.map_size[0] - 1)
+        j = rng.randint(0, self.map_size[1] - 1)
+        return self.get_location((self.origin[0] + i, self.origin[1] + j))
+
+    def load_around(self, coordinates):
+        """
+        Make sure the area around the coordinates is loaded.
+        Dense maps are always fully loaded.
+        """
+
     def update_map_icons(self):
         """
-        Update the map icons.
-        """
-        # map will only hold the icons for quick lookups, map_data must be built first
-        self.map_icons = []
-        for i, row in enumerate(self.map_location_data):
-            for j, map_location in enumerate(row):
-                fitness_rating = 0
-                best_fit = None
-                if map_location.has_contents():
-                    if map_location.has_enemies():
-                        location_enemies = map_location.get_enemies()
-                        for enemy in location_enemies:
-                            enemy_rating = enemy.power + enemy.health
-                            if enemy_rating > fitness_rating:
-                                best_fit = enemy
-                        self.map_location_data[i][j].map_icon = best_fit.icon
-                    else:
-                        self.map_location_data[i][j].map_icon = map_location.contents[0].icon
-                else:
-                    self.map_location_data[i][j].map_icon = (
-                        map_location.biome.icon if map_location.biome is not None else self.out_of_bounds
-                    )
-        self.map_icons = [
-            [map_location.map_icon for map_location in row]
-            for row in self.map_location_data
-        ]
+        Update the map icons of the cells that changed since the last update.
+        Empty locations are dropped, their cells fall back to the terrain icon.
+        """
+        for coordinates in self.dirty_cells:
+            map_location = self.locations.get(coordinates)
+            threat = 0
+            if map_location is not None and map_location.has_contents():
+                map_location.map_icon = map_location.top_content.icon
+                icon = map_location.map_icon
+                threat = get_display_priority(map_location.top_content)
+                self.content_icons[coordinates] = icon
+            else:
+                self.locations.pop(coordinates, None)
+                self.content_icons.pop(coordinates, None)
+                icon = self.get_biome_at(coordinates).icon
+            if self.overview is not None:
+                cell = (coordinates[0] - self.origin[0], coordinates[1] - self.origin[1])
+                self.overview.update_threat(cell, threat, icon)
+        self.dirty_cells.clear()
+
+    def build_overview(self):
+        """
+        Build the level-of-detail pyramid from the terrain and the current contents.
+        """
+        self.update_map_icons()
+        self.overview = MapPyramid(self.biome_indexes, len(self.biomes))
+        for coordinates, map_location in self.locations.items():
+            cell = (coordinates[0] - self.origin[0], coordinates[1] - self.origin[1])
+            self.overview.update_threat(cell, get_display_priority(map_location.top_content), map_location.map_icon)
+
+    def get_overview_string(self, max_size=16, center=None):
+        """
+        Get an overview of the whole map that fits within max_size cells in both directions.
+        The whole map always fits, so the center the overview is asked around is not needed.
+        """
+        if self.overview is None:
+            self.build_overview()
+        return self.overview.get_overview_string([map_biome.icon for map_biome in self.biomes], max_size)
 
     def get_map_string(self):
         """
         Get the map string.
         """
+        biome_icons = [map_biome.icon for map_biome in self.biomes]
+        icon_rows = [[biome_icons[index] for index in index_row] for index_row in self.biome_indexes.tolist()]
+        for coordinates, icon in self.content_icons.items():
+            icon_rows[coordinates[0] - self.origin[0]][coordinates[1] - self.origin[1]] = icon
         map_str = ''
-        for row in self.map_icons:
+        for row in icon_rows:
+            map_str += ' '.join(row) + '\n'
+        return map_str
+
+
+class ChunkedMap(Map):
+    """
+    This class represents an unbounded map that is generated one chunk at a time.
+    Chunks are generated the first time something comes near them, kept in a
+    chunk table, and evicted to disk once they go cold.
+    """
+
+    def __init__(self, chunk_size=(16, 16), load_radius=1, max_loaded_chunks=64, chunk_directory=None):
+        """
+        Args:
+            chunk_size (tuple): The (rows, cols) size of each chunk.
+            load_radius (int): How many chunks around a visitor are loaded.
+            max_loaded_chunks (int): How many chunks are kept in memory before evicting.
+            chunk_directory (str): Where evicted chunks are written, a temporary
+                directory is used if not given.
+        """
+        super().__init__()
+        self.chunk_size = chunk_size
+        self.load_radius = load_radius
+        self.max_loaded_chunks = max_loaded_chunks
+        self.chunk_directory = chunk_directory
+        self.chunks = OrderedDict()
+        self.evicted_chunks = set()
+        # Overview summaries, the majority biome of every generated chunk
+        # and the (threat, icon) of the biggest threat in each loaded chunk that has one
+        self.chunk_biomes = {}
+        self.chunk_threats = {}
+        self.octaves = 8
+        self.seed = 1
+
+    def build_perlin_map_clamped_to_integers(self, size=(5, 5), octaves=8, seed=1, workers=1, cache=None):
+        """
+        Set up perlin map generation.
+        Chunks are small, so they are always generated in this process,
+        and evicted chunks are already kept on disk, so the world cache is not used.
+        No chunks are built yet, the size only marks out the area where
+        players and enemies start.
+        """
+        self.map_size = size
+        self.octaves = octaves
+        self.seed = seed
+        self.chunks = OrderedDict()
+        self.evicted_chunks = set()
+        self.chunk_biomes = {}
+        self.chunk_threats = {}
+
+    def get_starting_area_biome_indexes(self):
+        """
+        Get the biome index grid of the starting area.
+        Generation is deterministic, so this matches the chunks without loading them.
+        """
+        return terrain.generate_biome_indexes(self.map_size, len(self.biomes), self.octaves, self.seed)
+
+    def get_chunk_key(self, coordinates):
+        """
+        Get the key of the chunk holding the coordinates.
+        """
+        return (coordinates[0] // self.chunk_size[0], coordinates[1] // self.chunk_size[1])
+
+    def get_chunk_path(self, chunk_key):
+        """
+        Get the file an evicted chunk is written to.
+        """
+        if self.chunk_directory is None:
+            self.chunk_directory = tempfile.mkdtemp(prefix='pycordmud_chunks_')
+        return os.path.join(self.chunk_directory, f'chunk_{chunk_key[0]}_{chunk_key[1]}.pickle')
+
+    def get_chunk(self, chunk_key):
+        """
+        Get a chunk by key, loading it if needed.
+        """
+        chunk = self.chunks.get(chunk_key)
+        if chunk is None:
+            return self.load_chunk(chunk_key)
+        self.chunks.move_to_end(chunk_key)
+        return chunk
+
+    def load_chunk(self, chunk_key):
+        """
+        Load a chunk from disk if it was evicted, otherwise generate it.
+        """
+        self.evict_cold_chunks(self.max_loaded_chunks - 1)
+        origin = (chunk_key[0] * self.chunk_size[0], chunk_key[1] * self.chunk_size[1])
+        chunk = Map()
+        chunk.biomes = self.biomes
+        if chunk_key in self.evicted_chunks:
+            chunk_path = self.get_chunk_path(chunk_key)
+            with open(chunk_path, 'rb') as chunk_file:
+                saved_chunk = pickle.load(chunk_file)
+            chunk.build_from_biome_indexes(saved_chunk['biome_indexes'], origin)
+            for coordinates, contents in saved_chunk['contents'].items():
+                location = chunk.get_location(coordinates)
+                for content in contents:
+                    location.add_content(content)
+            self.evicted_chunks.remove(chunk_key)
+            os.remove(chunk_path)
+        else:
+            biome_indexes = terrain.generate_biome_indexes(
+                self.chunk_size, len(self.biomes), self.octaves, self.seed, origin
+            )
+            chunk.build_from_biome_indexes(biome_indexes, origin)
+            biome_counts = np.bincount(biome_indexes.ravel(), minlength=len(self.biomes))
+            self.chunk_biomes[chunk_key] = int(biome_counts.argmax())
+        chunk.update_map_icons()
+        self.summarize_chunk_threat(chunk_key, chunk)
+        self.chunks[chunk_key] = chunk
+        return chunk
+
+    def summarize_chunk_threat(self, chunk_key, chunk):
+        """
+        Update the biggest threat in a chunk and the icon it shows, for the overview.
+        """
+        top_threat = 0
+        top_icon = None
+        for map_location in chunk.locations.values():
+            if map_location.has_contents():
+                threat = get_display_priority(map_location.top_content)
+                if threat > top_threat:
+                    top_threat = threat
+                    top_icon = map_location.map_icon
+        if top_threat > 0:
+            self.chunk_threats[chunk_key] = (top_threat, top_icon)
+        else:
+            self.chunk_threats.pop(chunk_key, None)
+
+    def is_chunk_pinned(self, chunk):
+        """
+        Check if a chunk holds characters, which keeps it loaded.
+        Locations keep the chunk's character count current, so this never scans them.
+        """
+        return chunk.character_count > 0
+
+    def evict_cold_chunks(self, max_loaded_chunks=None):
+        """
+        Write the least recently used chunks to disk until few enough are loaded.
+        Chunks holding characters are never evicted.
+        """
+        if max_loaded_chunks is None:
+            max_loaded_chunks = self.max_loaded_chunks
+        for chunk_key in list(self.chunks):
+            if len(self.chunks) <= max_loaded_chunks:
+                break
+            chunk = self.chunks[chunk_key]
+            if self.is_chunk_pinned(chunk):
+                continue
+            contents = {
+                location.coordinates: list(location.contents)
+                for location in chunk.locations.values()
+                if location.has_contents()
+            }
+            with open(self.get_chunk_path(chunk_key), 'wb') as chunk_file:
+                pickle.dump({'biome_indexes': chunk.biome_indexes, 'contents': contents}, chunk_file)
+            del self.chunks[chunk_key]
+            self.chunk_threats.pop(chunk_key, None)
+            self.evicted_chunks.add(chunk_key)
+
+    def is_in_bounds(self, coordinates):
+        """
+        Chunked maps have no edges.
+        """
+        return True
+
+    def get_bounds(self):
+        """
+        Chunked maps have no edges.
+        """
+        return None
+
+    def clamp_positions(self, positions):
+        """
+        Chunked maps have no edges, so positions are left as they are.
+        """
+        return positions
+
+    def get_location(self, coordinates):
+        """
+        Get the location at the coordinates, loading its chunk if needed.
+        """
+        return self.get_chunk(self.get_chunk_key(coordinates)).get_location(coordinates)
+
+    def find_location(self, coordinates):
+        """
+        Get the location at the coordinates only if its chunk is loaded and it already exists.
+        Chunks holding characters are never evicted, so this finds every character.
+        """
+        chunk = self.chunks.get(self.get_chunk_key(coordinates))
+        if chunk is None:
+            return None
+        return chunk.find_location(coordinates)
+
+    def get_icon(self, coordinates):
+        """
+        Get the map icon at the coordinates, loading its chunk if needed.
+        """
+        return self.get_chunk(self.get_chunk_key(coordinates)).get_icon(coordinates)
+
+    def get_random_location(self, rng):
+        """
+        Get a random location in the starting area.
+        Draws from rng, a RandomStream such as the game's spawns stream, so the pick stays seeded.
+        """
+        i = rng.randint(0, self.map_size[0] - 1)
+        j = rng.randint(0, self.map_size[1] - 1)
+        return self.get_location((i, j))
+
+    def load_around(self, coordinates):
+        """
+        Load the chunks within the load radius of the coordinates.
+        """
+        chunk_x, chunk_y = self.get_chunk_key(coordinates)
+        for i in range(chunk_x - self.load_radius, chunk_x + self.load_radius + 1):
+            for j in range(chunk_y - self.load_radius, chunk_y + self.load_radius + 1):
+                self.get_chunk((i, j))
+
+    def update_map_icons(self):
+        """
+        Update the map icons of the loaded chunks, and the threat summary of the ones that changed.
+        """
+        for chunk_key, chunk in self.chunks.items():
+            if chunk.dirty_cells:
+                chunk.update_map_icons()
+                self.summarize_chunk_threat(chunk_key, chunk)
+
+    def get_overview_string(self, max_size=16, center=None):
+        """
+        Get an overview of the generated area around the center that fits within max_size cells in both directions.
+        Each cell is one chunk, read from the chunk summaries, so the cost only depends on max_size,
+        not on how far apart the generated chunks are. Chunks with enemies show their biggest threat,
+        the rest show their majority biome, and chunks never generated are shown as out of bounds.
+
+        Args:
+            max_size (int): The most chunks the overview may have in either direction.
+            center (tuple): The coordinates to center the overview on, such as a player's position.
+                The most recently used chunk is used if not given.
+        """
+        if not self.chunks:
+            return ''
+        self.update_map_icons()
+        center_chunk = next(reversed(self.chunks)) if center is None else self.get_chunk_key(center)
+        first_chunk = (center_chunk[0] - max_size // 2, center_chunk[1] - max_size // 2)
+        last_chunk = (first_chunk[0] + max_size - 1, first_chunk[1] + max_size - 1)
+        window_keys = [
+            (i, j)
+            for i in range(first_chunk[0], last_chunk[0] + 1)
+            for j in range(first_chunk[1], last_chunk[1] + 1)
+            if (i, j) in self.chunk_biomes
+        ]
+        if not window_keys:
+            return ''
+        # Trim the window to the generated chunks inside it
+        rows = range(min(chunk_key[0] for chunk_key in window_keys), max(chunk_key[0] for chunk_key in window_keys) + 1)
+        cols = range(min(chunk_key[1] for chunk_key in window_keys), max(chunk_key[1] for chunk_key in window_keys) + 1)
+        biome_icons = [map_biome.icon for map_biome in self.biomes]
+        overview_str = ''
+        for i in rows:
+            icons = []
+            for j in cols:
+                chunk_threat = self.chunk_threats.get((i, j))
+                biome_index = self.chunk_biomes.get((i, j))
+                if chunk_threat is not None:
+                    icons.append(chunk_threat[1])
+                elif biome_index is not None:
+                    icons.append(biome_icons[biome_index])
+                else:
+                    icons.append(self.out_of_bounds)
+            overview_str += ' '.join(icons) + '\n'
+        return overview_str
+
+    def get_map_string(self):
+        """
+        Get the map string of the area covered by loaded chunks.
+        """
+        if not self.chunks:
+            return ''
+        chunk_rows = [chunk_key[0] for chunk_key in self.chunks]
+        chunk_cols = [chunk_key[1] for chunk_key in self.chunks]
+        map_str = ''
+        for i in range(min(chunk_rows) * self.chunk_size[0], (max(chunk_rows) + 1) * self.chunk_size[0]):
+            row = []
+            for j in range(min(chunk_cols) * self.chunk_size[1], (max(chunk_cols) + 1) * self.chunk_size[1]):
+                chunk = self.chunks.get(self.get_chunk_key((i, j)))
+                row.append(chunk.get_icon((i, j)) if chunk is not None else self.out_of_bounds)
             map_str += ' '.join(row) + '\n'
         return map_str
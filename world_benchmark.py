@@ -0,0 +1,69 @@
+"""
+This module benchmarks the memory used by maps.
+Run it directly to compare the biome grid against one Location per cell:
+    python world_benchmark.py
+"""
+import tracemalloc
+
+from location import Location
+import world
+
+def build_perlin_map(size):
+    """
+    Build a perlin map with its icons, the way the game does.
+    """
+    world_map = world.Map()
+    world_map.build_perlin_map_clamped_to_integers(size)
+    world_map.update_map_icons()
+    return world_map
+
+def build_dense_location_grid(size):
+    """
+    Build one Location per cell plus an icon grid, the way maps used to store terrain.
+    """
+    world_map = world.Map()
+    world_map.build_perlin_map_clamped_to_integers(size)
+    location_grid = []
+    for i, index_row in enumerate(world_map.biome_indexes.tolist()):
+        row = []
+        for j, biome_index in enumerate(index_row):
+            cell_biome = world_map.biomes[biome_index]
+            row.append(Location(cell_biome.name, cell_biome.description, (i, j), cell_biome))
+        location_grid.append(row)
+    icon_grid = [[location.map_icon for location in row] for row in location_grid]
+    return location_grid, icon_grid
+
+def measure_allocated_bytes(build, *args):
+    """
+    Measure the bytes still allocated by what build returns.
+    """
+    tracemalloc.start()
+    result = build(*args)
+    allocated_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return allocated_bytes
+
+def compare_map_memory(size):
+    """
+    Get the bytes used by a biome grid map and by a dense Location grid of the same size.
+    """
+    grid_bytes = measure_allocated_bytes(build_perlin_map, size)
+    dense_bytes = measure_allocated_bytes(build_dense_location_grid, size)
+    return grid_bytes, dense_bytes
+
+def main():
+    """
+    Print the memory used by each map layout.
+    """
+    for size in ((100, 100), (316, 316), (1000, 1000)):
+        grid_bytes, dense_bytes = compare_map_memory(size)
+        cells = size[0] * size[1]
+        print(
+            f'{size[0]}x{size[1]}: biome grid {grid_bytes / cells:.1f} B/cell, '
+            f'dense locations {dense_bytes / cells:.1f} B/cell, '
+            f'{dense_bytes / grid_bytes:.1f}x smaller'
+        )
+
+if __name__ == '__main__':
+    main()
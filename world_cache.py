@@ -0,0 +1,70 @@
+"""
+This module contains the world cache.
+Generated biome grids are written to disk once and memory-mapped on later starts.
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+import terrain
+
+class WorldCache():
+    """
+    This class stores generated biome grids keyed by how they were generated.
+    """
+
+    def __init__(self, directory):
+        """
+        Args:
+            directory (str): The directory cached worlds are written to.
+        """
+        self.directory = directory
+
+    def get_path(self, size, biome_count, octaves, seed):
+        """
+        Get the file a biome grid with these generation settings is cached in.
+        """
+        return os.path.join(
+            self.directory,
+            f'world_{size[0]}x{size[1]}_b{biome_count}_o{octaves}_s{seed}_v{terrain.GENERATOR_VERSION}.npy'
+        )
+
+    def load(self, size, biome_count, octaves, seed):
+        """
+        Memory-map a cached biome grid, or return None if it has not been cached.
+        A file that is not a uint8 grid of the requested size is treated as not cached,
+        so it gets regenerated and overwritten.
+        """
+        path = self.get_path(size, biome_count, octaves, seed)
+        if not os.path.exists(path):
+            return None
+        try:
+            biome_indexes = np.load(path, mmap_mode='r')
+        except ValueError:
+            return None
+        if biome_indexes.shape != tuple(size) or biome_indexes.dtype != np.uint8:
+            return None
+        return biome_indexes
+
+    def store(self, size, biome_count, octaves, seed, biome_indexes):
+        """
+        Write a biome grid to the cache.
+        The file is written under a temporary name first so readers never see half a world.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix='.npy')
+        with os.fdopen(file_descriptor, 'wb') as cache_file:
+            np.save(cache_file, biome_indexes)
+        os.replace(temporary_path, self.get_path(size, biome_count, octaves, seed))
+
+    def get_biome_indexes(self, size, biome_count, octaves=8, seed=1, workers=1):
+        """
+        Get a biome grid from the cache, generating and caching it if needed.
+        """
+        biome_indexes = self.load(size, biome_count, octaves, seed)
+        if biome_indexes is None:
+            biome_indexes = terrain.generate_biome_indexes(size, biome_count, octaves, seed, workers=workers)
+            self.store(size, biome_count, octaves, seed, biome_indexes)
+        return biome_indexes
@@ -0,0 +1,97 @@
+"""
+This module contains the world cache testing logic.
+"""
+import numpy as np
+
+import terrain
+import world
+import world_cache
+
+def test_world_cache_stores_then_memory_maps(tmp_path):
+    """
+    Test if a cached world is memory-mapped on the second request.
+    """
+    # Arrange
+    cache = world_cache.WorldCache(str(tmp_path))
+    generated = cache.get_biome_indexes((12, 9), 5, seed=3)
+
+    # Act
+    cached = cache.get_biome_indexes((12, 9), 5, seed=3)
+
+    # Assert
+    assert isinstance(cached, np.memmap)
+    assert np.array_equal(cached, generated)
+
+def test_world_cache_keys_on_generation_settings(tmp_path):
+    """
+    Test if worlds with different settings are cached separately.
+    """
+    # Arrange
+    cache = world_cache.WorldCache(str(tmp_path))
+    cache.get_biome_indexes((8, 8), 5, seed=1)
+
+    # Act
+    missing_seed = cache.load((8, 8), 5, 8, 2)
+    missing_size = cache.load((8, 9), 5, 8, 1)
+    missing_octaves = cache.load((8, 8), 5, 4, 1)
+
+    # Assert
+    assert missing_seed is None
+    assert missing_size is None
+    assert missing_octaves is None
+
+def test_world_cache_map_skips_generation_when_cached(tmp_path, monkeypatch):
+    """
+    Test if building a cached map does not regenerate the terrain.
+    """
+    # Arrange
+    cache = world_cache.WorldCache(str(tmp_path))
+    first_map = world.Map()
+    first_map.build_perlin_map_clamped_to_integers((10, 10), cache=cache)
+    def fail_generation(*args, **kwargs):
+        raise AssertionError('terrain was regenerated')
+    monkeypatch.setattr(terrain, 'generate_biome_indexes', fail_generation)
+    second_map = world.Map()
+
+    # Act
+    second_map.build_perlin_map_clamped_to_integers((10, 10), cache=cache)
+
+    # Assert
+    assert np.array_equal(second_map.biome_indexes, first_map.biome_indexes)
+
+def test_world_cache_map_keeps_memory_map_on_start(tmp_path):
+    """
+    Test if a map started from the cache looks up icons from the memory-mapped grid without copying it.
+    """
+    # Arrange
+    cache = world_cache.WorldCache(str(tmp_path))
+    cache.get_biome_indexes((10, 10), 5)
+    test_map = world.Map()
+    test_map.biomes = test_map.biomes[:5]
+
+    # Act
+    test_map.build_perlin_map_clamped_to_integers((10, 10), cache=cache)
+    icon = test_map.map_icons[4][7]
+
+    # Assert
+    assert isinstance(test_map.biome_indexes, np.memmap)
+    assert len(test_map.content_icons) == 0
+    assert icon == test_map.biomes[test_map.biome_indexes[4, 7]].icon
+
+def test_world_cache_regenerates_mismatched_grid(tmp_path):
+    """
+    Test if a cached file that does not match the requested size or dtype is regenerated.
+    """
+    # Arrange
+    cache = world_cache.WorldCache(str(tmp_path))
+    cache.store((8, 8), 5, 8, 1, np.zeros((3, 4), dtype=np.int64))
+
+    # Act
+    stale = cache.load((8, 8), 5, 8, 1)
+    biome_indexes = cache.get_biome_indexes((8, 8), 5)
+    reloaded = cache.load((8, 8), 5, 8, 1)
+
+    # Assert
+    assert stale is None
+    assert biome_indexes.shape == (8, 8)
+    assert np.array_equal(reloaded, terrain.generate_biome_indexes((8, 8), 5))
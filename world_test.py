@@ -1,8 +1,14 @@
 """
 This module contains the world testing logic.
 """
+import tracemalloc
+
+import numpy as np
+
 import world
+import world_benchmark
 import gear
+import game
 
 def test_map_init_has_locations():
     """
@@ -248,3 +254,259 @@ def test_map_getbiomewithvalidindex_returnsbiome():
 
     # Assert
     assert biome is not None
+
+def test_map_build_perlin_same_seed_same_layout():
+    """
+    Test if building a perlin map twice with the same seed gives the same biomes.
+    """
+    # Arrange
+    first_map = world.Map()
+    second_map = world.Map()
+
+    # Act
+    first_map.build_perlin_map_clamped_to_integers((8, 8), seed=5)
+    second_map.build_perlin_map_clamped_to_integers((8, 8), seed=5)
+
+    # Assert
+    assert [[location.biome.name for location in row] for row in first_map.map_location_data] == \
+        [[location.biome.name for location in row] for row in second_map.map_location_data]
+
+def test_chunked_map_matches_dense_map_biomes():
+    """
+    Test if a chunked map generates the same biomes as a dense map with the same seed.
+    """
+    # Arrange
+    dense_map = world.Map()
+    dense_map.build_perlin_map_clamped_to_integers((12, 12))
+    chunked_map = world.ChunkedMap(chunk_size=(5, 5))
+    chunked_map.build_perlin_map_clamped_to_integers((12, 12))
+
+    # Act
+    chunked_biomes = [[chunked_map.get_location((i, j)).biome.name for j in range(12)] for i in range(12)]
+
+    # Assert
+    assert chunked_biomes == [[location.biome.name for location in row] for row in dense_map.map_location_data]
+
+def test_chunked_map_loads_chunks_lazily():
+    """
+    Test if a chunked map only generates the chunks that are visited.
+    """
+    # Arrange
+    chunked_map = world.ChunkedMap(chunk_size=(4, 4), load_radius=1)
+    chunked_map.build_perlin_map_clamped_to_integers((100, 100))
+
+    # Act
+    chunked_map.load_around((50, 50))
+
+    # Assert
+    assert len(chunked_map.chunks) == 9
+    assert (12, 12) in chunked_map.chunks
+
+def test_chunked_map_has_no_edges():
+    """
+    Test if a chunked map has locations beyond its starting area, including negative coordinates.
+    """
+    # Arrange
+    chunked_map = world.ChunkedMap(chunk_size=(4, 4))
+    chunked_map.build_perlin_map_clamped_to_integers((5, 5))
+
+    # Act
+    far_location = chunked_map.get_location((-30, 1000))
+
+    # Assert
+    assert chunked_map.is_in_bounds((-30, 1000)) is True
+    assert far_location.coordinates == (-30, 1000)
+
+def test_chunked_map_evicted_chunk_keeps_items(tmp_path):
+    """
+    Test if items in an evicted chunk come back when the chunk is reloaded.
+    """
+    # Arrange
+    chunked_map = world.ChunkedMap(chunk_size=(4, 4), max_loaded_chunks=2, chunk_directory=str(tmp_path))
+    chunked_map.build_perlin_map_clamped_to_integers((5, 5))
+    test_gear = gear.Gear('Test Gear', 'A test piece of gear')
+    chunked_map.get_location((1, 1)).add_content(test_gear)
+
+    # Act
+    chunked_map.get_location((10, 10))
+    chunked_map.get_location((20, 20))
+    evicted = (0, 0) not in chunked_map.chunks
+    reloaded_location = chunked_map.get_location((1, 1))
+
+    # Assert
+    assert evicted is True
+    assert reloaded_location.contents[0].name == test_gear.name
+
+def test_chunked_map_keeps_chunks_with_characters_loaded(tmp_path):
+    """
+    Test if a chunk stays loaded while it holds a character and can be evicted once it leaves.
+    """
+    # Arrange
+    chunked_map = world.ChunkedMap(chunk_size=(4, 4), max_loaded_chunks=1, chunk_directory=str(tmp_path))
+    chunked_map.build_perlin_map_clamped_to_integers((5, 5))
+    test_player = game.PlayerCharacter('Tester', game.MudGame('Test Game'))
+    chunked_map.get_location((1, 1)).add_content(test_player)
+
+    # Act
+    chunked_map.get_location((10, 10))
+    kept_while_pinned = (0, 0) in chunked_map.chunks
+    chunked_map.get_location((1, 1)).remove_content(test_player)
+    chunked_map.get_location((20, 20))
+
+    # Assert
+    assert kept_while_pinned is True
+    assert (0, 0) not in chunked_map.chunks
+    assert chunked_map.chunks[(5, 5)].character_count == 0
+
+def test_map_perlin_map_stores_biome_grid():
+    """
+    Test if a perlin map stores terrain as a uint8 grid with shared biomes.
+    """
+    # Arrange
+    test_map = world.Map()
+
+    # Act
+    test_map.build_perlin_map_clamped_to_integers((6, 7))
+
+    # Assert
+    assert test_map.biome_indexes.dtype.name == 'uint8'
+    assert test_map.biome_indexes.shape == (6, 7)
+    assert test_map.get_biome_at((2, 3)) is test_map.biomes[test_map.biome_indexes[2, 3]]
+    assert len(test_map.locations) == 0
+
+def test_map_empty_location_dropped_on_icon_update():
+    """
+    Test if locations are only kept for cells that hold contents.
+    """
+    # Arrange
+    test_map = world.Map()
+    test_map.build_perlin_map_clamped_to_integers((6, 6))
+    test_gear = gear.Gear('Test Gear', 'A test piece of gear')
+    test_map.get_location((1, 1)).add_content(test_gear)
+    test_map.get_location((2, 2))
+
+    # Act
+    test_map.update_map_icons()
+
+    # Assert
+    assert list(test_map.locations) == [(1, 1)]
+    assert test_map.get_location((1, 1)).contents == [test_gear]
+
+def test_map_biome_grid_uses_order_of_magnitude_less_memory():
+    """
+    Test if the biome grid uses at least ten times less memory than one Location per cell.
+    """
+    # Act
+    grid_bytes, dense_bytes = world_benchmark.compare_map_memory((100, 100))
+
+    # Assert
+    assert dense_bytes >= 10 * grid_bytes
+
+def test_map_update_icons_only_touches_dirty_cells():
+    """
+    Test if updating icons refreshes only the cells whose contents changed.
+    """
+    # Arrange
+    test_map = world.Map()
+    test_map.build_perlin_map_clamped_to_integers((6, 6))
+    test_gear = gear.Gear('Test Gear', 'A test piece of gear')
+    test_gear.icon = '🧪'
+    test_map.map_icons[3][3] = 'untouched'
+    test_map.get_location((0, 0)).add_content(test_gear)
+
+    # Act
+    dirty_before = set(test_map.dirty_cells)
+    test_map.update_map_icons()
+
+    # Assert
+    assert dirty_before == {(0, 0)}
+    assert len(test_map.dirty_cells) == 0
+    assert test_map.map_icons[0][0] == '🧪'
+    assert test_map.map_icons[3][3] == 'untouched'
+
+def test_map_overview_string_fits_max_size():
+    """
+    Test if the world overview fits within its size bound.
+    """
+    # Arrange
+    test_map = world.Map()
+    test_map.build_perlin_map_clamped_to_integers((100, 60))
+
+    # Act
+    overview_rows = test_map.get_overview_string(max_size=16).splitlines()
+
+    # Assert
+    assert 0 < len(overview_rows) <= 16
+    assert all(len(row.split(' ')) <= 16 for row in overview_rows)
+
+def test_chunked_map_overview_string_fits_max_size():
+    """
+    Test if the overview of a chunked map stays within its size bound however many chunks are loaded.
+    """
+    # Arrange
+    chunked_map = world.ChunkedMap(chunk_size=(8, 8), load_radius=2)
+    chunked_map.build_perlin_map_clamped_to_integers((8, 8))
+    chunked_map.load_around((0, 0))
+    chunked_map.load_around((40, 40))
+
+    # Act
+    overview_rows = chunked_map.get_overview_string(max_size=16).splitlines()
+
+    # Assert
+    assert len(chunked_map.chunks) > 16
+    assert 0 < len(overview_rows) <= 16
+    assert all(len(row.split(' ')) <= 16 for row in overview_rows)
+
+def test_map_clamp_positions_keeps_positions_on_map():
+    """
+    Test if clamping pulls positions off the edges back onto the map.
+    """
+    # Arrange
+    test_map = world.Map()
+    test_map.build_perlin_map_clamped_to_integers((4, 5))
+    positions = np.array([[-1, 2], [4, 5], [2, 3]])
+
+    # Act
+    clamped = test_map.clamp_positions(positions)
+
+    # Assert
+    assert clamped.tolist() == [[0, 2], [3, 4], [2, 3]]
+
+def test_chunked_map_overview_cost_bounded_by_distant_chunks():
+    """
+    Test if the overview of two chunk groups far apart stays small in size and memory.
+    """
+    # Arrange
+    chunked_map = world.ChunkedMap(chunk_size=(16, 16), load_radius=1)
+    chunked_map.build_perlin_map_clamped_to_integers((16, 16))
+    chunked_map.load_around((0, 0))
+    chunked_map.load_around((3000, 3000))
+
+    # Act
+    tracemalloc.start()
+    overview_rows = chunked_map.get_overview_string(max_size=16, center=(3000, 3000)).splitlines()
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Assert
+    assert len(chunked_map.chunks) == 18
+    assert len(overview_rows) == 3
+    assert all(len(row.split(' ')) == 3 for row in overview_rows)
+    assert peak_bytes < 100_000
+
+def test_chunked_map_overview_shows_biggest_threat_per_chunk():
+    """
+    Test if a chunk in the overview shows the icon of its biggest threat once an enemy arrives.
+    """
+    # Arrange
+    test_game = game.MudGame("Test Game", size=(8, 8), chunk_size=(4, 4))
+    test_game.map.load_around((0, 0))
+    location = test_game.map.get_location((1, 1))
+
+    # Act
+    test_game.enemy_mgr.create_boss_dragon(location)
+    overview = test_game.get_overview(center=(0, 0))
+
+    # Assert
+    assert '🐉' in overview
+    assert test_game.map.chunk_threats[(0, 0)][1] == '🐉'